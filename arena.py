@@ -0,0 +1,241 @@
+"""
+arena.py – Defines the ArenaEngine class for SNAKE.EXE.
+
+The rules of a multiplayer game: any number of snakes share one board, each
+steered by its own player. All snakes move at once every tick. A snake dies
+when its head runs into a wall, into any body (its own or another's) or into
+another head, and comes back after RESPAWN_TICKS. Food is kept topped up in
+proportion to the number of players.
+
+Like GameEngine the engine is headless and deterministic for a seed. Instead
+of events, each tick returns the deltas that happened in it, as tuples whose
+first item is one of the delta kinds below:
+    (HEAD, player, cell)          the head moved into cell
+    (TAIL, player)                the last body cell was freed
+    (SPAWN, player, color, cells) the snake (re)appeared, head first, with score 0
+    (DIE, player)                 the snake died; its cells are freed
+    (LEAVE, player)               the player left the game
+    (SCORE, player, score)
+    (FOOD_ADDED, cell)
+    (FOOD_EATEN, cell)
+A view that applies the deltas in order stays identical to the engine; this is
+what the multiplayer server (see arena_server.py) broadcasts every tick.
+"""
+
+import colorsys
+import random
+from collections import deque
+
+from engine import OPPOSITES, DIFFICULTY_SPEEDS, MOVE_DISTANCE, GRID_CELLS
+from grid import Grid, FreeCells, WALL, DIRECTIONS
+from themes import THEMES
+
+# === Delta Kinds ===
+HEAD = 1
+TAIL = 2
+SPAWN = 3
+DIE = 4
+LEAVE = 5
+SCORE = 6
+FOOD_ADDED = 7
+FOOD_EATEN = 8
+
+# === Constants ===
+ARENA_SPEED = DIFFICULTY_SPEEDS["medium"]  # seconds per tick
+START_LENGTH = 3
+RESPAWN_TICKS = 20
+SPAWN_ATTEMPTS = 20
+SPAWN_CLEARANCE = 3  # empty cells required ahead of a new snake's head
+MIN_FOOD = 3
+FOOD_PER_PLAYERS = 2  # one extra food item for every this many players
+
+# Every distinct snake, food and text colour of the themes, handed out to the first players
+THEME_COLORS = list(dict.fromkeys(
+    color for theme in THEMES.values() for key, color in theme.items() if key != "bg"
+))
+GOLDEN_RATIO = 0.618033988749895  # hue step between generated colours, so no two ever coincide
+
+
+def player_color(index):
+    """
+    The colour with the given index: the theme colours first, then "#rrggbb" colours
+    a golden-ratio step apart on the colour wheel, alternating between two shades.
+    """
+    if index < len(THEME_COLORS):
+        return THEME_COLORS[index]
+    index -= len(THEME_COLORS)
+    red, green, blue = colorsys.hsv_to_rgb((index * GOLDEN_RATIO) % 1.0, 0.75, 0.95 if index % 2 else 0.7)
+    return f"#{round(red * 255):02x}{round(green * 255):02x}{round(blue * 255):02x}"
+
+
+# === Player Class ===
+class Player:
+    def __init__(self, player_id, color):
+        """A player waiting to (re)spawn; `color` is the index of its player_color()."""
+        self.id = player_id
+        self.color = color
+        self.body = deque()  # head first
+        self.heading = None
+        self.next_heading = None
+        self.grow_pending = 0
+        self.score = 0
+        self.alive = False
+        self.respawn_tick = 0
+
+
+# === ArenaEngine Class ===
+class ArenaEngine:
+    def __init__(self, board_size=GRID_CELLS, seed=None, respawn_ticks=RESPAWN_TICKS):
+        """An empty board; players join() and leave() between ticks."""
+        self.seed = random.getrandbits(32) if seed is None else seed
+        self.rng = random.Random(self.seed)
+        self.grid = Grid(board_size, board_size, MOVE_DISTANCE)
+        self.occupied = bytearray(self.grid.size)
+        self.free_cells = FreeCells(self.grid.size)  # neither body nor food
+        self.respawn_ticks = respawn_ticks
+        self.players = {}
+        self.food = set()
+        self.tick = 0
+        self.pending = []  # deltas from join() and leave(), sent with the next tick
+
+    # === Players ===
+    def join(self, player_id):
+        """Adds a player, who spawns on the next tick there is room, in a colour no one else has."""
+        taken = {player.color for player in self.players.values()}
+        player = Player(player_id, next(color for color in range(len(taken) + 1) if color not in taken))
+        player.respawn_tick = self.tick + 1
+        self.players[player_id] = player
+        return player
+
+    def leave(self, player_id):
+        player = self.players.pop(player_id, None)
+        if player is None:
+            return
+        self.clear_body(player)
+        self.pending.append((LEAVE, player_id))
+
+    def steer(self, player_id, heading):
+        """Sets the heading a player takes on the next tick, ignoring direct reversals."""
+        player = self.players.get(player_id)
+        if player is not None and player.alive and heading != OPPOSITES[player.heading]:
+            player.next_heading = heading
+
+    def clear_body(self, player):
+        for cell in player.body:
+            self.occupied[cell] = 0
+            self.free_cells.add(cell)
+        player.body.clear()
+        player.alive = False
+
+    def spawn(self, player, deltas):
+        """
+        Places a START_LENGTH snake on a random empty stretch of the board, with
+        room ahead of it. Returns False if no room was found this time.
+        """
+        neighbors = self.grid.neighbors
+        for _ in range(SPAWN_ATTEMPTS):
+            head = self.free_cells.sample(self.rng)
+            if head is None:
+                return False
+            heading = self.rng.choice(DIRECTIONS)
+            cells = [head]
+            behind = OPPOSITES[heading]
+            while len(cells) < START_LENGTH:
+                cells.append(neighbors[behind][cells[-1]])
+            ahead = [head]
+            for _ in range(SPAWN_CLEARANCE):
+                ahead.append(neighbors[heading][ahead[-1]])
+            if any(cell == WALL or cell not in self.free_cells for cell in cells + ahead):
+                continue
+            player.body.extend(cells)
+            for cell in cells:
+                self.occupied[cell] = 1
+                self.free_cells.remove(cell)
+            player.heading = heading
+            player.next_heading = None
+            player.grow_pending = 0
+            player.score = 0
+            player.alive = True
+            deltas.append((SPAWN, player.id, player.color, tuple(cells)))
+            return True
+        return False
+
+    # === Tick ===
+    def step(self):
+        """Advances every snake by one cell and returns the tick's deltas."""
+        deltas, self.pending = self.pending, []
+        self.tick += 1
+        neighbors = self.grid.neighbors
+        occupied = self.occupied
+        moving = [player for player in self.players.values() if player.alive]
+
+        targets = {}
+        claims = {}
+        for player in moving:
+            if player.next_heading is not None:
+                player.heading, player.next_heading = player.next_heading, None
+            cell = neighbors[player.heading][player.body[0]]
+            targets[player.id] = cell
+            claims[cell] = claims.get(cell, 0) + 1
+
+        # Tails move out of the way first, so a head may follow a tail, its own or another's
+        for player in moving:
+            if player.grow_pending:
+                player.grow_pending -= 1
+            else:
+                tail = player.body.pop()
+                occupied[tail] = 0
+                self.free_cells.add(tail)
+                deltas.append((TAIL, player.id))
+
+        dead = [
+            player for player in moving
+            if targets[player.id] == WALL or occupied[targets[player.id]] or claims[targets[player.id]] > 1
+        ]
+        for player in dead:
+            self.clear_body(player)
+            player.respawn_tick = self.tick + self.respawn_ticks
+            deltas.append((DIE, player.id))
+
+        for player in moving:
+            if not player.alive:
+                continue
+            cell = targets[player.id]
+            occupied[cell] = 1
+            self.free_cells.remove(cell)
+            player.body.appendleft(cell)
+            deltas.append((HEAD, player.id, cell))
+            if cell in self.food:
+                self.food.remove(cell)
+                player.grow_pending += 1
+                player.score += 1
+                deltas.append((FOOD_EATEN, cell))
+                deltas.append((SCORE, player.id, player.score))
+
+        for player in self.players.values():
+            if not player.alive and player.respawn_tick <= self.tick:
+                self.spawn(player, deltas)
+
+        wanted = MIN_FOOD + len(self.players) // FOOD_PER_PLAYERS
+        while len(self.food) < wanted:
+            cell = self.free_cells.sample(self.rng)
+            if cell is None:
+                break
+            self.free_cells.remove(cell)
+            self.food.add(cell)
+            deltas.append((FOOD_ADDED, cell))
+        return deltas
+
+    def join_deltas(self):
+        """
+        The deltas that build the current board from an empty one, to bring a
+        newly connected view up to date without a separate snapshot format.
+        """
+        deltas = []
+        for player in self.players.values():
+            if player.alive:
+                deltas.append((SPAWN, player.id, player.color, tuple(player.body)))
+                if player.score:
+                    deltas.append((SCORE, player.id, player.score))
+        deltas.extend((FOOD_ADDED, cell) for cell in self.food)
+        return deltas
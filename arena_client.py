@@ -0,0 +1,166 @@
+"""
+arena_client.py – Plays SNAKE.EXE multiplayer on an arena server.
+
+The network side runs on a background thread with its own asyncio loop and
+hands decoded messages to Tk through a queue, which is drained once per frame.
+The board is drawn straight from the deltas (see protocol.py) through the
+renderer (see render.py): a head delta adds one sprite and a tail delta
+releases one, so a frame only touches the cells that changed. Each player's
+snake has the colour the server gave it, which no other player has.
+
+Usage:
+    python arena_server.py &
+    python arena_client.py --host 127.0.0.1 --port 7777
+"""
+
+import argparse
+import asyncio
+import queue
+import threading
+from turtle import Screen
+
+from arena import player_color, HEAD, TAIL, SPAWN, DIE, LEAVE, FOOD_ADDED, FOOD_EATEN
+from arena_server import HOST, PORT
+from engine import MOVE_DISTANCE
+from grid import UP, DOWN, LEFT, RIGHT
+from protocol import ArenaState, WELCOME, TICK, read_message, encode_steer
+from render import create_renderer
+from scoreboard import HudText
+from themes import THEMES
+
+# === Constants ===
+SCREEN_SIZE = 600
+FRAME_INTERVAL_MS = 16
+THEME = "arcade"
+FOOD_COLOR = "gold"
+HUD_FONT = ("Courier", 16, "bold")
+
+
+# === Connection Class ===
+class Connection:
+    def __init__(self, host, port):
+        """Connects to the server on a background thread; messages arrive in `inbox`, then None at the end."""
+        self.inbox = queue.Queue()
+        self.loop = asyncio.new_event_loop()
+        self.writer = None
+        threading.Thread(
+            target=self.loop.run_until_complete, args=(self.receive(host, port),),
+            daemon=True, name="snake-arena"
+        ).start()
+
+    async def receive(self, host, port):
+        try:
+            reader, self.writer = await asyncio.open_connection(host, port)
+            while True:
+                self.inbox.put(await read_message(reader))
+        except (OSError, asyncio.IncompleteReadError, ValueError):
+            self.inbox.put(None)
+
+    def steer(self, heading):
+        """Sends a turn to the server from the Tk thread; it applies on the next tick."""
+        if self.writer is not None:
+            self.loop.call_soon_threadsafe(self.writer.write, encode_steer(heading))
+
+
+# === ArenaView Class ===
+class ArenaView:
+    def __init__(self, renderer, board_size, player):
+        """Draws an arena mirror, scaled down if the board doesn't fit on the screen."""
+        self.renderer = renderer
+        self.player = player
+        self.state = ArenaState(board_size)
+        self.scale = min(1.0, (SCREEN_SIZE - 2 * MOVE_DISTANCE) / (board_size * MOVE_DISTANCE))
+        self.body_sprites = {}  # cell -> sprite
+        self.food_sprites = {}
+
+    def position(self, cell):
+        x, y = self.state.grid.position(cell)
+        return x * self.scale, y * self.scale
+
+    def add_segment(self, player, cell):
+        color = player_color(self.state.colors[player])
+        self.body_sprites[cell] = self.renderer.sprite("square", color, self.position(cell), self.scale)
+
+    def apply_tick(self, tick, deltas):
+        """Draws the changes of one tick, then applies them to the mirror."""
+        state = self.state
+        for delta in deltas:
+            kind = delta[0]
+            if kind == TAIL:
+                self.renderer.release(self.body_sprites.pop(state.snakes[delta[1]][-1]))
+            elif kind in (DIE, LEAVE):
+                for cell in state.snakes.get(delta[1], ()):
+                    self.renderer.release(self.body_sprites.pop(cell))
+            elif kind == FOOD_ADDED:
+                self.food_sprites[delta[1]] = self.renderer.sprite(
+                    "triangle", FOOD_COLOR, self.position(delta[1]), 0.8 * self.scale
+                )
+            elif kind == FOOD_EATEN:
+                self.renderer.release(self.food_sprites.pop(delta[1]))
+            state.apply(delta)
+            if kind == HEAD:
+                self.add_segment(delta[1], delta[2])
+            elif kind == SPAWN:
+                for cell in delta[3]:
+                    self.add_segment(delta[1], cell)
+        state.tick = tick
+
+    def status(self):
+        score = self.state.scores.get(self.player, 0)
+        state = "" if self.player in self.state.snakes else "   (respawning)"
+        return f"PLAYER {self.player}   SCORE: {score}   PLAYERS: {len(self.state.scores)}{state}"
+
+
+# === ArenaClient Class ===
+class ArenaClient:
+    def __init__(self, host, port):
+        """Opens the window, binds the arrow keys and starts receiving from the server."""
+        self.screen = Screen()
+        self.screen.setup(width=SCREEN_SIZE, height=SCREEN_SIZE)
+        self.screen.title("SNAKE.EXE – Arena")
+        self.screen.tracer(0)
+        self.renderer = create_renderer(self.screen)
+        self.renderer.background(THEMES[THEME]["bg"])
+        self.hud = HudText(self.renderer, (0, SCREEN_SIZE // 2 - 30), THEMES[THEME]["text_color"], HUD_FONT)
+        self.hud.show("CONNECTING...")
+        self.view = None
+        self.connection = Connection(host, port)
+        for key, heading in (("Up", UP), ("Down", DOWN), ("Left", LEFT), ("Right", RIGHT)):
+            self.screen.onkey(lambda heading=heading: self.connection.steer(heading), key)
+        self.screen.listen()
+
+    def frame(self):
+        """Applies every message that arrived since the last frame and draws the result."""
+        while True:
+            try:
+                message = self.connection.inbox.get_nowait()
+            except queue.Empty:
+                break
+            if message is None:
+                self.hud.show("DISCONNECTED")
+                self.renderer.present()
+                return
+            if message[0] == WELCOME:
+                _, player, board_size, _ = message
+                self.view = ArenaView(self.renderer, board_size, player)
+            elif message[0] == TICK:
+                self.view.apply_tick(message[1], message[2])
+        if self.view is not None:
+            self.hud.show(self.view.status())
+        self.renderer.present()
+        self.screen.ontimer(self.frame, FRAME_INTERVAL_MS)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Join a multiplayer SNAKE.EXE arena.")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    args = parser.parse_args()
+
+    client = ArenaClient(args.host, args.port)
+    client.frame()
+    client.screen.mainloop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""
+arena_loadgen.py – Load generator for the SNAKE.EXE multiplayer server.
+
+Connects dozens of bot clients to an arena server and reports how steadily
+their ticks arrive. Every bot runs in this process on one asyncio loop, keeps
+its own ArenaState mirror of the board from the deltas (see protocol.py) and
+steers towards the nearest food, so the server sees realistic traffic.
+Unless --port is given, a server is started in a subprocess on a free
+loopback port for the length of the run, so nothing outside this machine is
+needed. The server's own status lines are passed through on stderr.
+
+The report (JSON on stdout) has the tick arrival interval p50/p99/max against
+the server's tick length, ticks missed by any client, bytes received per
+client per tick, and how many bots were disconnected.
+
+Usage:
+    python arena_loadgen.py --clients 50 --seconds 20
+    python arena_loadgen.py --clients 30 --host 192.168.1.20 --port 7777
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+from arena_server import HOST
+from grid import WALL, DIRECTIONS
+from engine import OPPOSITES
+from protocol import ArenaState, LENGTH, WELCOME, TICK, decode, encode_steer
+
+# === Constants ===
+CLIENTS = 50
+SECONDS = 10.0
+WANDER_CHANCE = 0.1  # chance per tick that a bot takes a random safe turn
+SERVER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "arena_server.py")
+
+
+# === Bot Class ===
+class Bot:
+    def __init__(self, seed):
+        self.rng = random.Random(seed)
+        self.player = None
+        self.state = None
+        self.speed = None
+        self.intervals = []  # seconds between consecutive TICK messages
+        self.missed = 0
+        self.ticks = 0
+        self.bytes = 0
+        self.dropped = False
+
+    async def run(self, host, port):
+        """Plays until cancelled; a server-side disconnect marks the bot as dropped."""
+        reader, writer = await asyncio.open_connection(host, port)
+        last_arrival = None
+        last_tick = None
+        try:
+            while True:
+                header = await reader.readexactly(LENGTH.size)
+                payload = await reader.readexactly(LENGTH.unpack(header)[0])
+                arrival = time.perf_counter()
+                message = decode(payload)
+                if message[0] == WELCOME:
+                    _, self.player, board_size, self.speed = message
+                    self.state = ArenaState(board_size)
+                    continue
+                if message[0] != TICK:
+                    continue
+                _, tick, deltas = message
+                self.state.apply_tick(tick, deltas)
+                if last_tick is not None:  # The first TICK is the join catch-up, not a real tick
+                    self.intervals.append(arrival - last_arrival)
+                    self.missed += tick - last_tick - 1
+                    self.ticks += 1
+                    self.bytes += len(header) + len(payload)
+                last_arrival, last_tick = arrival, tick
+                heading = self.choose()
+                if heading is not None:
+                    writer.write(encode_steer(heading))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            self.dropped = True
+        finally:
+            writer.close()
+
+    def choose(self):
+        """A turn towards the nearest food that doesn't run into anything, or None to go straight."""
+        body = self.state.snakes.get(self.player)
+        if not body:
+            return None
+        neighbors = self.state.grid.neighbors
+        heading = next(d for d in DIRECTIONS if neighbors[d][body[1]] == body[0])
+        safe = [
+            d for d in DIRECTIONS
+            if d != OPPOSITES[heading]
+            and neighbors[d][body[0]] != WALL
+            and not self.state.occupied[neighbors[d][body[0]]]
+        ]
+        if not safe:
+            return None
+        if self.rng.random() < WANDER_CHANCE or not self.state.food:
+            choice = self.rng.choice(safe)
+        else:
+            cols = self.state.grid.cols
+            head_col, head_row = body[0] % cols, body[0] // cols
+            food = min(self.state.food, key=lambda cell: abs(cell % cols - head_col) + abs(cell // cols - head_row))
+            food_col, food_row = food % cols, food // cols
+            choice = min(safe, key=lambda d: (
+                abs(neighbors[d][body[0]] % cols - food_col) + abs(neighbors[d][body[0]] // cols - food_row)
+            ))
+        return choice if choice != heading else None
+
+
+# === Server Subprocess ===
+async def start_server(board_size, speed):
+    """Starts arena_server.py on a free loopback port; returns the process and its port."""
+    command = [sys.executable, SERVER_SCRIPT, "--host", HOST, "--port", "0"]
+    if board_size:
+        command += ["--board-size", str(board_size)]
+    if speed:
+        command += ["--speed", str(speed)]
+    process = await asyncio.create_subprocess_exec(*command, stderr=asyncio.subprocess.PIPE)
+    line = (await process.stderr.readline()).decode()
+    if not line.startswith("listening on"):
+        raise RuntimeError(f"arena server failed to start: {line.strip()}")
+    return process, int(line.rsplit(":", 1)[1])
+
+
+async def forward_lines(stream):
+    """Copies the server's status lines to our stderr."""
+    async for line in stream:
+        sys.stderr.write(line.decode())
+
+
+# === Measurement ===
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def report(bots, seconds):
+    intervals = [interval for bot in bots for interval in bot.intervals]
+    ticks = sum(bot.ticks for bot in bots)
+    speed = next((bot.speed for bot in bots if bot.speed), None)
+    return {
+        "clients": len(bots),
+        "seconds": seconds,
+        "tick_ms": round(speed * 1000, 3) if speed else None,
+        "interval_p50_ms": round(percentile(intervals, 0.50) * 1000, 3) if intervals else None,
+        "interval_p99_ms": round(percentile(intervals, 0.99) * 1000, 3) if intervals else None,
+        "interval_max_ms": round(max(intervals) * 1000, 3) if intervals else None,
+        "missed_ticks": sum(bot.missed for bot in bots),
+        "bytes_per_client_tick": round(sum(bot.bytes for bot in bots) / ticks, 1) if ticks else None,
+        "dropped": sum(bot.dropped for bot in bots)
+    }
+
+
+async def run(clients, seconds, host=None, port=None, board_size=None, speed=None, seed=0):
+    """Runs `clients` bots for `seconds` against a server, started here if no port is given."""
+    process = forwarder = None
+    if port is None:
+        process, port = await start_server(board_size, speed)
+        forwarder = asyncio.create_task(forward_lines(process.stderr))
+        host = HOST
+    bots = [Bot(seed + i) for i in range(clients)]
+    tasks = [asyncio.create_task(bot.run(host, port)) for bot in bots]
+    try:
+        await asyncio.wait(tasks, timeout=seconds)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if process is not None:
+            process.terminate()
+            await process.wait()
+            forwarder.cancel()
+    return report(bots, seconds)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the SNAKE.EXE arena server with bot clients.")
+    parser.add_argument("--clients", type=int, default=CLIENTS)
+    parser.add_argument("--seconds", type=float, default=SECONDS)
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, help="an already running server; by default one is started")
+    parser.add_argument("--board-size", type=int, help="for the started server")
+    parser.add_argument("--speed", type=float, help="seconds per tick, for the started server")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    result = asyncio.run(run(
+        args.clients, args.seconds, args.host, args.port, args.board_size, args.speed, args.seed
+    ))
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
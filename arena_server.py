@@ -0,0 +1,153 @@
+"""
+arena_server.py – The multiplayer game server for SNAKE.EXE.
+
+An asyncio server that owns the authoritative ArenaEngine (see arena.py) and
+steps it on a fixed schedule: tick n is due at start + n * speed on the event
+loop's clock, so a slow tick delays the next one but never shifts the ones
+after it. Each tick is encoded once (see protocol.py) and the same bytes are
+written to every client without awaiting them, so one slow connection never
+holds up the tick; a client that falls MAX_CLIENT_BUFFER bytes behind is
+dropped instead. Steering messages are applied as they arrive and take effect
+on the next tick.
+
+Everything runs on one machine: serve on loopback (the default) or a LAN
+address, and connect with arena_client.py or the bots of arena_loadgen.py.
+
+Usage:
+    python arena_server.py --host 0.0.0.0 --port 7777 --board-size 41
+"""
+
+import argparse
+import asyncio
+import json
+import struct
+import sys
+import time
+
+from arena import ArenaEngine, ARENA_SPEED
+from engine import GRID_CELLS
+from protocol import encode_welcome, encode_tick, read_steer
+
+# === Constants ===
+HOST = "127.0.0.1"
+PORT = 7777
+MAX_CLIENT_BUFFER = 256 * 1024  # bytes queued for a client before it is dropped
+STATUS_EVERY = 5.0  # seconds between status lines on stderr
+MAX_LAG_TICKS = 5  # after a longer stall the schedule restarts instead of catching up
+
+
+# === ArenaServer Class ===
+class ArenaServer:
+    def __init__(self, board_size=GRID_CELLS, speed=ARENA_SPEED, seed=None):
+        self.engine = ArenaEngine(board_size, seed=seed)
+        self.speed = speed
+        self.clients = {}  # player id -> StreamWriter
+        self.next_id = 1
+        self.tick_times = []  # seconds spent on each tick since the last status line
+        self.late_ticks = 0
+        self.bytes_sent = 0
+
+    async def serve(self, host=HOST, port=PORT, ready=None):
+        """Accepts clients and runs the tick loop until cancelled; calls ready(port) once listening."""
+        server = await asyncio.start_server(self.handle_client, host, port)
+        async with server:
+            if ready is not None:
+                ready(server.sockets[0].getsockname()[1])
+            await self.run()
+
+    async def handle_client(self, reader, writer):
+        """
+        Registers a player, brings it up to date, then applies its steering until it
+        disconnects or sends anything but a well-formed STEER message.
+        """
+        player_id = self.next_id
+        self.next_id += 1
+        self.engine.join(player_id)
+        writer.write(encode_welcome(player_id, self.engine.grid.cols, self.speed))
+        writer.write(encode_tick(self.engine.tick, self.engine.join_deltas()))
+        self.clients[player_id] = writer
+        try:
+            while True:
+                self.engine.steer(player_id, await read_steer(reader))
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError, struct.error):
+            pass
+        finally:
+            self.disconnect(player_id)
+
+    def disconnect(self, player_id):
+        writer = self.clients.pop(player_id, None)
+        if writer is None:
+            return
+        self.engine.leave(player_id)
+        writer.close()
+
+    async def run(self):
+        """The fixed-rate tick loop."""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        last_status = time.perf_counter()
+        tick = 0
+        while True:
+            tick += 1
+            delay = start + tick * self.speed - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                self.late_ticks += 1
+                if delay < -MAX_LAG_TICKS * self.speed:
+                    start = loop.time() - tick * self.speed
+            began = time.perf_counter()
+            deltas = self.engine.step()
+            self.broadcast(encode_tick(self.engine.tick, deltas))
+            now = time.perf_counter()
+            self.tick_times.append(now - began)
+            if now - last_status >= STATUS_EVERY:
+                self.print_status()
+                last_status = now
+
+    def broadcast(self, message):
+        """Writes one encoded tick to every client, dropping those that can't keep up."""
+        for player_id, writer in list(self.clients.items()):
+            if writer.transport.get_write_buffer_size() > MAX_CLIENT_BUFFER:
+                self.disconnect(player_id)
+            else:
+                writer.write(message)
+                self.bytes_sent += len(message)
+
+    def print_status(self):
+        """One JSON status line on stderr: clients, tick cost and traffic since the last one."""
+        times = sorted(self.tick_times)
+        print(json.dumps({
+            "tick": self.engine.tick,
+            "clients": len(self.clients),
+            "tick_p50_ms": round(times[len(times) // 2] * 1000, 3),
+            "tick_max_ms": round(times[-1] * 1000, 3),
+            "late_ticks": self.late_ticks,
+            "bytes_per_tick": round(self.bytes_sent / len(times))
+        }), file=sys.stderr)
+        self.tick_times.clear()
+        self.bytes_sent = 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a multiplayer SNAKE.EXE arena.")
+    parser.add_argument("--host", default=HOST, help="address to listen on (0.0.0.0 for the LAN)")
+    parser.add_argument("--port", type=int, default=PORT, help="0 picks a free port")
+    parser.add_argument("--board-size", type=int, default=GRID_CELLS)
+    parser.add_argument("--speed", type=float, default=ARENA_SPEED, help="seconds per tick")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    server = ArenaServer(args.board_size, args.speed, args.seed)
+
+    def ready(port):
+        print(f"listening on {args.host}:{port}", file=sys.stderr, flush=True)
+
+    try:
+        asyncio.run(server.serve(args.host, args.port, ready))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+audio.py – Sound effects for SNAKE.EXE.
+
+Decodes every sound effect in the sounds/ folder into memory once at startup
+and plays them through a fixed pool of pygame mixer channels. When every
+channel is busy the oldest voice is stolen, and the same sound can't be
+restarted faster than MIN_REPLAY_INTERVAL, so rapid eating never piles up
+players or stalls the game loop. Looping music is streamed separately with
+pygame.mixer.music.
+
+pygame itself is only imported by init(), which start() runs on a background
+thread: the menu can paint while the mixer opens and the sounds decode.
+Until then sound effects are skipped, and music asked for early starts as
+soon as the mixer is ready.
+"""
+
+import os
+import threading
+import time
+
+pygame = None  # imported by init(), so importing this module stays cheap
+
+# === Constants ===
+SOUNDS_DIR = "sounds"
+SOUND_EXTENSIONS = (".wav", ".mp3", ".ogg")
+MUSIC_FILES = {"menu_theme.mp3", "game_theme.wav"}  # streamed, not preloaded
+NUM_CHANNELS = 8
+MIN_REPLAY_INTERVAL = 0.05  # seconds
+
+
+# === AudioEngine Class ===
+class AudioEngine:
+    def __init__(self, sounds_dir=SOUNDS_DIR, num_channels=NUM_CHANNELS):
+        """
+        Preloads all sound effects and reserves a pool of mixer channels.
+        pygame.mixer must already be initialized.
+        """
+        pygame.mixer.set_num_channels(num_channels)
+        self.channels = [pygame.mixer.Channel(i) for i in range(num_channels)]
+        self.started_at = [0.0] * num_channels
+        self.last_played = {}
+        self.sounds = {}
+        for filename in sorted(os.listdir(sounds_dir)):
+            if filename in MUSIC_FILES or not filename.endswith(SOUND_EXTENSIONS):
+                continue
+            try:
+                self.sounds[filename] = pygame.mixer.Sound(os.path.join(sounds_dir, filename))
+            except pygame.error:
+                pass  # Format not supported by this SDL_mixer build; play nothing
+
+    def play(self, filename):
+        """Play a preloaded sound effect on a free channel, stealing the oldest if none is free."""
+        sound = self.sounds.get(filename)
+        if sound is None:
+            return
+        now = time.perf_counter()
+        if now - self.last_played.get(filename, -MIN_REPLAY_INTERVAL) < MIN_REPLAY_INTERVAL:
+            return
+        self.last_played[filename] = now
+
+        index = self.free_channel()
+        if index is None:
+            index = self.started_at.index(min(self.started_at))
+        self.started_at[index] = now
+        self.channels[index].play(sound)
+
+    def free_channel(self):
+        """Index of an idle channel in the pool, or None if all are playing."""
+        for index, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                return index
+        return None
+
+
+# === Module-level Player ===
+_engine = None
+_music = None  # music file that should be looping, if any
+_lock = threading.Lock()
+_loader = None
+
+def start():
+    """Run init() on a background thread, once."""
+    global _loader
+    if _loader is None:
+        _loader = threading.Thread(target=init, name="snake-audio", daemon=True)
+        _loader.start()
+
+def init():
+    """Import pygame, open the mixer and create the shared audio engine (blocking)."""
+    global pygame, _engine
+    import pygame
+    try:
+        pygame.mixer.init()
+        engine = AudioEngine()
+    except pygame.error:
+        return  # No audio device: play the game in silence
+    with _lock:
+        _engine = engine
+        if _music is not None:
+            _start_music(_music)
+
+def play_sound(filename):
+    """Play a sound effect by file name through the shared audio engine, if initialized."""
+    if _engine is not None:
+        _engine.play(filename)
+
+def play_music(path):
+    """Loop a music file, now or as soon as the mixer is ready."""
+    global _music
+    with _lock:
+        _music = path
+        if _engine is not None:
+            _start_music(path)
+
+def stop_music():
+    """Stop the looping music, or cancel music still waiting for the mixer."""
+    global _music
+    with _lock:
+        _music = None
+        if _engine is not None:
+            pygame.mixer.music.stop()
+
+def _start_music(path):
+    pygame.mixer.music.load(path)
+    pygame.mixer.music.play(-1)
@@ -0,0 +1,273 @@
+"""
+autopilot.py – Defines the DistanceField and Autopilot classes for SNAKE.EXE.
+
+Autopilot is a policy (see policies.py) that plays the game by itself: it
+heads down the shortest path to the food, but only along a path after which
+it can still get away, and otherwise follows its own tail the long way round
+until a safe path opens up. It drives the attract mode in main.py and doubles
+as a strong baseline player for headless games (`--policy autopilot`).
+
+The shortest paths come from a DistanceField: BFS distances from the food to
+every empty cell. It is not recomputed every tick. Each tick only changes two
+cells, the new head (blocked) and the freed tail (opened), so the field is
+repaired around those two cells, and rebuilt from scratch only when the food
+moves. Blocking a cell re-derives just the cells whose shortest path ran
+through it; opening one spreads shorter distances outwards from it.
+
+Whether a path is safe is checked by playing it forwards on paper, taking
+into account that the tail moves on as the head travels, with a search that
+stops once it has found enough room for the snake. A path that passes
+the check is then followed to the food without checking it again. Should the
+snake still go STALL_BOARDS board-fulls of ticks without eating, it gives up
+playing safe and heads straight for the food, so every game ends or eats.
+"""
+
+import heapq
+from collections import deque
+
+from engine import OPPOSITES
+from grid import WALL, DIRECTIONS
+
+# === Constants ===
+UNREACHABLE = float("inf")
+ESCAPE_ROOM = 2  # empty cells, per body cell, that count as room enough to get away
+STALL_BOARDS = 2  # ticks without food, in board-fulls of cells, before the autopilot stops playing safe
+
+
+# === DistanceField Class ===
+class DistanceField:
+    def __init__(self, grid, occupied):
+        """
+        Shortest-path distances through the empty cells of `grid` to a target cell,
+        where `occupied` (the engine's occupancy grid) marks blocked cells.
+        """
+        self.occupied = occupied
+        self.adjacent = [
+            [grid.neighbors[heading][cell] for heading in DIRECTIONS if grid.neighbors[heading][cell] != WALL]
+            for cell in range(grid.size)
+        ]
+        self.dist = [UNREACHABLE] * grid.size
+        self.target = None
+
+    def rebuild(self, target):
+        """Recomputes every distance by BFS from `target` (None leaves every cell unreachable)."""
+        dist = self.dist
+        dist[:] = [UNREACHABLE] * len(dist)
+        self.target = target
+        if target is None:
+            return
+        dist[target] = 0
+        self.spread(deque([target]))
+
+    def spread(self, queue):
+        """BFS outwards from the cells in `queue`, lowering any distance it can improve."""
+        dist, occupied, adjacent = self.dist, self.occupied, self.adjacent
+        while queue:
+            cell = queue.popleft()
+            reached = dist[cell] + 1
+            for neighbor in adjacent[cell]:
+                if reached < dist[neighbor] and not occupied[neighbor]:
+                    dist[neighbor] = reached
+                    queue.append(neighbor)
+
+    def open(self, cell):
+        """Updates the field after `cell` has become empty."""
+        best = min((self.dist[neighbor] for neighbor in self.adjacent[cell]), default=UNREACHABLE) + 1
+        if best < self.dist[cell]:
+            self.dist[cell] = best
+            self.spread(deque([cell]))
+
+    def block(self, cell):
+        """
+        Updates the field after `cell` has been filled. Cells whose shortest path
+        ran through it, and no other neighbour as short, lose their distance level
+        by level; each is then given the best distance its remaining neighbours
+        offer, and those are settled in order as in Dijkstra's algorithm.
+        """
+        dist, adjacent = self.dist, self.adjacent
+        if dist[cell] == UNREACHABLE:
+            return
+        if cell == self.target:
+            self.rebuild(None)
+            return
+        lost = deque([(cell, dist[cell])])
+        dist[cell] = UNREACHABLE
+        orphans = []
+        while lost:
+            parent, level = lost.popleft()
+            for child in adjacent[parent]:
+                if dist[child] != level + 1:
+                    continue
+                if any(dist[other] == level for other in adjacent[child]):
+                    continue  # Still as close through another neighbour
+                dist[child] = UNREACHABLE
+                orphans.append(child)
+                lost.append((child, level + 1))
+
+        heap = []
+        for orphan in orphans:
+            best = min(dist[neighbor] for neighbor in adjacent[orphan]) + 1
+            if best < UNREACHABLE:
+                heap.append((best, orphan))
+        heapq.heapify(heap)
+        occupied = self.occupied
+        while heap:
+            level, orphan = heapq.heappop(heap)
+            if level >= dist[orphan]:
+                continue
+            dist[orphan] = level
+            for neighbor in adjacent[orphan]:
+                if level + 1 < dist[neighbor] and not occupied[neighbor]:
+                    heapq.heappush(heap, (level + 1, neighbor))
+
+
+# === Autopilot Class ===
+class Autopilot:
+    def __init__(self):
+        """A planner that attaches itself to whichever engine it is asked to steer."""
+        self.engine = None
+        self.field = None
+        self.tick = None
+        self.entered = None  # cell -> tick the head last entered it
+        self.plan = deque()  # the rest of a checked path to the target, next cell first
+        self.score = 0
+        self.last_meal = 0  # tick the score last went up
+
+    @property
+    def stalled(self):
+        """Whether the snake has gone STALL_BOARDS board-fulls of ticks without eating."""
+        return self.engine is not None and self.tick - self.last_meal > STALL_BOARDS * self.engine.grid.size
+
+    def __call__(self, engine):
+        """The heading for the engine's next tick (or None to keep going straight)."""
+        self.sync(engine)
+        head = engine.head
+        grid = engine.grid
+        if self.plan:
+            cell = self.plan.popleft()
+            heading = next((heading for heading in DIRECTIONS if grid.neighbors[heading][head] == cell), None)
+            if heading is not None and not engine.occupied[cell]:
+                return heading
+            self.plan.clear()  # Someone else steered
+
+        moves = []
+        for heading in DIRECTIONS:
+            cell = grid.neighbors[heading][head]
+            if cell == WALL or heading == OPPOSITES[engine.heading]:
+                continue
+            if not engine.occupied[cell] or (cell == engine.body[-1] and not engine.grow_pending):
+                moves.append((heading, cell))
+        if not moves:
+            return None
+
+        dist = self.field.dist
+        towards_target = sorted((dist[cell], heading, cell) for heading, cell in moves if dist[cell] < UNREACHABLE)
+        if towards_target and self.stalled:
+            return towards_target[0][1]  # Looping without eating: stop playing safe
+        for _, heading, cell in towards_target:
+            path = self.path(cell)
+            if self.escapes(engine, path)[0]:
+                path.popleft()
+                self.plan = path
+                return heading
+        return self.follow_tail(engine, moves)
+
+    def sync(self, engine):
+        """Brings the distance field, entry ticks and plan up to date with the engine's latest tick."""
+        target = engine.special_food if engine.special_food is not None else engine.food
+        if engine is not self.engine or engine.tick != self.tick + 1:
+            if engine is not self.engine:
+                self.engine = engine
+                self.field = DistanceField(engine.grid, engine.occupied)
+                self.entered = [0] * engine.grid.size
+            for age, cell in enumerate(engine.body):
+                self.entered[cell] = engine.tick - age
+            self.field.rebuild(target)
+            self.plan.clear()
+            self.score = engine.score
+            self.last_meal = engine.tick
+        else:
+            self.entered[engine.head] = engine.tick
+            if target != self.field.target:
+                self.field.rebuild(target)
+                self.plan.clear()
+            elif engine.freed_cell != engine.head:  # Unless the head took the tail's place
+                self.field.block(engine.head)
+                if engine.freed_cell is not None:
+                    self.field.open(engine.freed_cell)
+            if engine.score != self.score:
+                self.score = engine.score
+                self.last_meal = engine.tick
+                self.plan.clear()  # The food that respawned may lie on it
+        self.tick = engine.tick
+
+    def path(self, cell):
+        """The shortest path from `cell` down the distance field to the target, `cell` first."""
+        dist, adjacent = self.field.dist, self.field.adjacent
+        path = deque([cell])
+        while dist[cell]:
+            level = dist[cell] - 1
+            cell = next(neighbor for neighbor in adjacent[cell] if dist[neighbor] == level)
+            path.append(cell)
+        return path
+
+    def escapes(self, engine, path):
+        """
+        Whether the snake can still get away after taking `path` (the cells the head
+        will enter, in order), and how many empty cells it found doing so.
+
+        The path is played forwards on paper: each body cell is stamped with the
+        tick its segment entered it, so a cell entered at tick e is vacated
+        e - tail_entry + 1 + grow moves later, however far the snake has to travel
+        to get there. A search from the new head then succeeds as soon as it
+        reaches a body cell no earlier than it is vacated (it can follow the tail
+        from there), or has found ESCAPE_ROOM times as many empty cells as the
+        snake is long. Either way it visits a bounded number of cells, never the
+        whole board.
+        """
+        entered, occupied, adjacent = self.entered, engine.occupied, self.field.adjacent
+        tick = engine.tick
+        length = len(engine.body)
+        grow = engine.grow_pending
+        overlay = {}  # path cell -> tick the head will enter it
+        for step, cell in enumerate(path, 1):
+            overlay[cell] = tick + step
+            if grow:
+                grow -= 1
+                length += 1
+            if cell == engine.food:
+                grow += 1
+        head = path[-1]
+        tail_entry = tick + len(path) - length + 1
+
+        seen = {head}
+        frontier = [head]
+        moves = 0
+        while frontier:
+            moves += 1
+            reached = []
+            for cell in frontier:
+                for neighbor in adjacent[cell]:
+                    if neighbor in seen:
+                        continue
+                    entry = overlay.get(neighbor)
+                    if entry is None and occupied[neighbor]:
+                        entry = entered[neighbor]
+                    if entry is not None and entry >= tail_entry:  # Still part of the body
+                        if moves >= entry - tail_entry + 1 + grow:
+                            return True, len(seen)
+                        continue
+                    seen.add(neighbor)
+                    reached.append(neighbor)
+            if len(seen) >= ESCAPE_ROOM * length:
+                return True, len(seen)
+            frontier = reached
+        return False, len(seen)
+
+    def follow_tail(self, engine, moves):
+        """
+        The safe fallback: of the moves that can still get away, the one that finds
+        the most room first (the long way round to the tail); failing that, the one
+        into the largest open region.
+        """
+        return max((self.escapes(engine, [cell]), heading) for heading, cell in moves)[1]
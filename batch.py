@@ -0,0 +1,131 @@
+"""
+batch.py – Multi-core batch simulator for SNAKE.EXE.
+
+Plays many independent headless games in a multiprocessing pool, each with its
+own seed and a scripted or pluggable policy (see policies.py), and aggregates
+the per-game results into distributions. Use it to tune the difficulty speeds,
+SNAKE_SPEED_STEP, SPECIAL_FOOD_APPEARS_EVERY and SPECIAL_MODE_DURATION.
+
+Usage:
+    python batch.py --games 10000 --policy greedy --difficulty hard --speed-step 0.004
+    python batch.py --games 500 --policy my_bot:choose --stream
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import statistics
+import sys
+
+from engine import (
+    GameEngine, DIFFICULTY_SPEEDS, SNAKE_SPEED_STEP, SPECIAL_FOOD_APPEARS_EVERY,
+    SPECIAL_MODE_DURATION
+)
+from policies import load_policy
+
+# === Constants ===
+MAX_TICKS = 100_000  # stop games a policy would otherwise play forever
+METRICS = ("score", "length", "ticks", "special_mode_uptime")
+
+
+# === Worker ===
+def play_game(job):
+    """Plays one headless game described by `job` and returns its result."""
+    policy = load_policy(job["policy"])
+    engine = GameEngine(
+        job["difficulty"], seed=job["seed"], speed=job["speed"], speed_step=job["speed_step"],
+        special_food_every=job["special_food_every"],
+        special_mode_duration=job["special_mode_duration"]
+    )
+    while not engine.game_over and engine.tick < job["max_ticks"]:
+        engine.step(policy(engine))
+    return {
+        "seed": job["seed"],
+        "score": engine.score,
+        "length": len(engine.body),
+        "ticks": engine.tick,
+        "special_mode_uptime": engine.special_mode_ticks / max(engine.tick, 1),
+        "death_cause": engine.death_cause
+    }
+
+
+def make_jobs(games, first_seed, **settings):
+    """One job per game, each with its own seed; generated lazily for the pool."""
+    for seed in range(first_seed, first_seed + games):
+        yield dict(settings, seed=seed)
+
+
+def run_batch(games, workers=None, first_seed=0, **settings):
+    """Yields game results as worker processes finish them, in completion order."""
+    workers = workers or os.cpu_count()
+    chunksize = max(1, games // (workers * 8))
+    with multiprocessing.Pool(workers) as pool:
+        yield from pool.imap_unordered(
+            play_game, make_jobs(games, first_seed, **settings), chunksize=chunksize
+        )
+
+
+# === Aggregation ===
+def distribution(values):
+    """Summary statistics and deciles for one metric."""
+    ordered = sorted(values)
+    deciles = statistics.quantiles(ordered, n=10) if len(ordered) > 1 else ordered * 9
+    return {
+        "mean": round(statistics.fmean(ordered), 4),
+        "stdev": round(statistics.pstdev(ordered), 4),
+        "min": ordered[0],
+        "max": ordered[-1],
+        "deciles": [round(value, 4) for value in deciles]
+    }
+
+
+def aggregate(results):
+    """Collects streamed results into per-metric distributions plus death-cause counts."""
+    values = {metric: [] for metric in METRICS}
+    causes = {}
+    for result in results:
+        for metric in METRICS:
+            values[metric].append(result[metric])
+        causes[result["death_cause"]] = causes.get(result["death_cause"], 0) + 1
+    return {
+        "games": len(values["score"]),
+        "death_causes": causes,
+        "metrics": {metric: distribution(v) for metric, v in values.items() if v}
+    }
+
+
+def echo_results(results):
+    """Passes results through, printing each one as a JSON line on stderr."""
+    for result in results:
+        print(json.dumps(result), file=sys.stderr)
+        yield result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run many headless SNAKE.EXE games in parallel.")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--policy", default="greedy", help="built-in name or module:function")
+    parser.add_argument("--difficulty", choices=list(DIFFICULTY_SPEEDS), default="medium")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game")
+    parser.add_argument("--speed", type=float, help="starting tick length, overriding the difficulty")
+    parser.add_argument("--speed-step", type=float, default=SNAKE_SPEED_STEP)
+    parser.add_argument("--special-every", type=int, default=SPECIAL_FOOD_APPEARS_EVERY)
+    parser.add_argument("--special-duration", type=float, default=SPECIAL_MODE_DURATION)
+    parser.add_argument("--max-ticks", type=int, default=MAX_TICKS)
+    parser.add_argument("--stream", action="store_true", help="print each game result as a JSON line on stderr")
+    args = parser.parse_args()
+
+    results = run_batch(
+        args.games, args.workers, args.seed, policy=args.policy, difficulty=args.difficulty,
+        speed=args.speed, speed_step=args.speed_step, special_food_every=args.special_every,
+        special_mode_duration=args.special_duration, max_ticks=args.max_ticks
+    )
+    if args.stream:
+        results = echo_results(results)
+    print(json.dumps(aggregate(results), indent=2))
+
+
+if __name__ == "__main__":
+    main()
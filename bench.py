@@ -0,0 +1,182 @@
+"""
+bench.py – Benchmarks the SNAKE.EXE tick pipeline.
+
+Drives the engine's tick stages (move + collision, special food, special mode
+expiry, regular food) and, with --turtle, the view updates and the frame
+present() of a renderer (see render.py; --renderer canvas or turtle) under a
+hidden turtle window, for a range of snake lengths. The snake follows
+a Hamiltonian cycle of the board so it can run forever at any length.
+Per-stage p50/p99 latencies and overall ticks per second are printed as JSON.
+
+Usage:
+    python bench.py
+    python bench.py --lengths 3 100 1000 5000 --ticks 5000 --turtle --output bench.json
+    python bench.py --turtle --renderer turtle
+"""
+
+import argparse
+import json
+import math
+import time
+
+from engine import GameEngine, FOOD_EATEN
+from grid import UP, DOWN, LEFT, RIGHT
+
+DEFAULT_LENGTHS = [3, 30, 300, 3000]
+DEFAULT_TICKS = 2000
+MIN_BOARD_SIZE = 30
+
+
+# === Scripted Input ===
+def hamiltonian_cycle(grid):
+    """
+    A closed path visiting every cell of a grid with an even number of rows:
+    snake through columns 1..cols-1 row by row, then return down column 0.
+    """
+    cols, rows = grid.cols, grid.rows
+    cycle = []
+    for row in range(rows):
+        columns = range(1, cols) if row % 2 == 0 else range(cols - 1, 0, -1)
+        cycle.extend(row * cols + col for col in columns)
+    cycle.extend(row * cols for row in range(rows - 1, -1, -1))
+    return cycle
+
+
+def heading_between(grid, cell, next_cell):
+    """The heading that moves the snake from `cell` to the adjacent `next_cell`."""
+    return {1: RIGHT, -1: LEFT, grid.cols: UP, -grid.cols: DOWN}[next_cell - cell]
+
+
+def board_size_for(length):
+    """An even board size with room for a snake of `length` plus plenty of free cells."""
+    size = max(MIN_BOARD_SIZE, math.ceil(math.sqrt(2 * length)))
+    return size + size % 2
+
+
+def setup_engine(length, seed):
+    """A medium game on a board big enough for `length`, with the snake laid along the cycle."""
+    engine = GameEngine("medium", seed=seed, board_size=board_size_for(length))
+    cycle = hamiltonian_cycle(engine.grid)
+    body = [cycle[-i] for i in range(length)]  # head at cycle[0], tail trailing behind it
+    engine.place_snake(body, heading_between(engine.grid, body[1], body[0]))
+    successor = {cell: cycle[(i + 1) % len(cycle)] for i, cell in enumerate(cycle)}
+    return engine, successor
+
+
+# === Measurement ===
+def percentile(samples, fraction):
+    """The value at `fraction` of the way through the sorted samples."""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def summarize(samples_ns):
+    return {
+        "p50_us": round(percentile(samples_ns, 0.50) / 1000, 3),
+        "p99_us": round(percentile(samples_ns, 0.99) / 1000, 3)
+    }
+
+
+class ScreenViews:
+    def __init__(self, engine, renderer_name):
+        """Hidden turtle window with Snake/Food views, mirroring what main.py draws."""
+        from turtle import Screen
+        from render import create_renderer
+        from snake import Snake
+        from food import Food
+
+        self.screen = Screen()
+        self.screen.getcanvas().winfo_toplevel().withdraw()
+        self.screen.tracer(0)
+        self.renderer = create_renderer(self.screen, renderer_name)
+        self.snake = Snake(self.renderer, "light pink", engine.positions())
+        self.food = Food(self.renderer, "violet", engine.position(engine.food))
+
+    def render(self, engine, events):
+        if engine.game_over:
+            return
+        if engine.freed_cell is None:
+            self.snake.extend(engine.head_position)
+        else:
+            self.snake.move(engine.head_position)
+        if FOOD_EATEN in events and engine.food is not None:
+            self.food.place(engine.position(engine.food))
+
+    def update(self):
+        self.renderer.present()
+
+    def close(self):
+        self.screen.clear()
+
+
+def run(length, ticks, use_turtle=False, seed=0, renderer="canvas"):
+    """Runs `ticks` scripted ticks with a snake of `length`; returns per-stage timings."""
+    engine, successor = setup_engine(length, seed)
+    views = ScreenViews(engine, renderer) if use_turtle else None
+    names = [stage.__name__ for stage in engine.stages]
+    samples = {name: [] for name in names}
+    if views:
+        samples["render"] = []
+        samples["screen_update"] = []
+
+    clock = time.perf_counter_ns
+    started = clock()
+    for _ in range(ticks):
+        if engine.game_over or len(engine.free_cells) < 2:
+            engine, successor = setup_engine(length, seed)
+            if views:
+                views.close()
+                views = ScreenViews(engine, renderer)
+        head = engine.body[0]
+        engine.begin_tick(heading_between(engine.grid, head, successor[head]))
+        events = []
+        for name, stage in zip(names, engine.stages):
+            t0 = clock()
+            stage(events)
+            samples[name].append(clock() - t0)
+            if engine.game_over:
+                break
+        if views:
+            t0 = clock()
+            views.render(engine, events)
+            t1 = clock()
+            views.update()
+            samples["render"].append(t1 - t0)
+            samples["screen_update"].append(clock() - t1)
+    elapsed = (clock() - started) / 1e9
+
+    if views:
+        views.close()
+    return {
+        "length": length,
+        "board_size": engine.grid.cols,
+        "ticks": ticks,
+        "ticks_per_second": round(ticks / elapsed, 1),
+        "stages": {name: summarize(values) for name, values in samples.items() if values}
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the SNAKE.EXE tick pipeline.")
+    parser.add_argument("--lengths", type=int, nargs="+", default=DEFAULT_LENGTHS)
+    parser.add_argument("--ticks", type=int, default=DEFAULT_TICKS)
+    parser.add_argument("--turtle", action="store_true", help="also render to a hidden turtle screen")
+    parser.add_argument("--renderer", choices=["canvas", "turtle"], default="canvas")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the JSON report to this file instead of stdout")
+    args = parser.parse_args()
+
+    report = {
+        "mode": f"turtle/{args.renderer}" if args.turtle else "headless",
+        "results": [run(length, args.ticks, args.turtle, args.seed, args.renderer) for length in args.lengths]
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+"""
+engine.py – Defines the GameEngine class for SNAKE.EXE.
+
+Holds the complete game state (snake body, food, special food, score, speed and
+special mode timers) in plain Python data structures, with no dependency on
+turtle or a display. The body is tracked on an occupancy grid (see grid.py), so
+wall and self-collision checks are O(1) lookups whatever the snake's length.
+Food is placed by sampling a free-cell index, so it always lands on an empty
+grid cell and spawning stays O(1) right up to a nearly full board. The Snake,
+Food and Scoreboard classes only draw what the engine tells them, so games can
+be stepped headless for simulations and tests.
+
+Games are fully deterministic: randomness comes from a per-game RNG seeded with
+`seed`, and timers run on a logical clock that advances by the snake's speed
+each tick instead of wall-clock time, so a seed plus the inputs replays a game.
+"""
+
+import random
+from collections import deque
+
+from grid import Grid, FreeCells, WALL, UP, DOWN, LEFT, RIGHT
+
+# === Constants ===
+STARTING_POSITIONS = [(0, 0), (-20, 0), (-40, 0)]
+MOVE_DISTANCE = 20
+SPECIAL_FOOD_APPEARS_EVERY = 5
+SPECIAL_FOOD_LIFETIME = 5  # seconds
+SPECIAL_MODE_DURATION = 10  # seconds
+MIN_SNAKE_SPEED = 0.04
+SNAKE_SPEED_STEP = 0.005
+WALL_LIMIT = 280
+GRID_CELLS = 2 * WALL_LIMIT // MOVE_DISTANCE + 1
+
+DIFFICULTY_SPEEDS = {
+    "easy": 0.15,
+    "medium": 0.1,
+    "hard": 0.06
+}
+
+# Per-tick stages, in the order GameEngine.step() runs them
+STAGES = ("move", "handle_special_food", "handle_special_mode_expiry", "handle_regular_food")
+
+OPPOSITES = {UP: DOWN, DOWN: UP, LEFT: RIGHT, RIGHT: LEFT}
+
+# === Events returned by GameEngine.step() ===
+FOOD_EATEN = "food_eaten"
+SPECIAL_FOOD_SPAWNED = "special_food_spawned"
+SPECIAL_FOOD_EATEN = "special_food_eaten"
+SPECIAL_FOOD_EXPIRED = "special_food_expired"
+SPECIAL_MODE_ENDED = "special_mode_ended"
+HIT_WALL = "hit_wall"
+HIT_SELF = "hit_self"
+
+
+# === GameEngine Class ===
+class GameEngine:
+    stage_names = STAGES
+
+    def __init__(
+        self, difficulty="medium", seed=None, board_size=GRID_CELLS, speed=None,
+        speed_step=SNAKE_SPEED_STEP, special_food_every=SPECIAL_FOOD_APPEARS_EVERY,
+        special_mode_duration=SPECIAL_MODE_DURATION
+    ):
+        """
+        Start a new game at the given difficulty on a board_size x board_size grid,
+        seeded randomly unless `seed` is given. The remaining arguments override
+        the standard rules, for difficulty tuning.
+        """
+        self.seed = random.getrandbits(32) if seed is None else seed
+        self.rng = random.Random(self.seed)
+        self.difficulty = difficulty
+        self.speed = DIFFICULTY_SPEEDS[difficulty] if speed is None else speed
+        self.start_speed = self.speed
+        self.speed_step = speed_step
+        self.special_food_every = special_food_every
+        self.special_mode_duration = special_mode_duration
+        self.grid = Grid(board_size, board_size, MOVE_DISTANCE)
+        self.occupied = bytearray(self.grid.size)
+        self.free_cells = FreeCells(self.grid.size)
+        self.body = deque(self.grid.cell(position) for position in STARTING_POSITIONS)  # head first
+        self.freed_cell = None
+        for cell in self.body:
+            self.occupied[cell] = 1
+            self.free_cells.remove(cell)
+        self.heading = RIGHT
+        self.grow_pending = 0
+        self.score = 0
+        self.double_points = False
+        self.food = self.place_item()
+        self.special_food = None
+        self.special_food_timer = 0
+        self.last_special_food_score = 0
+        self.special_mode = False
+        self.special_mode_timer = 0
+        self.seconds_left = 0
+        self.special_mode_ticks = 0
+        self.game_over = False
+        self.death_cause = None
+        self.tick = 0
+        self.now = 0.0  # logical game time in seconds
+        self.stages = [getattr(self, name) for name in self.stage_names]
+
+    # === Helpers ===
+    def place_item(self):
+        """Claim a uniformly random empty cell for a food item, or None if the board is full."""
+        cell = self.free_cells.sample(self.rng)
+        if cell is not None:
+            self.free_cells.remove(cell)
+        return cell
+
+    def remove_item(self, cell):
+        """Give an uneaten item's cell back to the free-cell index."""
+        if cell is not None and not self.occupied[cell]:
+            self.free_cells.add(cell)
+
+    def place_snake(self, cells, heading):
+        """Replace the snake with the given body cells (head first), e.g. to set up benchmarks."""
+        for cell in self.body:
+            self.occupied[cell] = 0
+            self.free_cells.add(cell)
+        self.body = deque(cells)
+        for cell in self.body:
+            self.occupied[cell] = 1
+            self.free_cells.remove(cell)
+        self.heading = heading
+        if self.food is not None and self.occupied[self.food]:
+            self.food = self.place_item()
+        if self.special_food is not None and self.occupied[self.special_food]:
+            self.special_food = None
+
+    def position(self, cell):
+        """Pixel position of a cell, for drawing."""
+        return self.grid.position(cell)
+
+    @property
+    def head(self):
+        return self.body[0]
+
+    @property
+    def head_position(self):
+        return self.grid.position(self.body[0])
+
+    def positions(self):
+        """Pixel positions of every body segment, head first, for drawing."""
+        return [self.grid.position(cell) for cell in self.body]
+
+    # === Tick ===
+    def turn(self, heading):
+        """Change direction, ignoring direct reversals into the snake's own body."""
+        if heading is not None and heading != OPPOSITES[self.heading]:
+            self.heading = heading
+
+    def begin_tick(self, action=None):
+        """Applies the tick's steering input and advances the tick counter and logical clock."""
+        self.turn(action)
+        self.tick += 1
+        self.now += self.speed
+
+    def step(self, action=None):
+        """
+        Advance the game by one tick, steering towards `action` first if given.
+        Returns the list of events that happened during the tick.
+        """
+        events = []
+        if self.game_over:
+            return events
+        self.begin_tick(action)
+        for stage in self.stages:
+            stage(events)
+            if self.game_over:
+                break
+        return events
+
+    # === Stages ===
+    def move(self, events):
+        """
+        Moves the head one cell forward by pushing the new head and popping the tail,
+        unless the snake is growing. Records the vacated cell in `freed_cell`.
+        Ends the game if the head leaves the board or lands on the body.
+        """
+        self.freed_cell = None
+        body = self.body
+        cell = self.grid.neighbors[self.heading][body[0]]
+        if cell == WALL:
+            self.end(HIT_WALL, events)
+            return
+        # Moving into the cell the tail is about to vacate is allowed
+        if self.occupied[cell] and (self.grow_pending or cell != body[-1]):
+            self.end(HIT_SELF, events)
+            return
+        if self.grow_pending:
+            self.grow_pending -= 1
+        else:
+            self.freed_cell = body.pop()
+            self.occupied[self.freed_cell] = 0
+            self.free_cells.add(self.freed_cell)
+        self.occupied[cell] = 1
+        self.free_cells.remove(cell)
+        body.appendleft(cell)
+
+    def spawn_special_food_if_needed(self, events):
+        """Spawns special (gold) food every N points, if it hasn't already spawned for that score."""
+        if (
+            self.score != 0
+            and self.score % self.special_food_every == 0
+            and self.score != self.last_special_food_score
+        ):
+            self.remove_item(self.special_food)
+            self.special_food = self.place_item()
+            self.special_food_timer = self.now
+            self.last_special_food_score = self.score
+            events.append(SPECIAL_FOOD_SPAWNED)
+
+    def handle_special_food(self, events):
+        """Handles eating or expiry of the special food and activation of special mode."""
+        if self.special_food is None:
+            return
+        if self.body[0] == self.special_food:
+            self.special_food = None
+            self.special_mode = True
+            self.special_mode_timer = self.now
+            self.double_points = True
+            events.append(SPECIAL_FOOD_EATEN)
+        elif self.now - self.special_food_timer > SPECIAL_FOOD_LIFETIME:
+            self.remove_item(self.special_food)
+            self.special_food = None
+            events.append(SPECIAL_FOOD_EXPIRED)
+
+    def handle_special_mode_expiry(self, events):
+        """Ends special mode after a set duration."""
+        if not self.special_mode:
+            return
+        self.special_mode_ticks += 1
+        self.seconds_left = self.special_mode_duration - int(self.now - self.special_mode_timer)
+        if self.seconds_left <= 0:
+            self.special_mode = False
+            self.double_points = False
+            events.append(SPECIAL_MODE_ENDED)
+
+    def handle_regular_food(self, events):
+        """Handles regular food: respawn, growth, score, speed, and special food trigger."""
+        if self.body[0] != self.food:
+            return
+        self.food = self.place_item()
+        self.grow_pending += 1
+        self.score += 2 if self.double_points else 1
+        events.append(FOOD_EATEN)
+        self.spawn_special_food_if_needed(events)
+
+        if self.special_food is not None and self.score % self.special_food_every != 0:
+            self.remove_item(self.special_food)
+            self.special_food = None
+            events.append(SPECIAL_FOOD_EXPIRED)
+
+        if self.speed > MIN_SNAKE_SPEED:
+            self.speed -= self.speed_step
+
+    def end(self, cause, events):
+        """Marks the game as over and records why."""
+        self.game_over = True
+        self.death_cause = cause
+        events.append(cause)
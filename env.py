@@ -0,0 +1,105 @@
+"""
+env.py – Defines the SnakeEnv class for SNAKE.EXE.
+
+A Gym-style environment over the headless GameEngine for training agents:
+reset(seed) and step(action) -> (obs, reward, done, info). Actions are
+direction codes 0-3 (see grid.DIRECTIONS). The observation is a preallocated
+uint8 buffer of four board planes (body, head, food, special food), each
+rows x cols with row 0 at the bottom. It is updated in place from the cells
+that changed each tick, never rebuilt, and exposed as a memoryview so
+np.frombuffer(env.obs, dtype=np.uint8).reshape(env.shape) is a zero-copy view.
+"""
+
+from engine import GameEngine, GRID_CELLS
+from grid import DIRECTIONS
+
+# === Constants ===
+BODY_PLANE = 0
+HEAD_PLANE = 1
+FOOD_PLANE = 2
+SPECIAL_FOOD_PLANE = 3
+NUM_PLANES = 4
+DEATH_PENALTY = -1.0
+
+
+# === SnakeEnv Class ===
+class SnakeEnv:
+    def __init__(self, difficulty="medium", board_size=GRID_CELLS, max_ticks=None, **rules):
+        """
+        Creates the environment. `rules` are passed on to GameEngine for tuning;
+        episodes longer than max_ticks (if given) are cut off as done.
+        """
+        self.difficulty = difficulty
+        self.board_size = board_size
+        self.max_ticks = max_ticks
+        self.rules = rules
+        self.cells = board_size * board_size
+        self.shape = (NUM_PLANES, board_size, board_size)
+        self.buffer = bytearray(NUM_PLANES * self.cells)
+        self.obs = memoryview(self.buffer).cast("B", self.shape)
+        self.info = {"score": 0, "length": 0, "tick": 0, "death_cause": None}
+        self.engine = None
+
+    def reset(self, seed=None):
+        """Starts a new episode and returns the observation."""
+        self.engine = GameEngine(self.difficulty, seed=seed, board_size=self.board_size, **self.rules)
+        self.buffer[:] = bytes(len(self.buffer))
+        for cell in self.engine.body:
+            self.buffer[cell] = 1
+        self.head = self.engine.body[0]
+        self.food = self.engine.food
+        self.special_food = None
+        self.buffer[HEAD_PLANE * self.cells + self.head] = 1
+        self.mark(FOOD_PLANE, None, self.food)
+        self.update_info()
+        return self.obs
+
+    def step(self, action):
+        """
+        Steers towards DIRECTIONS[action] (None keeps the heading) and advances one tick.
+        Returns (obs, reward, done, info); obs and info are reused between calls.
+        """
+        engine = self.engine
+        score = engine.score
+        engine.step(None if action is None else DIRECTIONS[action])
+
+        cells = self.cells
+        buffer = self.buffer
+        if engine.freed_cell is not None:
+            buffer[engine.freed_cell] = 0
+        head = engine.body[0]
+        if head != self.head:
+            buffer[head] = 1
+            buffer[HEAD_PLANE * cells + self.head] = 0
+            buffer[HEAD_PLANE * cells + head] = 1
+            self.head = head
+        if engine.food != self.food:
+            self.mark(FOOD_PLANE, self.food, engine.food)
+            self.food = engine.food
+        if engine.special_food != self.special_food:
+            self.mark(SPECIAL_FOOD_PLANE, self.special_food, engine.special_food)
+            self.special_food = engine.special_food
+
+        reward = engine.score - score
+        done = engine.game_over
+        if done:
+            reward += DEATH_PENALTY
+        elif self.max_ticks is not None and engine.tick >= self.max_ticks:
+            done = True
+        self.update_info()
+        return self.obs, reward, done, self.info
+
+    def mark(self, plane, old_cell, new_cell):
+        """Moves a single-cell marker on one plane."""
+        offset = plane * self.cells
+        if old_cell is not None:
+            self.buffer[offset + old_cell] = 0
+        if new_cell is not None:
+            self.buffer[offset + new_cell] = 1
+
+    def update_info(self):
+        info = self.info
+        info["score"] = self.engine.score
+        info["length"] = len(self.engine.body)
+        info["tick"] = self.engine.tick
+        info["death_cause"] = self.engine.death_cause
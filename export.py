@@ -0,0 +1,400 @@
+"""
+export.py – Renders SNAKE.EXE replays to animated GIFs or PNG image sequences.
+
+Frames are drawn off-screen, without Tk: the replay is re-simulated (see
+replay.py) and after every tick the board is rasterized into a pixel buffer
+holding one palette index per pixel, in the theme's colours. That is exactly
+what a GIF stores, so frames are LZW-compressed as they are produced and
+streamed to the file, each one storing only the rectangle that changed since
+the previous frame. PNG sequences write the same buffers as indexed PNGs plus
+a frames.txt listing each frame's duration, which ffmpeg's concat demuxer can
+turn into a video. Frame timing follows the game's logical clock, so speed-ups
+in the game show up in the clip.
+
+With --workers, the ticks are split into chunks that separate processes
+simulate, render and encode, and the results are written back in order.
+World-mode games are framed by the same chunked Camera the game window uses.
+
+Usage:
+    python export.py replays/last_game.snkr clip.gif --theme arcade --workers 4
+    python export.py replays/last_game.snkr frames/ --png
+"""
+
+import argparse
+import json
+import os
+import struct
+import zlib
+from multiprocessing import Pool
+
+from frenzy import FOOD, GOLD, SLOW, OBSTACLE
+from replay import Replay, play, simulate
+from themes import THEMES, rgb
+from world import Camera, view_cells
+
+# === Constants ===
+CELL_PIXELS = 10
+VIEW_CELLS = view_cells(600)  # boards wider than this are cropped by a camera, like in the game window
+GAME_OVER_HOLD_CS = 200  # how long the last frame stays up, in hundredths of a second
+MIN_DELAY_CS = 2  # shorter GIF frame delays are slowed down by most viewers
+
+# Palette indices
+BACKGROUND = 0
+SNAKE = 1
+GLOW = 2
+ITEM_GOLD = 3
+OBSTACLE_GRAY = 4
+SLOW_GREEN = 5
+FOOD_COLOR = 6
+TEXT = 7
+KIND_COLORS = {FOOD: FOOD_COLOR, GOLD: ITEM_GOLD, SLOW: SLOW_GREEN, OBSTACLE: OBSTACLE_GRAY}
+
+# 3x5 pixel digits for the score
+DIGITS = {
+    "0": "111101101101111", "1": "010110010010111", "2": "111001111100111",
+    "3": "111001111001111", "4": "101101111001001", "5": "111100111001111",
+    "6": "111100111101111", "7": "111001001001001", "8": "111101111101111",
+    "9": "111101111001111"
+}
+
+
+def palette(theme):
+    """The 8 palette colours of a theme, in palette index order, as (r, g, b) tuples."""
+    colors = THEMES[theme]
+    names = [
+        colors["bg"], colors["snake_color"], "gold", "gold", "dim gray", "mediumseagreen",
+        colors["food_color"], colors["text_color"]
+    ]
+    return [rgb(name) for name in names]
+
+
+# === FrameRenderer Class ===
+class FrameRenderer:
+    def __init__(self, engine, cell=CELL_PIXELS, camera=None):
+        """
+        Rasterizes `engine` at `cell` pixels per board cell, the whole board or,
+        with a Camera, just its view.
+        """
+        self.engine = engine
+        self.grid = engine.grid
+        self.cell = cell
+        self.camera = camera
+        self.cols = camera.view_cols if camera else self.grid.cols
+        self.rows = camera.view_rows if camera else self.grid.rows
+        self.width = self.cols * cell
+        self.height = self.rows * cell
+        self.blank = bytes(self.width * self.height)  # all BACKGROUND
+        self.pixels = bytearray(self.blank)
+        self.spans = {}  # (color, width) -> run of pixels
+        if camera:
+            camera.follow(engine.head)
+
+    def track(self):
+        """Moves the camera after a tick; call every tick, rendered or not, to keep it deterministic."""
+        if self.camera:
+            self.camera.follow(self.engine.head)
+
+    def render(self):
+        """Redraws the current state into self.pixels and returns it."""
+        engine = self.engine
+        self.pixels[:] = self.blank
+        color = GLOW if engine.special_mode else SNAKE
+        if self.camera:
+            occupied = engine.occupied
+            for cell in self.camera.cells():
+                if occupied[cell]:
+                    self.fill(cell, color)
+        else:
+            for cell in engine.body:
+                self.fill(cell, color)
+        entities = getattr(engine, "entities", None)
+        if entities is not None:
+            for cell, kind in enumerate(entities.kinds):
+                if kind:
+                    self.fill(cell, KIND_COLORS[kind], self.cell // 5)
+        if engine.food is not None:
+            self.fill(engine.food, FOOD_COLOR, self.cell // 5)
+        if engine.special_food is not None and int(engine.now * 2) % 2 == 0:
+            self.fill(engine.special_food, ITEM_GOLD, self.cell // 6)
+        self.draw_number(engine.score)
+        return self.pixels
+
+    def fill(self, cell, color, inset=0):
+        """Fills a board cell, shrunk by `inset` pixels on every side; cells out of view are skipped."""
+        col, row = cell % self.grid.cols, cell // self.grid.cols
+        if self.camera:
+            col -= self.camera.col
+            row -= self.camera.row
+            if not (0 <= col < self.cols and 0 <= row < self.rows):
+                return
+        top = (self.rows - 1 - row) * self.cell  # board row 0 is the bottom of the image
+        self.rect(col * self.cell + inset, top + inset, self.cell - 2 * inset, self.cell - 2 * inset, color)
+
+    def rect(self, x, y, width, height, color):
+        span = self.spans.get((color, width))
+        if span is None:
+            span = self.spans[color, width] = bytes([color]) * width
+        pixels = self.pixels
+        for offset in range(y * self.width + x, (y + height) * self.width + x, self.width):
+            pixels[offset:offset + width] = span
+
+    def draw_number(self, number):
+        """Draws a number in the top-left corner with the 3x5 digit font."""
+        size = max(1, self.cell // 4)
+        x = size
+        for digit in str(number):
+            pattern = DIGITS[digit]
+            for i, bit in enumerate(pattern):
+                if bit == "1":
+                    self.rect(x + (i % 3) * size, size + (i // 3) * size, size, size, TEXT)
+            x += 4 * size
+
+
+def renderers(replay, cell=CELL_PIXELS, view=VIEW_CELLS, playback=1.0, start=0, stop=None):
+    """
+    Replays a game and yields (renderer, tick, delay_cs) for every frame from
+    tick `start` up to (not including) `stop`, where frame k shows the board
+    after tick k and lasts until tick k + 1. The renderer's buffer is reused,
+    so consume each frame before asking for the next.
+    """
+    renderer = None
+    for engine, _ in play(replay):
+        if renderer is None:
+            camera = Camera(engine.grid, view, view) if engine.grid.cols > view else None
+            renderer = FrameRenderer(engine, cell, camera)
+        else:
+            renderer.track()
+        if stop is not None and engine.tick >= stop:
+            return
+        if engine.tick < start:
+            continue
+        if engine.game_over:
+            delay = GAME_OVER_HOLD_CS
+        else:
+            shown = round(engine.now * 100 / playback)
+            delay = round((engine.now + engine.speed) * 100 / playback) - shown
+        yield renderer, engine.tick, max(delay, MIN_DELAY_CS)
+
+
+# === GIF Encoding ===
+def lzw_compress(data, min_code_size):
+    """GIF-flavoured variable-width LZW, packed least significant bit first."""
+    clear = 1 << min_code_size
+    end = clear + 1
+    output = bytearray()
+    buffer = 0
+    buffered = 0
+
+    def emit(code):
+        nonlocal buffer, buffered
+        buffer |= code << buffered
+        buffered += code_size
+        while buffered >= 8:
+            output.append(buffer & 0xFF)
+            buffer >>= 8
+            buffered -= 8
+
+    code_size = min_code_size + 1
+    table = {}
+    next_code = end + 1
+    emit(clear)
+    prefix = data[0]
+    for byte in data[1:]:
+        key = prefix << 8 | byte
+        code = table.get(key)
+        if code is not None:
+            prefix = code
+            continue
+        emit(prefix)
+        if next_code < 4096:
+            table[key] = next_code
+            next_code += 1
+            if next_code > 1 << code_size and code_size < 12:
+                code_size += 1
+        else:
+            emit(clear)
+            table.clear()
+            next_code = end + 1
+            code_size = min_code_size + 1
+        prefix = byte
+    emit(prefix)
+    emit(end)
+    if buffered:
+        output.append(buffer & 0xFF)
+    return bytes(output)
+
+
+def changed_box(pixels, previous, width, height):
+    """(x, y, width, height) of the smallest rectangle holding every changed pixel, or None."""
+    current, before = memoryview(pixels), memoryview(previous)
+    top = bottom = None
+    left, right = width, -1
+    for y in range(height):
+        start = y * width
+        row, old = current[start:start + width], before[start:start + width]
+        if row == old:
+            continue
+        if top is None:
+            top = y
+        bottom = y
+        diff = int.from_bytes(row, "big") ^ int.from_bytes(old, "big")
+        left = min(left, width - 1 - (diff.bit_length() - 1) // 8)
+        right = max(right, width - 1 - ((diff & -diff).bit_length() - 1) // 8)
+    if top is None:
+        return None
+    return left, top, right - left + 1, bottom - top + 1
+
+
+def gif_frame(pixels, width, height, delay_cs, previous=None):
+    """
+    One GIF frame (graphic control extension plus image) showing `pixels` for
+    delay_cs hundredths of a second. Given the previous frame's pixels, only
+    the rectangle that changed is stored.
+    """
+    box = (0, 0, width, height) if previous is None else changed_box(pixels, previous, width, height)
+    if box is None:
+        box = (0, 0, 1, 1)  # Nothing moved, but the frame still has to hold its delay
+    x, y, w, h = box
+    if (w, h) == (width, height):
+        region = bytes(pixels)
+    else:
+        region = b"".join(pixels[row * width + x:row * width + x + w] for row in range(y, y + h))
+    data = lzw_compress(region, 3)
+    blocks = b"".join(
+        bytes([len(data[i:i + 255])]) + data[i:i + 255] for i in range(0, len(data), 255)
+    )
+    return (
+        struct.pack("<BBBBHBB", 0x21, 0xF9, 4, 1 << 2, delay_cs, 0, 0)  # disposal: keep the frame
+        + struct.pack("<BHHHHB", 0x2C, x, y, w, h, 0)
+        + bytes([3]) + blocks + b"\x00"
+    )
+
+
+def gif_header(width, height, colors):
+    """GIF89a header with an 8-colour global palette, set to loop forever."""
+    return (
+        b"GIF89a"
+        + struct.pack("<HHBBB", width, height, 0xF2, BACKGROUND, 0)  # global table of 2**3 colours
+        + b"".join(bytes(color) for color in colors)
+        + b"\x21\xFF\x0BNETSCAPE2.0\x03\x01\x00\x00\x00"
+    )
+
+
+def gif_frames(job):
+    """Encodes the frames of one chunk of ticks; the first is stored whole."""
+    data, cell, view, playback, start, stop = job
+    previous = None
+    frames = []
+    for renderer, _, delay in renderers(Replay.from_bytes(data), cell, view, playback, start, stop):
+        pixels = renderer.render()
+        frames.append(gif_frame(pixels, renderer.width, renderer.height, delay, previous))
+        previous = bytes(pixels)
+    return frames
+
+
+# === PNG Encoding ===
+def png_bytes(pixels, width, height, colors):
+    """An indexed-colour PNG of `pixels`."""
+    def chunk(kind, body):
+        return struct.pack(">I", len(body)) + kind + body + struct.pack(">I", zlib.crc32(kind + body))
+
+    rows = b"".join(b"\x00" + pixels[y * width:(y + 1) * width] for y in range(height))
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 3, 0, 0, 0))
+        + chunk(b"PLTE", b"".join(bytes(color) for color in colors))
+        + chunk(b"IDAT", zlib.compress(rows, 6))
+        + chunk(b"IEND", b"")
+    )
+
+
+def png_frames(job):
+    """Writes the frames of one chunk of ticks as PNG files; returns their (file name, delay_cs)."""
+    data, cell, view, playback, start, stop, directory, colors = job
+    written = []
+    for renderer, tick, delay in renderers(Replay.from_bytes(data), cell, view, playback, start, stop):
+        name = f"frame_{tick:06d}.png"
+        with open(os.path.join(directory, name), "wb") as file:
+            file.write(png_bytes(renderer.render(), renderer.width, renderer.height, colors))
+        written.append((name, delay))
+    return written
+
+
+# === Export ===
+def export(
+    replay_path, output, theme="kawaii", cell=CELL_PIXELS, view=VIEW_CELLS, playback=1.0,
+    png=False, workers=1, chunk_ticks=None
+):
+    """
+    Renders a replay file to an animated GIF at `output`, or with png=True to
+    a directory of PNG frames plus frames.txt. Returns a summary dict.
+    By default the ticks are split into one chunk per worker, as every chunk
+    has to re-simulate the game up to its first tick.
+    """
+    with open(replay_path, "rb") as file:
+        data = file.read()
+    replay = Replay.from_bytes(data)
+    colors = palette(theme)
+    ticks = replay.ticks or simulate(replay).tick
+    if chunk_ticks is None:
+        chunk_ticks = -(-(ticks + 1) // workers)
+    starts = range(0, ticks + 1, chunk_ticks)
+
+    if png:
+        os.makedirs(output, exist_ok=True)
+        jobs = [(data, cell, view, playback, start, start + chunk_ticks, output, colors) for start in starts]
+        written = []
+        for chunk in map_jobs(png_frames, jobs, workers):
+            written.extend(chunk)
+        with open(os.path.join(output, "frames.txt"), "w") as file:
+            for name, delay in written:
+                file.write(f"file '{name}'\nduration {delay / 100}\n")
+        frames = len(written)
+    else:
+        jobs = [(data, cell, view, playback, start, start + chunk_ticks) for start in starts]
+        frames = 0
+        with open(output, "wb") as file:
+            for chunk in map_jobs(gif_frames, jobs, workers):
+                if frames == 0:
+                    width, height = frame_size(chunk[0])
+                    file.write(gif_header(width, height, colors))
+                file.write(b"".join(chunk))
+                frames += len(chunk)
+            file.write(b";")
+    return {"replay": replay_path, "output": output, "mode": replay.mode, "frames": frames, "ticks": ticks}
+
+
+def frame_size(frame):
+    """Width and height of a whole first frame produced by gif_frame()."""
+    return struct.unpack_from("<HH", frame, 8 + 5)
+
+
+def map_jobs(function, jobs, workers):
+    """Runs jobs in order, in a process pool if workers > 1, yielding results as they complete in order."""
+    if workers <= 1:
+        yield from map(function, jobs)
+        return
+    with Pool(workers) as pool:
+        yield from pool.imap(function, jobs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render a SNAKE.EXE replay to an animated GIF or PNG frames.")
+    parser.add_argument("replay")
+    parser.add_argument("output", help="GIF file, or directory with --png")
+    parser.add_argument("--theme", choices=list(THEMES), default="kawaii")
+    parser.add_argument("--cell", type=int, default=CELL_PIXELS, help="pixels per board cell")
+    parser.add_argument("--view", type=int, default=VIEW_CELLS, help="widest board, in cells, shown without a camera")
+    parser.add_argument("--playback", type=float, default=1.0, help="speed-up factor")
+    parser.add_argument("--png", action="store_true", help="write a PNG sequence instead of a GIF")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--chunk-ticks", type=int, help="ticks per job (default: split evenly between workers)")
+    args = parser.parse_args()
+    print(json.dumps(export(
+        args.replay, args.output, args.theme, args.cell, args.view, args.playback,
+        args.png, args.workers, args.chunk_ticks
+    )))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,30 +1,29 @@
 """
 food.py – Defines the Food class for SNAKE.EXE.
 
-Handles the creation, styling, and repositioning of food items on the screen.
+Handles the creation, styling, and positioning of food items on the screen,
+drawn as one sprite of the renderer (see render.py).
+Where food appears is decided by the game engine.
 """
 
-from turtle import Turtle
-import random
-
 # === Food Class ===
-class Food(Turtle):
-    def __init__(self, color="deepskyblue"):
+class Food:
+    def __init__(self, renderer, color="deepskyblue", position=(0, 0), shape="triangle", size=0.8):
         """
-        Initialize a Food object with given color and shape.
-        Automatically places the food at a random location.
+        Initialize a Food object with given color and shape at the given position.
         """
-        super().__init__()
-        self.shape("triangle")
-        self.shapesize(stretch_len=0.8, stretch_wid=0.8)
-        self.penup()
-        self.color(color)
-        self.speed("fastest")
-        self.setheading(45)  # Rotate triangle for a cuter look
-        self.refresh()       # Place food at a random location initially
+        self.renderer = renderer
+        self.sprite = renderer.sprite(shape, color, position, size)
+
+    def place(self, position):
+        """Move the food to the position chosen by the engine."""
+        self.renderer.move(self.sprite, position)
+
+    def show(self):
+        self.renderer.show(self.sprite)
+
+    def hide(self):
+        self.renderer.hide(self.sprite)
 
-    def refresh(self):
-        """Reposition the food to a new random location within bounds."""
-        x = random.randint(-260, 260)
-        y = random.randint(-260, 260)
-        self.goto(x, y)
+    def set_color(self, color):
+        self.renderer.set_color(self.sprite, color)
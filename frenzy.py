@@ -0,0 +1,157 @@
+"""
+frenzy.py – Defines the FrenzyEngine class for SNAKE.EXE.
+
+"Feeding frenzy" mode: many food items on the board at once, plus gold and
+slow-down power-ups and static and moving obstacles. Everything on the board
+is stored by cell in an EntityGrid, so finding what the head ran into is an
+O(1) lookup however many entities there are, and spawning uses the engine's
+free-cell index. Each tick the engine lists the cells whose contents changed
+in `entity_changes`, so views only redraw those.
+"""
+
+from engine import (
+    GameEngine, OPPOSITES, MIN_SNAKE_SPEED, FOOD_EATEN, SPECIAL_FOOD_EATEN
+)
+from grid import WALL, UP, DOWN, LEFT, RIGHT
+
+# === Entity Kinds ===
+EMPTY = 0
+FOOD = 1
+GOLD = 2  # starts special mode, like the classic special food
+SLOW = 3  # slows the snake back down
+OBSTACLE = 4
+
+# === Constants ===
+FRENZY_FOOD = 25
+STATIC_OBSTACLES = 20
+MOVING_OBSTACLES = 6
+MAX_POWER_UPS = 3
+POWER_UP_CHANCE = 0.15  # per food eaten
+SLOW_DOWN = 0.02  # seconds added to the tick length by a SLOW power-up
+OBSTACLES_MOVE_EVERY = 3  # ticks
+SAFE_ZONE = 6  # cells ahead of the starting head kept clear of obstacles
+FRENZY_STAGES = ("move", "move_obstacles", "handle_pickups", "handle_special_mode_expiry")
+
+# === Events ===
+POWER_UP_EATEN = "power_up_eaten"
+HIT_OBSTACLE = "hit_obstacle"
+
+
+# === EntityGrid Class ===
+class EntityGrid:
+    def __init__(self, size):
+        """Entity kind per board cell, with a running count of each kind."""
+        self.kinds = bytearray(size)
+        self.counts = [0] * (OBSTACLE + 1)
+
+    def place(self, cell, kind):
+        self.kinds[cell] = kind
+        self.counts[kind] += 1
+
+    def remove(self, cell):
+        """Empty a cell and return the kind of entity that was there."""
+        kind = self.kinds[cell]
+        self.kinds[cell] = EMPTY
+        self.counts[kind] -= 1
+        return kind
+
+
+# === FrenzyEngine Class ===
+class FrenzyEngine(GameEngine):
+    stage_names = FRENZY_STAGES
+
+    def __init__(self, difficulty="medium", seed=None, **rules):
+        """Start a frenzy game: the regular food is replaced by many entities."""
+        super().__init__(difficulty, seed, **rules)
+        self.free_cells.add(self.food)
+        self.food = None  # classic single food isn't used in this mode
+        self.entities = EntityGrid(self.grid.size)
+        self.entity_changes = []
+        self.moving_obstacles = []  # [cell, heading] pairs
+
+        head = self.body[0]
+        safe = {head}
+        for _ in range(SAFE_ZONE):
+            head = self.grid.neighbors[RIGHT][head]
+            if head == WALL:
+                break
+            safe.add(head)
+        for cell in safe:
+            self.free_cells.remove(cell)
+        for _ in range(STATIC_OBSTACLES):
+            self.spawn(OBSTACLE)
+        for _ in range(MOVING_OBSTACLES):
+            cell = self.spawn(OBSTACLE)
+            if cell is not None:
+                self.moving_obstacles.append([cell, self.rng.choice((UP, DOWN, LEFT, RIGHT))])
+        for cell in safe:
+            if not self.occupied[cell]:
+                self.free_cells.add(cell)
+        for _ in range(FRENZY_FOOD):
+            self.spawn(FOOD)
+
+    def spawn(self, kind):
+        """Put an entity of `kind` on a random empty cell; returns the cell or None if full."""
+        cell = self.place_item()
+        if cell is not None:
+            self.entities.place(cell, kind)
+            self.entity_changes.append((cell, kind))
+        return cell
+
+    def begin_tick(self, action=None):
+        self.entity_changes.clear()
+        super().begin_tick(action)
+
+    # === Stages ===
+    def move(self, events):
+        """Like the classic move, but running into an obstacle also ends the game."""
+        cell = self.grid.neighbors[self.heading][self.body[0]]
+        if cell != WALL and self.entities.kinds[cell] == OBSTACLE:
+            self.end(HIT_OBSTACLE, events)
+            return
+        super().move(events)
+
+    def move_obstacles(self, events):
+        """Every few ticks, moving obstacles step forward, turning back when blocked."""
+        if self.tick % OBSTACLES_MOVE_EVERY:
+            return
+        kinds = self.entities.kinds
+        for obstacle in self.moving_obstacles:
+            cell, heading = obstacle
+            target = self.grid.neighbors[heading][cell]
+            if target == WALL or self.occupied[target] or kinds[target] != EMPTY:
+                obstacle[1] = OPPOSITES[heading]
+                continue
+            self.entities.remove(cell)
+            self.free_cells.add(cell)
+            self.free_cells.remove(target)
+            self.entities.place(target, OBSTACLE)
+            self.entity_changes.append((cell, EMPTY))
+            self.entity_changes.append((target, OBSTACLE))
+            obstacle[0] = target
+
+    def handle_pickups(self, events):
+        """Applies whatever entity is in the head's cell: food, gold or slow-down."""
+        head = self.body[0]
+        if self.entities.kinds[head] == EMPTY:
+            return
+        kind = self.entities.remove(head)
+        self.entity_changes.append((head, EMPTY))
+        if kind == FOOD:
+            self.grow_pending += 1
+            self.score += 2 if self.double_points else 1
+            events.append(FOOD_EATEN)
+            self.spawn(FOOD)
+            if self.speed > MIN_SNAKE_SPEED:
+                self.speed -= self.speed_step
+            power_ups = self.entities.counts[GOLD] + self.entities.counts[SLOW]
+            if power_ups < MAX_POWER_UPS and self.rng.random() < POWER_UP_CHANCE:
+                self.spawn(self.rng.choice((GOLD, SLOW)))
+        elif kind == GOLD:
+            self.special_mode = True
+            self.special_mode_timer = self.now
+            self.double_points = True
+            events.append(SPECIAL_FOOD_EATEN)
+        elif kind == SLOW:
+            self.speed = min(self.speed + SLOW_DOWN, self.start_speed)  # Never slower than the game began
+            events.append(POWER_UP_EATEN)
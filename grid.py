@@ -0,0 +1,108 @@
+"""
+grid.py – Defines the Grid class for SNAKE.EXE.
+
+The snake always moves MOVE_DISTANCE pixels at a time inside a square board, so
+every position it can reach falls on a discrete grid of cells. Cells are
+numbered row by row from the bottom-left corner, which lets the engine keep
+board state in flat arrays and answer "what is in this cell?" in O(1).
+"""
+
+# === Constants ===
+UP = 90
+DOWN = 270
+LEFT = 180
+RIGHT = 0
+WALL = -1  # neighbor value for moves that leave the board
+
+# Directions numbered anticlockwise from RIGHT, so (code + 2) % 4 is the reverse.
+# Used as 2-bit codes in replays and as discrete actions for agents.
+DIRECTIONS = [RIGHT, UP, LEFT, DOWN]
+DIRECTION_CODES = {heading: code for code, heading in enumerate(DIRECTIONS)}
+
+
+# === Grid Class ===
+class Grid:
+    def __init__(self, cols, rows, cell_size=20):
+        """Create a cols x rows board of cell_size-pixel cells centred on (0, 0)."""
+        self.cols = cols
+        self.rows = rows
+        self.cell_size = cell_size
+        self.size = cols * rows
+        self.left = -(cols // 2) * cell_size
+        self.bottom = -(rows // 2) * cell_size
+        self.neighbors = {
+            heading: [self._neighbor(cell, heading) for cell in range(self.size)]
+            for heading in (UP, DOWN, LEFT, RIGHT)
+        }
+
+    def _neighbor(self, cell, heading):
+        """The cell next to `cell` in the given direction, or WALL at the edge."""
+        col, row = cell % self.cols, cell // self.cols
+        if heading == UP:
+            row += 1
+        elif heading == DOWN:
+            row -= 1
+        elif heading == LEFT:
+            col -= 1
+        else:
+            col += 1
+        if 0 <= col < self.cols and 0 <= row < self.rows:
+            return row * self.cols + col
+        return WALL
+
+    def cell(self, position):
+        """The cell containing a pixel position, or WALL if it is off the board."""
+        col = round((position[0] - self.left) / self.cell_size)
+        row = round((position[1] - self.bottom) / self.cell_size)
+        if 0 <= col < self.cols and 0 <= row < self.rows:
+            return row * self.cols + col
+        return WALL
+
+    def position(self, cell):
+        """The pixel position of a cell's centre."""
+        return (
+            self.left + (cell % self.cols) * self.cell_size,
+            self.bottom + (cell // self.cols) * self.cell_size
+        )
+
+
+# === FreeCells Class ===
+class FreeCells:
+    def __init__(self, size):
+        """
+        An indexable set of the empty cells on a board of `size` cells.
+        Cells live in a dense list with a reverse index, so add, remove
+        (swap with the last entry and pop) and uniform sampling are all O(1),
+        even when only a handful of free cells are left.
+        """
+        self.cells = list(range(size))
+        self.index = list(range(size))  # position of each cell in self.cells, or -1
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __contains__(self, cell):
+        return self.index[cell] != -1
+
+    def add(self, cell):
+        """Mark a cell as empty again."""
+        if self.index[cell] == -1:
+            self.index[cell] = len(self.cells)
+            self.cells.append(cell)
+
+    def remove(self, cell):
+        """Mark a cell as taken, if it was free."""
+        i = self.index[cell]
+        if i == -1:
+            return
+        last = self.cells.pop()
+        if last != cell:
+            self.cells[i] = last
+            self.index[last] = i
+        self.index[cell] = -1
+
+    def sample(self, rng):
+        """A uniformly random free cell, or None if the board is full."""
+        if not self.cells:
+            return None
+        return self.cells[rng.randrange(len(self.cells))]
@@ -0,0 +1,108 @@
+"""
+highscores.py – Defines the HighScoreStore class for SNAKE.EXE.
+
+Keeps a top-N leaderboard per "difficulty/theme" board in high_scores.json
+(prefixed with the mode, e.g. "frenzy/easy/kawaii", for modes other than classic).
+Every save writes a temporary file, fsyncs it and renames it over the old one
+(on a BackgroundWriter thread, if the store has one), so a crash or power cut
+mid-write leaves either the old or the new leaderboard on disk, never an
+empty file. Each board's entries are kept sorted by score
+under their board key, so leaderboard queries are a dict lookup plus a slice.
+A score from the old single-integer high_score.txt is migrated on first load.
+"""
+
+import bisect
+import json
+import os
+import time
+
+from persistence import atomic_write
+
+# === Constants ===
+STORE_PATH = "high_scores.json"
+LEGACY_PATH = "high_score.txt"
+LEGACY_BOARD = "legacy"
+TOP_N = 10
+VERSION = 1
+
+
+# === HighScoreStore Class ===
+class HighScoreStore:
+    def __init__(self, path=STORE_PATH, legacy_path=LEGACY_PATH, top_n=TOP_N, writer=None):
+        """Loads the leaderboards from disk, migrating the legacy high score if needed."""
+        self.path = path
+        self.writer = writer
+        self.legacy_path = legacy_path
+        self.top_n = top_n
+        self.boards = {}  # board key -> entries, best first
+        self.load()
+
+    @staticmethod
+    def board_key(difficulty, theme, mode="classic"):
+        key = f"{difficulty}/{theme}"
+        return key if mode == "classic" else f"{mode}/{key}"
+
+    # === Persistence ===
+    def load(self):
+        try:
+            with open(self.path) as file:
+                data = json.load(file)
+            self.boards = {key: list(entries) for key, entries in data["boards"].items()}
+        except FileNotFoundError:
+            self.migrate_legacy()
+        except (ValueError, KeyError, AttributeError, TypeError):
+            # Unreadable store (e.g. edited by hand): keep it for inspection and start afresh
+            os.replace(self.path, self.path + ".corrupt")
+            self.migrate_legacy()
+
+    def migrate_legacy(self):
+        """Carries the score from the old high_score.txt over as its own board."""
+        try:
+            with open(self.legacy_path) as file:
+                score = int(file.read())
+        except (FileNotFoundError, ValueError):
+            return
+        if score > 0:
+            self.boards[LEGACY_BOARD] = [self.entry(score, 0, None, os.path.getmtime(self.legacy_path))]
+
+    def save(self):
+        """Writes a snapshot of the leaderboards, in the background if there is a writer."""
+        text = json.dumps({"version": VERSION, "boards": self.boards}, indent=1)
+        if self.writer is None:
+            atomic_write(self.path, text)
+        else:
+            self.writer.write(self.path, text)
+
+    # === Queries ===
+    def top(self, difficulty, theme, n=None, mode="classic"):
+        """The best `n` (default: all kept) entries for one mode/difficulty/theme board."""
+        return self.boards.get(self.board_key(difficulty, theme, mode), [])[:n]
+
+    def qualifies(self, difficulty, theme, score, mode="classic"):
+        """Whether a game with this score would make its board's leaderboard."""
+        entries = self.boards.get(self.board_key(difficulty, theme, mode), [])
+        return score > 0 and (len(entries) < self.top_n or score > entries[-1]["score"])
+
+    def best_score(self):
+        """The highest score on any board, shown as the HIGH SCORE."""
+        return max((entries[0]["score"] for entries in self.boards.values() if entries), default=0)
+
+    # === Updates ===
+    @staticmethod
+    def entry(score, length, replay, timestamp):
+        return {"score": score, "length": length, "replay": replay, "timestamp": timestamp}
+
+    def record(self, difficulty, theme, score, length, replay=None, timestamp=None, mode="classic"):
+        """
+        Adds a finished game to its board's leaderboard and saves if it placed.
+        Returns the 1-based rank it reached, or None if it didn't make the top N.
+        """
+        if not self.qualifies(difficulty, theme, score, mode):
+            return None
+        entries = self.boards.setdefault(self.board_key(difficulty, theme, mode), [])
+        # Entries are sorted by descending score; ties keep the earlier game first
+        rank = bisect.bisect_right([-entry["score"] for entry in entries], -score)
+        entries.insert(rank, self.entry(score, length, replay, timestamp or time.time()))
+        del entries[self.top_n:]
+        self.save()
+        return rank + 1
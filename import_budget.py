@@ -0,0 +1,74 @@
+"""
+import_budget.py – Import-time budget for SNAKE.EXE.
+
+Imports a module (main by default) in fresh interpreters under
+`python -X importtime`, keeps the fastest of several runs, and checks its
+cumulative import time against a budget. Importing main opens no window and
+does not touch pygame or the sound files (see main.py and audio.py), so this
+is the time spent before the window can be created. The slowest modules are
+listed to show where the budget goes.
+
+Usage:
+    python import_budget.py --budget-ms 200 --runs 5 --top 10
+prints JSON and exits with status 1 if the budget is exceeded.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+# === Constants ===
+BUDGET_MS = 200
+RUNS = 5
+TOP = 10
+
+
+def measure(module):
+    """One cold import of `module`: {imported module: (self_us, cumulative_us)}."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True
+    )
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # the column header
+        name = fields[2].strip()
+        timings[name] = (int(fields[0]), int(fields[1]))
+    return timings
+
+
+def run(module="main", runs=RUNS, top=TOP, budget_ms=BUDGET_MS):
+    """Measures `runs` imports and summarizes the fastest one against the budget."""
+    best = min((measure(module) for _ in range(runs)), key=lambda timings: timings[module][1])
+    total_ms = best[module][1] / 1000
+    slowest = sorted(best.items(), key=lambda item: item[1][0], reverse=True)[:top]
+    return {
+        "module": module,
+        "runs": runs,
+        "cumulative_ms": round(total_ms, 1),
+        "budget_ms": budget_ms,
+        "within_budget": total_ms <= budget_ms,
+        "slowest_self_ms": {name: round(self_us / 1000, 2) for name, (self_us, _) in slowest}
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the import time of SNAKE.EXE against a budget.")
+    parser.add_argument("--module", default="main")
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=RUNS)
+    parser.add_argument("--top", type=int, default=TOP)
+    args = parser.parse_args()
+
+    report = run(args.module, args.runs, args.top, args.budget_ms)
+    print(json.dumps(report, indent=2))
+    sys.exit(0 if report["within_budget"] else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+inputs.py – Defines the InputQueue class for SNAKE.EXE.
+
+Key presses arrive whenever Tk delivers them, but the engine turns at most
+once per tick. InputQueue buffers direction commands with the time they were
+pressed, so two quick presses inside one tick (Up then Left while moving
+Right) become two turns on consecutive ticks instead of the first being lost
+or the second reversing the snake into itself. Each command is checked
+against the direction it will actually follow, and the queue is bounded and
+drops commands that have waited too long, so mashed keys can't build up lag.
+"""
+
+import time
+from collections import deque
+
+from engine import OPPOSITES
+
+# === Constants ===
+MAX_QUEUED_INPUTS = 3
+MAX_INPUT_AGE = 0.5  # seconds a command may wait for its tick
+
+
+# === InputQueue Class ===
+class InputQueue:
+    def __init__(self, max_size=MAX_QUEUED_INPUTS, max_age=MAX_INPUT_AGE, clock=time.perf_counter):
+        """An empty queue of (timestamp, heading) commands."""
+        self.commands = deque()
+        self.max_size = max_size
+        self.max_age = max_age
+        self.clock = clock
+
+    def __len__(self):
+        return len(self.commands)
+
+    def clear(self):
+        self.commands.clear()
+
+    def push(self, heading, current):
+        """
+        Queues a turn towards `heading`, given the snake's `current` heading.
+        The command is dropped if the queue is full, or if it would not change the
+        direction queued before it (or `current`) or would reverse it.
+        Returns True if it was queued.
+        """
+        previous = self.commands[-1][1] if self.commands else current
+        if len(self.commands) >= self.max_size or heading in (previous, OPPOSITES[previous]):
+            return False
+        self.commands.append((self.clock(), heading))
+        return True
+
+    def pop(self, current):
+        """
+        Takes the command for the next tick: the oldest one that isn't stale and is
+        a valid turn from `current`, the heading last applied. Returns None if there is none.
+        """
+        oldest = self.clock() - self.max_age
+        while self.commands:
+            timestamp, heading = self.commands.popleft()
+            if timestamp >= oldest and heading not in (current, OPPOSITES[current]):
+                return heading
+        return None
@@ -1,186 +1,203 @@
 """
 Main file for Snake.EXE – a themed, animated Snake game built with Python's turtle module.
 Features: custom themes, difficulty selection, sound effects, special food, glowing snake mode, and replay menu.
+Left idle on the start menu, it plays demo games by itself (attract mode, see autopilot.py).
+
+Importing this module has no side effects: run it as a script to play. The
+window and menu come up first; pygame and the sound effects load on a
+background thread afterwards (see audio.py).
 """
 
 # === Imports ===
-from turtle import Screen, Turtle
+from turtle import Screen
 from snake import Snake
 from food import Food
-from scoreboard import Scoreboard
-from playsound import playsound
-import pygame
+from scoreboard import Scoreboard, HudText
+from engine import (
+    STAGES, UP, DOWN, LEFT, RIGHT,
+    FOOD_EATEN, SPECIAL_FOOD_SPAWNED, SPECIAL_FOOD_EATEN, SPECIAL_FOOD_EXPIRED,
+    SPECIAL_MODE_ENDED
+)
+from frenzy import FRENZY_STAGES, POWER_UP_EATEN
+from modes import MODES
+from sprites import EntityLayer, WorldView
+from render import create_renderer
+from world import Camera, view_cells
+from themes import THEMES
+from replay import Replay
+from inputs import InputQueue
+from autopilot import Autopilot
+from highscores import HighScoreStore
+from persistence import get_writer
+from profiler import FrameProfiler, is_enabled as profiling_enabled, is_tracing
+import audio
+import telemetry
+import os
 import time
-import random
-
-# === Initialize Pygame for background music ===
-pygame.mixer.init()
 
 # === Screen Setup ===
-screen = Screen()
 SCREEN_WIDTH = 600
 SCREEN_HEIGHT = 600
-screen.setup(width=SCREEN_WIDTH, height=SCREEN_HEIGHT)
-screen.title("SNAKE.EXE")
-screen.tracer(0)
-
-# === Constants ===
-FOOD_EAT_DISTANCE = 15
-SPECIAL_FOOD_APPEARS_EVERY = 5
-SPECIAL_MODE_DURATION = 10  # seconds
-MIN_SNAKE_SPEED = 0.04
-SNAKE_SPEED_STEP = 0.005
-WALL_LIMIT = 280
-COLLISION_DISTANCE = 10
+screen = None  # created by setup()
+
+# === Renderer (--renderer canvas|turtle, see render.py) ===
+# Kept for the whole session: the screen is never cleared, so games and replays
+# recycle the same sprites and HUD fields instead of creating new ones.
+renderer = None
+bound_keys = []
+
+# === Game Loop Timing ===
+FRAME_INTERVAL_MS = 16  # how often the screen is redrawn (~60 FPS)
+MAX_TICKS_PER_FRAME = 5  # catch-up limit after a stall, so the loop never spirals
+REPLAY_DIR = "replays"
+REPLAY_PATH = os.path.join(REPLAY_DIR, "last_game.snkr")
+
+# === Persistence (written on a background thread) ===
+writer = None
+high_score_store = None
+
+# === Optional Profiling (--profile or SNAKE_PROFILE=1) ===
+profiler = None
+
+# === Gameplay Telemetry (off with --no-telemetry or SNAKE_TELEMETRY=0) ===
+event_bus = None
 
 # === Global Music Functions ===
 def play_sound(filename):
-    """Play a short sound effect (non-blocking)."""
-    playsound(f"sounds/{filename}", block=False)
+    """Play a short preloaded sound effect (non-blocking)."""
+    audio.play_sound(filename)
 
 def play_menu_music():
     """Play looping menu background music."""
-    pygame.mixer.music.load("sounds/menu_theme.mp3")
-    pygame.mixer.music.play(-1)
+    audio.play_music("sounds/menu_theme.mp3")
 
 def play_game_music():
     """Play looping in-game background music."""
-    pygame.mixer.music.load("sounds/game_theme.wav")
-    pygame.mixer.music.play(-1)
+    audio.play_music("sounds/game_theme.wav")
 
 def stop_music():
     """Stop all currently playing music."""
-    pygame.mixer.music.stop()
+    audio.stop_music()
 
 # === Game State Variables ===
 theme = None
 difficulty = None
-snake_speed = 0.1
-last_special_food_score = 0
-spawn_special_food = False
-special_mode = False
-special_food_timer = 0
-special_mode_timer = 0
+input_queue = InputQueue()
+snake = None
+food = None
+special_food = None
+scoreboard = None
+entity_layer = None
+world_view = None
+profiler_overlay = None
+last_frame_time = 0
+tick_accumulator = 0
+
+# === Attract Mode (a demo game on autopilot after the start menu has been idle) ===
+ATTRACT_DELAY_MS = 20000
+ATTRACT_DIFFICULTY = "medium"
+ATTRACT_THEME = "arcade"
+ATTRACT_LAYER = "attract"
+ATTRACT_EXIT_KEYS = ("Up", "Down", "Left", "Right", "Return", "space", "m")
+attract_mode = False
+autopilot = Autopilot()
+idle_generation = 0  # bumped to cancel a pending switch to attract mode
+frame_generation = 0  # bumped to stop the running game's frame loop
 
 # === Replay Menu State ===
 replay_menu_stage = 0
 replay_options = ["Replay", "Quit"]
-replay_turtle = Turtle()
-replay_turtle.hideturtle()
-replay_turtle.penup()
+REPLAY_MENU_LAYER = "replay_menu"
 
-# === UI Turtles for Start Menu ===
-title_turtle = Turtle()
-difficulty_turtle = Turtle()
-theme_turtle = Turtle()
-start_turtle = Turtle()
-hint_turtle = Turtle()
+# === Renderer Layers for the Start Menu ===
+TITLE_LAYER = "title"
+HINT_LAYER = "hint"
+DIFFICULTY_LAYER = "difficulty"
+THEME_LAYER = "theme"
+MODE_LAYER = "mode"
+START_LAYER = "start"
+MENU_LAYERS = [TITLE_LAYER, HINT_LAYER, DIFFICULTY_LAYER, THEME_LAYER, MODE_LAYER, START_LAYER]
 
 # === Menu Navigation State ===
 menu_stage = "difficulty"
 difficulty_options = ["easy", "medium", "hard"]
 theme_options = ["kawaii", "arcade"]
+mode_options = list(MODES)
 difficulty_index = 0
 theme_index = 0
+mode_index = 0
 difficulty_locked = False
 theme_locked = False
 
-# === Theme Settings ===
-themes = {
-    "arcade": {
-        "bg": "light cyan",
-        "snake_color": "#FF69B4",
-        "food_color": "deepskyblue",
-        "text_color": "deeppink"
-    },
-    "kawaii": {
-        "bg": "mintcream",
-        "snake_color": "light pink",
-        "food_color": "violet",
-        "text_color": "plum"
-    }
-}
-
-def get_difficulty_speed():
-    """Returns the snake speed based on selected difficulty."""
-    return {
-        "easy": 0.15,
-        "medium": 0.1,
-        "hard": 0.06
-    }[difficulty]
-
 # === Start Menu Drawing Functions ===
 
 def draw_start_screen():
     """Initializes the start screen with title, hints, and selection options."""
-    screen.clear()
-    screen.bgcolor("black")
-    for t in [title_turtle, difficulty_turtle, theme_turtle, start_turtle, hint_turtle]:
-        t.clear()
-        t.hideturtle()
-        t.penup()
-        t.speed(0)
-
-    title_turtle.color("white")
-    title_turtle.goto(0, 180)
-    title_turtle.write("✨ SNAKE.EXE ✨", align="center", font=("Courier", 28, "bold"))
-
-    hint_turtle.color("gray")
-    hint_turtle.goto(0, 140)
-    hint_turtle.write("Use ⬅️ ➡️ to navigate, ENTER to select", align="center", font=("Courier", 12, "normal"))
+    release_views()
+    renderer.clear(REPLAY_MENU_LAYER)
+    if scoreboard is not None:
+        scoreboard.hide_all()
+    renderer.background("black")
+    for layer in MENU_LAYERS:
+        renderer.clear(layer)
+
+    renderer.write(TITLE_LAYER, (0, 180), "✨ SNAKE.EXE ✨", "white", ("Courier", 28, "bold"))
+    renderer.write(
+        HINT_LAYER, (0, 140), "Use ⬅️ ➡️ to navigate, ENTER to select", "gray", ("Courier", 12, "normal")
+    )
 
     draw_difficulty_options()
     draw_theme_options()
+    draw_mode_option()
     draw_start_prompt()
+    refresh_screen()
 
 def draw_difficulty_options():
     """Draws difficulty selection options and highlights the current choice."""
-    difficulty_turtle.clear()
+    renderer.clear(DIFFICULTY_LAYER)
     y = 100
     spacing = 170
-    difficulty_turtle.color("white")
-    difficulty_turtle.goto(0, y)
-    difficulty_turtle.write("Select Difficulty", align="center", font=("Courier", 16, "underline"))
+    renderer.write(DIFFICULTY_LAYER, (0, y), "Select Difficulty", "white", ("Courier", 16, "underline"))
     y -= 30
     for i, label in enumerate(["1 - Easy", "2 - Medium", "3 - Hard"]):
         x = -spacing + i * spacing
-        difficulty_turtle.goto(x, y)
         prefix = "▶ " if i == difficulty_index else ""
         color = (
             "green" if difficulty_locked and difficulty_options[i] == difficulty
             else "yellow" if i == difficulty_index
             else "white"
         )
-        difficulty_turtle.color(color)
-        difficulty_turtle.write(f"{prefix}{label}", align="center", font=("Courier", 14, "bold"))
+        renderer.write(DIFFICULTY_LAYER, (x, y), f"{prefix}{label}", color, ("Courier", 14, "bold"))
 
 def draw_theme_options():
     """Draws theme selection options and highlights the current choice."""
-    theme_turtle.clear()
+    renderer.clear(THEME_LAYER)
     y = 0
-    theme_turtle.color("white")
-    theme_turtle.goto(0, y)
-    theme_turtle.write("Select Theme", align="center", font=("Courier", 16, "underline"))
+    renderer.write(THEME_LAYER, (0, y), "Select Theme", "white", ("Courier", 16, "underline"))
     y -= 30
     theme_positions = [(-160, "K - Pastel Kawaii"), (160, "A - Arcade 90s")]
     for i, (x, label) in enumerate(theme_positions):
-        theme_turtle.goto(x, y)
         prefix = "▶ " if i == theme_index else ""
         color = (
             "magenta" if theme_locked and theme_options[i] == theme
             else "cyan" if i == theme_index
             else "white"
         )
-        theme_turtle.color(color)
-        theme_turtle.write(f"{prefix}{label}", align="center", font=("Courier", 14, "bold"))
+        renderer.write(THEME_LAYER, (x, y), f"{prefix}{label}", color, ("Courier", 14, "bold"))
+
+def draw_mode_option():
+    """Draws the current game mode, which M toggles at any point before starting."""
+    renderer.clear(MODE_LAYER)
+    renderer.write(
+        MODE_LAYER, (0, -85), f"M - Mode: {mode_options[mode_index].title()}",
+        "orange" if mode_options[mode_index] == "frenzy" else "white", ("Courier", 14, "bold")
+    )
 
 def draw_start_prompt():
     """Draws the prompt to start the game when both difficulty and theme are selected."""
-    start_turtle.clear()
+    renderer.clear(START_LAYER)
     if difficulty_locked and theme_locked:
-        start_turtle.color("cyan")
-        start_turtle.goto(0, -140)
-        start_turtle.write("Press SPACE to Start", align="center", font=("Courier", 16, "bold"))
+        renderer.write(START_LAYER, (0, -140), "Press SPACE to Start", "cyan", ("Courier", 16, "bold"))
 
 # === Menu Navigation Functions ===
 
@@ -208,19 +225,31 @@ def navigate_right():
         play_sound("select.wav")
         draw_theme_options()
 
+def toggle_mode():
+    """Switches to the next game mode (classic, frenzy or world)."""
+    global mode_index
+    mode_index = (mode_index + 1) % len(mode_options)
+    if event_bus is not None:
+        event_bus.menu_selected("mode", mode_options[mode_index])
+    play_sound("select.wav")
+    draw_mode_option()
+
 def confirm_selection():
     """Locks in selected difficulty and theme when ENTER is pressed."""
-    global difficulty_locked, theme_locked, difficulty, theme, menu_stage, snake_speed
+    global difficulty_locked, theme_locked, difficulty, theme, menu_stage
     if menu_stage == "difficulty" and not difficulty_locked:
         difficulty_locked = True
         difficulty = difficulty_options[difficulty_index]
-        snake_speed = get_difficulty_speed()
+        if event_bus is not None:
+            event_bus.menu_selected("difficulty", difficulty)
         play_sound("select.wav")
         draw_difficulty_options()
         menu_stage = "theme"
     elif menu_stage == "theme" and not theme_locked:
         theme_locked = True
         theme = theme_options[theme_index]
+        if event_bus is not None:
+            event_bus.menu_selected("theme", theme)
         play_sound("select.wav")
         draw_theme_options()
         draw_start_prompt()
@@ -229,23 +258,21 @@ def try_start_game():
     """Starts the game when SPACE is pressed and both selections are confirmed."""
     if difficulty_locked and theme_locked:
         play_sound("select.wav")
-        for t in [title_turtle, difficulty_turtle, theme_turtle, start_turtle, hint_turtle]:
-            t.clear()
+        for layer in MENU_LAYERS:
+            renderer.clear(layer)
         play_game()
 
 # === Replay Menu Drawing and Controls ===
 
 def draw_replay_menu():
     """Draws the replay menu with options to Replay or Quit after game over."""
-    replay_turtle.clear()
-    replay_turtle.color(themes[theme]["text_color"])
+    renderer.clear(REPLAY_MENU_LAYER)
     y = -60
     positions = [(-100, "Replay"), (100, "Quit")]
     for i, (x, label) in enumerate(positions):
-        replay_turtle.goto(x, y)
         text = f"> {label}" if i == replay_menu_stage else label
         font = ("Courier", 16, "bold") if i == replay_menu_stage else ("Courier", 14, "normal")
-        replay_turtle.write(text, align="center", font=font)
+        renderer.write(REPLAY_MENU_LAYER, (x, y), text, THEMES[theme]["text_color"], font)
 
 def replay_left():
     """Handles left arrow key in the replay menu."""
@@ -273,146 +300,296 @@ def replay_confirm():
         stop_music()
         screen.bye()
 
+# === Attract Mode ===
+
+def schedule_attract():
+    """(Re)starts the countdown after which an idle start menu switches to attract mode."""
+    global idle_generation
+    idle_generation += 1
+    generation = idle_generation
+    screen.ontimer(lambda: start_attract(generation), ATTRACT_DELAY_MS)
+
+def menu_key(function):
+    """Wraps a start menu key handler so that every key press restarts the idle countdown."""
+    def handler():
+        schedule_attract()
+        function()
+    return handler
+
+def start_attract(generation):
+    """Starts a demo game on autopilot, unless a key was pressed since the countdown began."""
+    global attract_mode, theme, difficulty, mode_index
+    if generation != idle_generation:
+        return
+    attract_mode = True
+    theme = ATTRACT_THEME
+    difficulty = ATTRACT_DIFFICULTY
+    mode_index = mode_options.index("classic")
+    for layer in MENU_LAYERS:
+        renderer.clear(layer)
+    play_game()
+    renderer.write(
+        ATTRACT_LAYER, (0, -280), "DEMO - press any key to play",
+        THEMES[theme]["text_color"], ("Courier", 14, "bold")
+    )
+    bind_keys({key: stop_attract for key in ATTRACT_EXIT_KEYS})
+
+def stop_attract():
+    """Ends the demo game, without recording it, and returns to a fresh start menu."""
+    global attract_mode, frame_generation
+    attract_mode = False
+    frame_generation += 1
+    renderer.clear(ATTRACT_LAYER)
+    stop_music()
+    reset_state()
+    main()
+
+# === Screen and Key Management ===
+
+def bind_keys(bindings):
+    """Replaces the current key bindings with `bindings` (key -> function)."""
+    for key in bound_keys:
+        screen.onkey(None, key)
+    bound_keys[:] = bindings
+    for key, function in bindings.items():
+        screen.onkey(function, key)
+    screen.listen()
+
+def release_views():
+    """Hides the last game's views and returns their sprites to the renderer's pool."""
+    global entity_layer, world_view
+    if snake is not None:
+        snake.release()
+    if entity_layer is not None:
+        entity_layer.release()
+        entity_layer = None
+    if world_view is not None:
+        world_view.release()
+        world_view = None
+    for item in (food, special_food):
+        if item is not None:
+            item.hide()
+
+def refresh_screen():
+    """Draws the frame through the renderer, once per frame."""
+    renderer.present()
+
 # === Core Game Mechanics ===
 
-def spawn_special_food_if_needed():
-    """
-    Spawns special (gold) food every N points, if it hasn't already spawned for that score.
-    """
-    global spawn_special_food, special_food_timer, last_special_food_score
-    if (
-        scoreboard.score != 0
-        and scoreboard.score % SPECIAL_FOOD_APPEARS_EVERY == 0
-        and scoreboard.score != last_special_food_score
-    ):
-        spawn_special_food = True
-        special_food_timer = time.time()
-        special_food.goto(random.randint(-260, 260), random.randint(-260, 260))
-        special_food.showturtle()
-        last_special_food_score = scoreboard.score
-
-def handle_special_food():
+def steer(heading):
+    """Queues a direction change; the engine takes one per tick (see inputs.py)."""
+    input_queue.push(heading, engine.heading)
+
+def handle_events(events):
     """
-    Handles glowing special food appearance, timing, and activation of special mode.
+    Updates the views, sounds and music to match the events of one engine tick.
     """
-    global spawn_special_food, special_mode, special_mode_timer
-    if spawn_special_food:
-        if int(time.time() * 2) % 2 == 0:
-            special_food.showturtle()
+    if world_view is not None:
+        world_view.update()  # Draws the snake, food and glow itself, through its camera
+    elif not engine.game_over:
+        if engine.freed_cell is None:
+            snake.extend(engine.head_position)
         else:
-            special_food.hideturtle()
-
-        if snake.head.distance(special_food) < FOOD_EAT_DISTANCE:
-            special_food.hideturtle()
-            spawn_special_food = False
-            special_mode = True
-            special_mode_timer = time.time()
-            scoreboard.activate_double_points()
-            snake.set_glow()
+            snake.move(engine.head_position)
+    if entity_layer is not None:
+        entity_layer.apply(engine.entity_changes)
+    for event in events:
+        if event == FOOD_EATEN:
+            if world_view is None:
+                if engine.food is None:
+                    food.hide()  # The snake fills the whole board
+                else:
+                    food.place(engine.position(engine.food))
+            play_sound("food.wav")
+            scoreboard.set_score(engine.score)
+        elif event == SPECIAL_FOOD_SPAWNED and world_view is None:
+            special_food.place(engine.position(engine.special_food))
+            special_food.show()
+        elif event == SPECIAL_FOOD_EATEN:
+            if world_view is None:
+                special_food.hide()
+                snake.set_glow()
             play_sound("special_mode.mp3")
-
-        elif time.time() - special_food_timer > 5:
-            special_food.hideturtle()
-            spawn_special_food = False
-
-def handle_special_mode_expiry():
+        elif event == SPECIAL_FOOD_EXPIRED and world_view is None:
+            special_food.hide()
+        elif event == POWER_UP_EATEN:
+            play_sound("select.wav")
+        elif event == SPECIAL_MODE_ENDED:
+            if world_view is None:
+                snake.reset_color()
+            scoreboard.hide_special_mode()
+
+def animate_special_food():
     """
-    Ends the glowing snake special mode after a set duration.
+    Flashes the glowing special food and refreshes the special mode countdown.
     """
-    global special_mode
-    if special_mode:
-        seconds_left = SPECIAL_MODE_DURATION - int(time.time() - special_mode_timer)
-        scoreboard.update_score()
-        scoreboard.show_special_mode(seconds_left)
-        if seconds_left <= 0:
-            special_mode = False
-            scoreboard.deactivate_double_points()
-            snake.reset_color()
-            scoreboard.update_score()
-
-def handle_regular_food():
-    """
-    Handles regular food: refresh, grow snake, score, speed, and special food trigger.
-    """
-    global snake_speed, spawn_special_food
-    if snake.head.distance(food) < FOOD_EAT_DISTANCE:
-        food.refresh()
-        snake.extend()
-        play_sound("food.wav")
-        scoreboard.increase_score()
-        spawn_special_food_if_needed()
-
-        if spawn_special_food and scoreboard.score % SPECIAL_FOOD_APPEARS_EVERY != 0:
-            special_food.hideturtle()
-            spawn_special_food = False
-
-        if snake_speed > MIN_SNAKE_SPEED:
-            snake_speed -= SNAKE_SPEED_STEP
+    if engine.special_food is not None:
+        shown = int(engine.now * 2) % 2 == 0
+        if world_view is not None:
+            world_view.show_special_food(shown)
+        elif shown:
+            special_food.show()
+        else:
+            special_food.hide()
+    if engine.special_mode:
+        scoreboard.show_special_mode(engine.seconds_left)
 
 # === Main Game Loop ===
 
 def play_game():
     """
-    Initializes and runs the main gameplay loop.
-    Handles snake movement, food logic, special mode, and collisions.
+    Sets up a new game and schedules its first frame.
+    The loop itself runs from screen.ontimer(), so Tk stays responsive to input.
     """
-    global snake, food, scoreboard, special_food
-    global last_special_food_score, spawn_special_food, special_mode
-    global special_food_timer, special_mode_timer, replay_menu_stage
+    global engine, snake, food, scoreboard, special_food, replay, entity_layer, world_view
+    global profiler_overlay, idle_generation, frame_generation
+    global replay_menu_stage, last_frame_time, tick_accumulator
 
     stop_music()
     play_game_music()
 
-    last_special_food_score = 0
-    spawn_special_food = False
-    special_mode = False
-    special_food_timer = 0
-    special_mode_timer = 0
+    input_queue.clear()
     replay_menu_stage = 0
+    idle_generation += 1  # Cancels a pending switch to attract mode
+
+    release_views()
+    renderer.clear(REPLAY_MENU_LAYER)
+    renderer.background(THEMES[theme]["bg"])
+
+    mode = mode_options[mode_index]
+    engine = MODES[mode](difficulty)
+    replay = Replay(engine.seed, difficulty, mode=mode)
+    if event_bus is not None and not attract_mode:
+        event_bus.game_started(mode, difficulty, theme)
+    if food is None:
+        food = Food(renderer)
+        special_food = Food(renderer, "gold", shape="circle")
+    food.set_color(THEMES[theme]["food_color"])
+    food.hide()
+    special_food.hide()
+    if mode == "world":
+        # The board is bigger than the screen: draw only what the camera can see
+        camera = Camera(engine.grid, view_cells(SCREEN_WIDTH), view_cells(SCREEN_HEIGHT))
+        world_view = WorldView(
+            renderer, engine, camera, THEMES[theme]["snake_color"], THEMES[theme]["food_color"]
+        )
+    else:
+        snake = Snake(renderer, THEMES[theme]["snake_color"], engine.positions())
+        if engine.food is None:
+            # Frenzy mode draws its food through the entity layer
+            entity_layer = EntityLayer(renderer, engine, THEMES[theme]["food_color"])
+        else:
+            food.place(engine.position(engine.food))
+            food.show()
+    if scoreboard is None:
+        scoreboard = Scoreboard(renderer, THEMES[theme]["text_color"], high_score_store)
+    scoreboard.reset(THEMES[theme]["text_color"])
+    if profiler:
+        if profiler_overlay is None:
+            profiler_overlay = HudText(
+                renderer, (-290, 270), THEMES[theme]["text_color"], ("Courier", 10, "normal"), align="left"
+            )
+            profiler.attach_overlay(profiler_overlay)
+        profiler_overlay.set_color(THEMES[theme]["text_color"])
+
+    bind_keys({
+        "Up": lambda: steer(UP),
+        "Down": lambda: steer(DOWN),
+        "Left": lambda: steer(LEFT),
+        "Right": lambda: steer(RIGHT)
+    })
+
+    last_frame_time = time.perf_counter()
+    tick_accumulator = 0
+    refresh_screen()
+    frame_generation += 1
+    generation = frame_generation
+    screen.ontimer(lambda: game_frame(generation), FRAME_INTERVAL_MS)
+
+def step_engine(action):
+    """Steps the engine, timing each of its stages when profiling is on."""
+    if profiler is None:
+        return engine.step(action)
+    return profiler.step(engine, action)
+
+def game_frame(generation):
+    """
+    Runs one frame: steps the engine once for every full tick (engine.speed seconds)
+    of real time that has accumulated, then redraws the screen once.
+    Does nothing if the game of `generation` has since been stopped.
+    """
+    if generation != frame_generation:
+        return
+    if profiler is None:
+        run_frame()
+    else:
+        profiler.begin("frame")
+        run_frame()
+        profiler.end("frame")
+        profiler.frame_done()
+    if attract_mode and (engine.game_over or autopilot.stalled):
+        stop_attract()  # Demo games go back to the menu, and on to the next demo
+    elif engine.game_over:
+        end_game()
+    else:
+        screen.ontimer(lambda: game_frame(generation), FRAME_INTERVAL_MS)
+
+def run_frame():
+    """Steps the engine for the elapsed time and draws the result."""
+    global last_frame_time, tick_accumulator
+    now = time.perf_counter()
+    tick_accumulator += now - last_frame_time
+    last_frame_time = now
+
+    ticks = 0
+    while tick_accumulator >= engine.speed and not engine.game_over:
+        tick_accumulator -= engine.speed
+        heading = autopilot(engine) if attract_mode else input_queue.pop(engine.heading)
+        if heading is not None:
+            replay.record(engine.tick, heading)
+        events = step_engine(heading)
+        if profiler is None:
+            handle_events(events)
+        else:
+            profiler.begin("render")
+            handle_events(events)
+            profiler.end("render")
+        if event_bus is not None and not attract_mode:
+            event_bus.record_tick(engine, events)
+        ticks += 1
+        if ticks == MAX_TICKS_PER_FRAME:
+            tick_accumulator = 0
+            break
+
+    animate_special_food()
+    if profiler is None:
+        refresh_screen()
+    else:
+        profiler.begin("screen_update")
+        refresh_screen()
+        profiler.end("screen_update")
 
-    screen.clear()
-    screen.bgcolor(themes[theme]["bg"])
-    screen.tracer(0)
-
-    snake = Snake(themes[theme]["snake_color"])
-    food = Food(themes[theme]["food_color"])
-    scoreboard = Scoreboard(themes[theme]["text_color"])
-    special_food = Food("gold")
-    special_food.shape("circle")
-    special_food.hideturtle()
-
-    screen.listen()
-    screen.onkey(snake.up, "Up")
-    screen.onkey(snake.down, "Down")
-    screen.onkey(snake.left, "Left")
-    screen.onkey(snake.right, "Right")
-
-    game_is_on = True
-    while game_is_on:
-        screen.update()
-        time.sleep(snake_speed)
-        snake.move()
-        handle_special_food()
-        handle_special_mode_expiry()
-        handle_regular_food()
-
-        if abs(snake.head.xcor()) > WALL_LIMIT or abs(snake.head.ycor()) > WALL_LIMIT:
-            game_is_on = False
-            scoreboard.game_over()
-            play_sound("game_over.wav")
-
-        for segment in snake.segments[1:]:
-            if snake.head.distance(segment) < COLLISION_DISTANCE:
-                game_is_on = False
-                scoreboard.game_over()
-                play_sound("game_over.wav")
-
+def save_replay():
+    """
+    Queues the finished game's seed and inputs to be saved so it can be replayed later.
+    Games that make the leaderboard also keep their own copy, whose path is returned.
+    """
+    replay.finish(engine)
+    data = replay.to_bytes()
+    os.makedirs(REPLAY_DIR, exist_ok=True)
+    writer.write(REPLAY_PATH, data)
+    if not high_score_store.qualifies(difficulty, theme, engine.score, replay.mode):
+        return None
+    path = os.path.join(REPLAY_DIR, f"{replay.mode}-{difficulty}-{theme}-{engine.seed}.snkr")
+    writer.write(path, data)
+    return path
+
+def end_game():
+    """Stops the game music, records the score and replay, and shows the replay menu."""
     stop_music()
+    scoreboard.game_over(difficulty, theme, len(engine.body), save_replay(), replay.mode)
     draw_replay_menu()
-    screen.listen()
-    screen.onkey(replay_left, "Left")
-    screen.onkey(replay_right, "Right")
-    screen.onkey(replay_confirm, "Return")
+    bind_keys({"Left": replay_left, "Right": replay_right, "Return": replay_confirm})
 
 def reset_state():
     """
@@ -420,7 +597,7 @@ def reset_state():
     """
     global theme, difficulty, menu_stage
     global difficulty_locked, theme_locked
-    global difficulty_index, theme_index
+    global difficulty_index, theme_index, mode_index
     theme = None
     difficulty = None
     menu_stage = "difficulty"
@@ -428,20 +605,52 @@ def reset_state():
     theme_locked = False
     difficulty_index = 0
     theme_index = 0
+    mode_index = 0
+
+def setup():
+    """
+    Opens the window and creates the renderer, high score store and (if enabled)
+    the profiler and telemetry event bus. Kept out of import time so the module is cheap to import.
+    """
+    global screen, renderer, writer, high_score_store, profiler, event_bus
+    screen = Screen()
+    screen.setup(width=SCREEN_WIDTH, height=SCREEN_HEIGHT)
+    screen.title("SNAKE.EXE")
+    screen.tracer(0)
+
+    renderer = create_renderer(screen)
+    writer = get_writer()
+    high_score_store = HighScoreStore(writer=writer)
+
+    if profiling_enabled():
+        frenzy_only = tuple(name for name in FRENZY_STAGES if name not in STAGES)
+        profiler = FrameProfiler(
+            STAGES + frenzy_only + ("tick", "render", "screen_update", "frame"), trace=is_tracing()
+        )
+        profiler.start()
+
+    if telemetry.is_enabled():
+        event_bus = telemetry.EventBus()
 
 def main():
     """
     Entry point for the game.
-    Displays the start menu and sets up key bindings.
+    Displays the start menu, sets up key bindings and starts the idle countdown.
     """
     draw_start_screen()
-    screen.listen()
-    screen.onkey(navigate_left, "Left")
-    screen.onkey(navigate_right, "Right")
-    screen.onkey(confirm_selection, "Return")
-    screen.onkey(try_start_game, "space")
+    bind_keys({
+        "Left": menu_key(navigate_left),
+        "Right": menu_key(navigate_right),
+        "Return": menu_key(confirm_selection),
+        "space": menu_key(try_start_game),
+        "m": menu_key(toggle_mode)
+    })
     play_menu_music()
+    schedule_attract()
 
 # === Start Game ===
-main()
-screen.mainloop()
+if __name__ == "__main__":
+    setup()
+    main()  # The menu is painted before the audio stack starts loading
+    audio.start()
+    screen.mainloop()
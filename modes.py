@@ -0,0 +1,18 @@
+"""
+modes.py – The game modes of SNAKE.EXE.
+
+MODES maps each mode's name, as used in the menus, replays and leaderboards, to
+its engine class. Their order is part of the replay format (see replay.py), so
+new modes go at the end.
+"""
+
+from engine import GameEngine
+from frenzy import FrenzyEngine
+from world import WorldEngine
+
+# Engine class for each game mode, by the name used in menus, replays and leaderboards
+MODES = {
+    "classic": GameEngine,
+    "frenzy": FrenzyEngine,
+    "world": WorldEngine
+}
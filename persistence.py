@@ -0,0 +1,117 @@
+"""
+persistence.py – File writing for SNAKE.EXE, kept off the game loop.
+
+atomic_write() replaces a file so readers only ever see its old or its new
+contents. BackgroundWriter runs such writes on a worker thread fed by a
+bounded queue: jobs that arrive close together are handled as one batch, and
+within a batch only the newest job for each key (usually the file path) runs,
+so saving the same file several times in a row costs a single write.
+"""
+
+import atexit
+import os
+import queue
+import sys
+import tempfile
+import threading
+import time
+import traceback
+
+# === Constants ===
+MAX_PENDING = 64  # queued jobs before submit() starts to block
+BATCH_WINDOW = 0.05  # seconds to wait for more jobs before writing a batch
+STOP = object()
+
+
+def atomic_write(path, data):
+    """Replace `path` with `data` (str or bytes) via a fsynced temp file and a rename."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb" if isinstance(data, bytes) else "w") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return  # Directories can't be opened on Windows; the rename is already durable there
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+# === BackgroundWriter Class ===
+class BackgroundWriter:
+    def __init__(self, max_pending=MAX_PENDING, batch_window=BATCH_WINDOW):
+        """Starts the worker thread; pending jobs are flushed when the program exits."""
+        self.queue = queue.Queue(maxsize=max_pending)
+        self.batch_window = batch_window
+        self.thread = threading.Thread(target=self.run, name="snake-writer", daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+
+    def submit(self, key, job):
+        """Queue `job` (a no-argument callable); a newer job with the same key replaces it."""
+        self.queue.put((key, job))
+
+    def write(self, path, data):
+        """Queue an atomic write of `data` to `path`."""
+        self.submit(path, lambda: atomic_write(path, data))
+
+    def run(self):
+        while True:
+            item = self.queue.get()
+            if item is STOP:
+                self.queue.task_done()
+                return
+            batch = {item[0]: item[1]}
+            taken = 1
+            time.sleep(self.batch_window)
+            stopping = False
+            while True:
+                try:
+                    item = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                taken += 1
+                if item is STOP:
+                    stopping = True
+                    break
+                batch.pop(item[0], None)  # re-insert so the batch keeps submission order
+                batch[item[0]] = item[1]
+            for job in batch.values():
+                try:
+                    job()
+                except Exception:
+                    traceback.print_exc(file=sys.stderr)
+            for _ in range(taken):
+                self.queue.task_done()
+            if stopping:
+                return
+
+    def flush(self):
+        """Block until every job submitted so far has run."""
+        self.queue.join()
+
+    def close(self):
+        """Finish the pending jobs and stop the worker thread."""
+        if self.thread.is_alive():
+            self.queue.put(STOP)
+            self.thread.join()
+
+
+# === Shared Writer ===
+_writer = None
+
+def get_writer():
+    """The shared background writer, started on first use."""
+    global _writer
+    if _writer is None:
+        _writer = BackgroundWriter()
+    return _writer
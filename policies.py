@@ -0,0 +1,84 @@
+"""
+policies.py – Scripted players for headless SNAKE.EXE games.
+
+A policy is any function that takes a GameEngine and returns the heading to
+steer towards on the next tick (or None to keep going straight). They are used
+by the batch simulator to tune difficulty and to exercise the game rules.
+The autopilot (see autopilot.py) is a pathfinding planner that keeps state
+between ticks; it is a callable object rather than a plain function, as is the
+random policy, which draws from its own RNG so that the game's RNG (and with it
+where every food lands) is the same for a seed whichever policy plays it.
+"""
+
+import importlib
+import random
+
+from grid import WALL, UP, DOWN, LEFT, RIGHT
+from engine import OPPOSITES
+from autopilot import Autopilot
+
+HEADINGS = (UP, DOWN, LEFT, RIGHT)
+
+
+def safe_headings(engine):
+    """Headings that don't immediately run into a wall or the body."""
+    body = engine.body
+    safe = []
+    for heading in HEADINGS:
+        if heading == OPPOSITES[engine.heading]:
+            continue
+        cell = engine.grid.neighbors[heading][body[0]]
+        if cell != WALL and (not engine.occupied[cell] or (cell == body[-1] and not engine.grow_pending)):
+            safe.append(heading)
+    return safe
+
+
+class RandomPolicy:
+    def __init__(self):
+        """Turns at random, but never straight into a wall or the body if it can help it."""
+        self.engine = None
+        self.rng = None
+
+    def __call__(self, engine):
+        if engine is not self.engine:
+            self.engine = engine
+            self.rng = random.Random(engine.seed)  # Leaves engine.rng to the game itself
+        safe = safe_headings(engine)
+        return self.rng.choice(safe) if safe else None
+
+
+random_policy = RandomPolicy()
+
+
+def greedy_policy(engine):
+    """Heads for the special food if there is one, else the regular food, by Manhattan distance."""
+    target = engine.special_food if engine.special_food is not None else engine.food
+    if target is None:
+        return random_policy(engine)
+    cols = engine.grid.cols
+    target_col, target_row = target % cols, target // cols
+    best = None
+    best_distance = None
+    for heading in safe_headings(engine):
+        cell = engine.grid.neighbors[heading][engine.body[0]]
+        distance = abs(cell % cols - target_col) + abs(cell // cols - target_row)
+        if best is None or distance < best_distance:
+            best, best_distance = heading, distance
+    return best
+
+
+POLICIES = {
+    "random": random_policy,
+    "greedy": greedy_policy,
+    "autopilot": Autopilot()
+}
+
+
+def load_policy(name):
+    """Look up a built-in policy by name, or import one given as "module:function"."""
+    if name in POLICIES:
+        return POLICIES[name]
+    module_name, _, function_name = name.partition(":")
+    if not function_name:
+        raise ValueError(f"Unknown policy {name!r}; use one of {sorted(POLICIES)} or module:function")
+    return getattr(importlib.import_module(module_name), function_name)
@@ -0,0 +1,155 @@
+"""
+profiler.py – Opt-in frame profiling for SNAKE.EXE.
+
+Enabled with `python main.py --profile` or the SNAKE_PROFILE=1 environment
+variable. Every stage of the game loop is timed with perf_counter_ns into
+preallocated ring buffers and log2 histograms, an FPS / tick-ms overlay is drawn
+next to the scoreboard, and on exit a JSON summary of per-stage latencies is
+written. A cProfile trace of the whole session (open with snakeviz or flameprof
+for a flame graph) is only recorded with `--cprofile` or SNAKE_CPROFILE=1 as
+well, since tracing every call slows down the very stages being timed.
+"""
+
+import atexit
+import cProfile
+import json
+import os
+import sys
+import time
+from array import array
+
+# === Constants ===
+PROFILE_ENV = "SNAKE_PROFILE"
+PROFILE_FLAG = "--profile"
+TRACE_ENV = "SNAKE_CPROFILE"
+TRACE_FLAG = "--cprofile"
+TRACE_PATH = "snake_profile.prof"
+SUMMARY_PATH = "snake_profile.json"
+HISTORY = 1024  # samples kept per stage
+BUCKETS = 40  # log2(ns) histogram buckets
+OVERLAY_REFRESH = 0.5  # seconds between overlay redraws
+
+
+def is_enabled():
+    """Whether profiling was requested on the command line or in the environment."""
+    return PROFILE_FLAG in sys.argv[1:] or os.environ.get(PROFILE_ENV, "") not in ("", "0")
+
+
+def is_tracing():
+    """Whether a cProfile trace was requested on the command line or in the environment."""
+    return TRACE_FLAG in sys.argv[1:] or os.environ.get(TRACE_ENV, "") not in ("", "0")
+
+
+# === FrameProfiler Class ===
+class FrameProfiler:
+    def __init__(self, stage_names, trace=False):
+        """
+        Preallocates a sample ring buffer and histogram for each named stage;
+        with `trace`, also records a cProfile trace of the session.
+        """
+        self.names = list(stage_names)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.samples = [array("q", bytes(8 * HISTORY)) for _ in self.names]
+        self.counts = array("q", bytes(8 * len(self.names)))
+        self.histograms = [array("q", bytes(8 * BUCKETS)) for _ in self.names]
+        self.started = array("q", bytes(8 * len(self.names)))  # begin() stamp per stage
+        self.frames = 0
+        self.ticks = 0
+        self.profile = cProfile.Profile() if trace else None
+        self.overlay = None
+        self.overlay_frames = 0
+        self.overlay_ticks = 0
+        self.overlay_time = time.perf_counter()
+
+    # === Recording ===
+    def record(self, i, elapsed_ns):
+        """Store one sample for stage number `i`."""
+        count = self.counts[i]
+        self.samples[i][count % HISTORY] = elapsed_ns
+        self.counts[i] = count + 1
+        self.histograms[i][min(BUCKETS - 1, elapsed_ns.bit_length())] += 1
+
+    def begin(self, name):
+        """Starts timing stage `name`, until end(name)."""
+        self.started[self.index[name]] = time.perf_counter_ns()
+
+    def end(self, name):
+        i = self.index[name]
+        self.record(i, time.perf_counter_ns() - self.started[i])
+
+    def step(self, engine, action=None):
+        """Same as engine.step(), but times each engine stage separately."""
+        events = []
+        if engine.game_over:
+            return events
+        clock = time.perf_counter_ns
+        started = clock()
+        engine.begin_tick(action)
+        for stage in engine.stages:
+            t0 = clock()
+            stage(events)
+            self.record(self.index[stage.__name__], clock() - t0)
+            if engine.game_over:
+                break
+        self.record(self.index["tick"], clock() - started)
+        self.ticks += 1
+        return events
+
+    # === Reporting ===
+    def percentile(self, name, fraction):
+        """Approximate percentile (in ns) of the recent samples of a stage."""
+        i = self.index[name]
+        recent = sorted(self.samples[i][:min(self.counts[i], HISTORY)])
+        if not recent:
+            return 0
+        return recent[min(len(recent) - 1, int(fraction * len(recent)))]
+
+    def summary(self):
+        return {
+            name: {
+                "samples": self.counts[i],
+                "p50_us": round(self.percentile(name, 0.50) / 1000, 3),
+                "p99_us": round(self.percentile(name, 0.99) / 1000, 3),
+                "log2_ns_histogram": list(self.histograms[i])
+            }
+            for i, name in enumerate(self.names)
+        }
+
+    def attach_overlay(self, overlay):
+        """Draw live FPS / tick timings into a HudText placed next to the scoreboard."""
+        self.overlay = overlay
+
+    def frame_done(self):
+        """Counts a rendered frame and refreshes the overlay every OVERLAY_REFRESH seconds."""
+        self.frames += 1
+        if self.overlay is None:
+            return
+        now = time.perf_counter()
+        elapsed = now - self.overlay_time
+        if elapsed < OVERLAY_REFRESH:
+            return
+        fps = (self.frames - self.overlay_frames) / elapsed
+        tps = (self.ticks - self.overlay_ticks) / elapsed
+        self.overlay.show(
+            f"FPS {fps:.0f}  TPS {tps:.0f}  "
+            f"tick {self.percentile('tick', 0.5) / 1e6:.2f}ms  "
+            f"frame {self.percentile('frame', 0.5) / 1e6:.2f}ms"
+        )
+        self.overlay_frames = self.frames
+        self.overlay_ticks = self.ticks
+        self.overlay_time = now
+
+    # === Session ===
+    def start(self):
+        """Begin the cProfile trace, if any, and dump everything when the program exits."""
+        if self.profile is not None:
+            self.profile.enable()
+        atexit.register(self.dump)
+
+    def dump(self):
+        """Writes the JSON stage summary and the cProfile trace, if any."""
+        if self.profile is not None:
+            self.profile.disable()
+            self.profile.dump_stats(TRACE_PATH)
+        with open(SUMMARY_PATH, "w") as file:
+            json.dump(self.summary(), file, indent=2)
@@ -0,0 +1,190 @@
+"""
+protocol.py – The multiplayer wire format of SNAKE.EXE.
+
+Every message is a 4-byte big-endian length followed by the payload, whose
+first byte is its type:
+    WELCOME  server -> client, once: the client's player id, the board size
+             and the tick length
+    TICK     server -> client, every tick: the tick number and that tick's
+             deltas (see arena.py), each a kind byte plus fixed-size fields
+    STEER    client -> server: a direction code (see grid.DIRECTIONS)
+Only deltas are ever sent. A client that connects mid-game first receives a
+TICK with the deltas that build the current board from an empty one.
+A server only ever accepts STEER messages of exactly their size from a client
+(see read_steer); anything else is malformed and ends the connection.
+
+ArenaState is the client-side mirror of the board, kept up to date by
+applying the deltas in order.
+"""
+
+import struct
+from collections import deque
+
+from arena import HEAD, TAIL, SPAWN, DIE, LEAVE, SCORE, FOOD_ADDED, FOOD_EATEN
+from grid import Grid, DIRECTIONS, DIRECTION_CODES
+from engine import MOVE_DISTANCE
+
+# === Message Types ===
+WELCOME = 1
+TICK = 2
+STEER = 3
+
+# === Formats ===
+LENGTH = struct.Struct("!I")
+MAX_MESSAGE = 1 << 22  # bytes; a longer length prefix is treated as malformed
+WELCOME_FORMAT = struct.Struct("!BHHf")  # type, player id, board size, seconds per tick
+TICK_FORMAT = struct.Struct("!BIH")  # type, tick, number of deltas
+STEER_FORMAT = struct.Struct("!BB")  # type, direction code
+CELL = struct.Struct("!I")
+# Fields after the kind byte; SPAWN is followed by its cells
+DELTA_FORMATS = {
+    HEAD: struct.Struct("!BHI"),
+    TAIL: struct.Struct("!BH"),
+    SPAWN: struct.Struct("!BHHH"),  # player, color, number of cells
+    DIE: struct.Struct("!BH"),
+    LEAVE: struct.Struct("!BH"),
+    SCORE: struct.Struct("!BHI"),
+    FOOD_ADDED: struct.Struct("!BI"),
+    FOOD_EATEN: struct.Struct("!BI")
+}
+
+
+# === Encoding ===
+def frame(payload):
+    return LENGTH.pack(len(payload)) + payload
+
+
+def encode_welcome(player_id, board_size, speed):
+    return frame(WELCOME_FORMAT.pack(WELCOME, player_id, board_size, speed))
+
+
+def encode_steer(heading):
+    return frame(STEER_FORMAT.pack(STEER, DIRECTION_CODES[heading]))
+
+
+def encode_tick(tick, deltas):
+    """One TICK message (length prefix included) carrying `deltas`."""
+    parts = [TICK_FORMAT.pack(TICK, tick, len(deltas))]
+    for delta in deltas:
+        kind = delta[0]
+        if kind == SPAWN:
+            _, player, color, cells = delta
+            parts.append(DELTA_FORMATS[SPAWN].pack(SPAWN, player, color, len(cells)))
+            parts.append(struct.pack(f"!{len(cells)}I", *cells))
+        else:
+            parts.append(DELTA_FORMATS[kind].pack(*delta))
+    return frame(b"".join(parts))
+
+
+# === Decoding ===
+def decode(payload):
+    """
+    A message payload (without its length prefix) as a tuple:
+    (WELCOME, player_id, board_size, speed), (TICK, tick, deltas) or (STEER, heading).
+    Raises ValueError if the payload is malformed.
+    """
+    try:
+        return decode_payload(payload)
+    except (struct.error, IndexError, KeyError) as error:
+        raise ValueError(f"malformed message: {error}") from error
+
+
+def decode_payload(payload):
+    kind = payload[0]
+    if kind == WELCOME:
+        return WELCOME_FORMAT.unpack(payload)
+    if kind == STEER:
+        code = STEER_FORMAT.unpack(payload)[1]
+        if code >= len(DIRECTIONS):
+            raise ValueError(f"unknown direction code {code}")
+        return STEER, DIRECTIONS[code]
+    if kind != TICK:
+        raise ValueError(f"unknown message type {kind}")
+    _, tick, count = TICK_FORMAT.unpack_from(payload)
+    offset = TICK_FORMAT.size
+    deltas = []
+    for _ in range(count):
+        layout = DELTA_FORMATS[payload[offset]]
+        delta = layout.unpack_from(payload, offset)
+        offset += layout.size
+        if delta[0] == SPAWN:
+            _, player, color, length = delta
+            cells = struct.unpack_from(f"!{length}I", payload, offset)
+            offset += length * CELL.size
+            delta = (SPAWN, player, color, cells)
+        deltas.append(delta)
+    return TICK, tick, deltas
+
+
+async def read_payload(reader, max_length):
+    """
+    The next message payload from an asyncio StreamReader; raises IncompleteReadError
+    at EOF and ValueError if its length prefix is over `max_length`.
+    """
+    (length,) = LENGTH.unpack(await reader.readexactly(LENGTH.size))
+    if length > max_length:
+        raise ValueError(f"message of {length} bytes is over the {max_length} byte limit")
+    return await reader.readexactly(length)
+
+
+async def read_message(reader):
+    """The next decoded message from the server; raises IncompleteReadError at EOF, ValueError if malformed."""
+    return decode(await read_payload(reader, MAX_MESSAGE))
+
+
+async def read_steer(reader):
+    """
+    The heading of the next message from a client, which must be a STEER message of
+    exactly STEER_FORMAT.size bytes; raises IncompleteReadError at EOF, ValueError otherwise.
+    """
+    payload = await read_payload(reader, STEER_FORMAT.size)
+    if len(payload) != STEER_FORMAT.size or payload[0] != STEER:
+        raise ValueError("clients may only send STEER messages")
+    return decode(payload)[1]
+
+
+# === ArenaState Class ===
+class ArenaState:
+    def __init__(self, board_size):
+        """An empty mirror of a board_size x board_size arena."""
+        self.grid = Grid(board_size, board_size, MOVE_DISTANCE)
+        self.occupied = bytearray(self.grid.size)
+        self.snakes = {}  # player -> deque of body cells, head first
+        self.colors = {}  # player -> colour index (see arena.player_color)
+        self.scores = {}
+        self.food = set()
+        self.tick = 0
+
+    def apply(self, delta):
+        """Applies one delta from the server."""
+        kind = delta[0]
+        if kind == HEAD:
+            _, player, cell = delta
+            self.snakes[player].appendleft(cell)
+            self.occupied[cell] = 1
+        elif kind == TAIL:
+            self.occupied[self.snakes[delta[1]].pop()] = 0
+        elif kind == SPAWN:
+            _, player, color, cells = delta
+            self.snakes[player] = deque(cells)
+            self.colors[player] = color
+            self.scores[player] = 0
+            for cell in cells:
+                self.occupied[cell] = 1
+        elif kind in (DIE, LEAVE):
+            for cell in self.snakes.pop(delta[1], ()):
+                self.occupied[cell] = 0
+            if kind == LEAVE:
+                self.colors.pop(delta[1], None)
+                self.scores.pop(delta[1], None)
+        elif kind == SCORE:
+            self.scores[delta[1]] = delta[2]
+        elif kind == FOOD_ADDED:
+            self.food.add(delta[1])
+        elif kind == FOOD_EATEN:
+            self.food.discard(delta[1])
+
+    def apply_tick(self, tick, deltas):
+        self.tick = tick
+        for delta in deltas:
+            self.apply(delta)
@@ -0,0 +1,304 @@
+"""
+render.py – Renderer backends for SNAKE.EXE.
+
+The game, HUD and menus draw through a renderer rather than through turtles
+directly. A renderer offers:
+  - sprites: pooled, filled shapes (square, triangle, circle, turtle) that can
+    be moved, shown, hidden and recolored, optionally as a named group that
+    is recolored all at once (the snake during special mode);
+  - text fields: retained text items that are only touched when they change;
+  - layers: named sets of written text and lines that are cleared together
+    (menu lines, the game over message, the world border);
+  - present(): draws the frame.
+
+TurtleRenderer is the original turtle path: every sprite is a Turtle, and
+screen.update() walks and redraws all of them each frame.
+CanvasRenderer skips turtles and writes Tk canvas items directly. Sprite moves
+are queued and applied once per frame, only for the sprites that moved, and
+Tk then repaints just the damaged parts of the window, so the cost of a frame
+follows what changed in it rather than how much is on screen.
+
+The canvas backend is the default; pass --renderer turtle (or set
+SNAKE_RENDERER=turtle) to use the turtle one.
+"""
+
+import math
+import os
+import sys
+from turtle import Turtle
+
+# === Constants ===
+RENDERER_FLAG = "--renderer"
+RENDERER_ENV = "SNAKE_RENDERER"
+DEFAULT_RENDERER = "canvas"
+HUD_MARKER = "hud"  # canvas sprites are kept below this item, and text above it
+
+# Outlines of the turtle module's built-in shapes, 20 pixels (one cell) across, pointing up
+SHAPES = {
+    "square": ((10, -10), (10, 10), (-10, 10), (-10, -10)),
+    "triangle": ((10, -5.77), (0, 11.55), (-10, -5.77)),
+    "circle": tuple(
+        (10 * math.cos(2 * math.pi * i / 20), 10 * math.sin(2 * math.pi * i / 20)) for i in range(20)
+    ),
+    "turtle": (
+        (0, 16), (-2, 14), (-1, 10), (-4, 7), (-7, 9), (-9, 8), (-6, 5), (-7, 1), (-5, -3), (-8, -6),
+        (-6, -8), (-4, -5), (0, -7), (4, -5), (6, -8), (8, -6), (5, -3), (7, 1), (6, 5), (9, 8),
+        (7, 9), (4, 7), (1, 10), (2, 14)
+    )
+}
+ANCHORS = {"left": "sw", "center": "s", "right": "se"}  # canvas anchor of each turtle text alignment
+HEADINGS = {"triangle": 45, "turtle": 45}  # Rotated for a cuter look; other shapes stay upright
+UPRIGHT = 90
+
+
+def selected_backend():
+    """The renderer named on the command line or in the environment, else the default."""
+    args = sys.argv[1:]
+    if RENDERER_FLAG in args[:-1]:
+        return args[args.index(RENDERER_FLAG) + 1]
+    return os.environ.get(RENDERER_ENV, DEFAULT_RENDERER)
+
+
+def create_renderer(screen, name=None):
+    """A renderer for `screen` from the named backend (see selected_backend())."""
+    name = name or selected_backend()
+    if name not in RENDERERS:
+        raise ValueError(f"unknown renderer {name!r}, expected one of: {', '.join(RENDERERS)}")
+    return RENDERERS[name](screen)
+
+
+# === TurtleRenderer Class ===
+class TurtleRenderer:
+    def __init__(self, screen):
+        """Draws with turtles on `screen`, which should have tracer(0) set."""
+        self.screen = screen
+        self.free = []  # hidden sprite turtles
+        self.groups = {}  # group -> set of sprite turtles
+        self.group_colors = {}
+        self.layers = {}  # layer -> the turtle that writes it
+
+    # === Sprites ===
+    def sprite(self, shape, color, position, size=1.0, group=None):
+        """A visible sprite with the given look at `position`, reused if one is free."""
+        if self.free:
+            sprite = self.free.pop()
+        else:
+            sprite = Turtle()
+            sprite.penup()
+            sprite.speed("fastest")
+        sprite.shape(shape)
+        sprite.shapesize(size, size)
+        sprite.setheading(HEADINGS.get(shape, UPRIGHT))
+        sprite.color(color)
+        sprite.goto(position)
+        sprite.showturtle()
+        sprite.group = group
+        if group is not None:
+            self.groups.setdefault(group, set()).add(sprite)
+        return sprite
+
+    def move(self, sprite, position):
+        sprite.goto(position)
+
+    def show(self, sprite):
+        sprite.showturtle()
+
+    def hide(self, sprite):
+        sprite.hideturtle()
+
+    def set_color(self, sprite, color):
+        sprite.color(color)
+
+    def release(self, sprite):
+        """Hide a sprite and return it to the pool."""
+        sprite.hideturtle()
+        if sprite.group is not None:
+            self.groups[sprite.group].discard(sprite)
+        self.free.append(sprite)
+
+    def recolor(self, group, color):
+        """Recolor every sprite in `group`; does nothing if it is unchanged."""
+        if self.group_colors.get(group) != color:
+            self.group_colors[group] = color
+            for sprite in self.groups.get(group, ()):
+                sprite.color(color)
+
+    # === Text and Lines ===
+    def layer(self, name):
+        pen = self.layers.get(name)
+        if pen is None:
+            pen = self.layers[name] = Turtle()
+            pen.hideturtle()
+            pen.penup()
+            pen.speed("fastest")
+        return pen
+
+    def write(self, layer, position, text, color, font, align="center"):
+        """Writes `text` on `layer`, with its baseline centred (or aligned) on `position`."""
+        pen = self.layer(layer)
+        pen.goto(position)
+        pen.color(color)
+        pen.write(text, align=align, font=font)
+
+    def line(self, layer, start, end, color):
+        pen = self.layer(layer)
+        pen.color(color)
+        pen.goto(start)
+        pen.pendown()
+        pen.goto(end)
+        pen.penup()
+
+    def clear(self, layer):
+        """Erases everything written or drawn on `layer`."""
+        if layer in self.layers:
+            self.layers[layer].clear()
+
+    def text(self, position, color, font, align="center"):
+        """A blank retained text field, its baseline centred (or aligned) on `position`; see set_text()."""
+        field = Turtle()
+        field.hideturtle()
+        field.penup()
+        field.color(color)
+        field.goto(position)
+        field.write("", align=align, font=font)
+        field.item = field.items[-1]
+        return field
+
+    def set_text(self, field, text):
+        self.screen.getcanvas().itemconfigure(field.item, text=text)
+
+    def set_text_color(self, field, color):
+        field.color(color)
+        self.screen.getcanvas().itemconfigure(field.item, fill=color)
+
+    # === Frames ===
+    def background(self, color):
+        self.screen.bgcolor(color)
+
+    def present(self):
+        """Redraws every turtle and the window."""
+        self.screen.update()
+
+
+# === CanvasRenderer Class ===
+class CanvasRenderer:
+    def __init__(self, screen):
+        """Draws canvas items directly on the canvas of `screen`, which should have tracer(0) set."""
+        self.screen = screen
+        self.canvas = screen.getcanvas()
+        self.xscale = screen.xscale
+        self.yscale = screen.yscale
+        self.free = []
+        self.outlines = {}  # sprite -> its shape's canvas offsets from the centre, x and y interleaved
+        self.moves = {}  # sprite -> position, applied by present()
+        self.group_colors = {}
+        self.outline_cache = {}
+        self.canvas.create_line(0, 0, 0, 0, state="hidden", tags=HUD_MARKER)
+
+    def outline(self, shape, size):
+        """The canvas offsets of a shape's corners, rotated and scaled as the turtle backend draws it."""
+        key = (shape, size)
+        if key not in self.outline_cache:
+            angle = math.radians(HEADINGS.get(shape, UPRIGHT))
+            # Same transform as turtle: the shape's "up" points along the heading
+            e0, e1 = math.cos(angle), math.sin(angle)
+            offsets = []
+            for x, y in SHAPES[shape]:
+                offsets.append((e1 * x + e0 * y) * size * self.xscale)
+                offsets.append(-(-e0 * x + e1 * y) * size * self.yscale)
+            self.outline_cache[key] = offsets
+        return self.outline_cache[key]
+
+    # === Sprites ===
+    def sprite(self, shape, color, position, size=1.0, group=None):
+        """A visible sprite with the given look at `position` (from the next present()), reused if one is free."""
+        tags = (group,) if group is not None else ()
+        if self.free:
+            sprite = self.free.pop()
+            self.canvas.itemconfigure(sprite, fill=color, outline=color, tags=tags, state="normal")
+        else:
+            sprite = self.canvas.create_polygon(0, 0, 0, 0, 0, 0, fill=color, outline=color, tags=tags)
+            self.canvas.tag_lower(sprite, HUD_MARKER)
+        self.outlines[sprite] = self.outline(shape, size)
+        self.moves[sprite] = position
+        return sprite
+
+    def move(self, sprite, position):
+        """Queue a move; only the last move of a sprite before present() reaches the canvas."""
+        self.moves[sprite] = position
+
+    def show(self, sprite):
+        self.canvas.itemconfigure(sprite, state="normal")
+
+    def hide(self, sprite):
+        self.canvas.itemconfigure(sprite, state="hidden")
+
+    def set_color(self, sprite, color):
+        self.canvas.itemconfigure(sprite, fill=color, outline=color)
+
+    def release(self, sprite):
+        """Hide a sprite and return it to the pool."""
+        self.canvas.itemconfigure(sprite, state="hidden", tags=())
+        self.moves.pop(sprite, None)
+        self.free.append(sprite)
+
+    def recolor(self, group, color):
+        """Recolor every sprite in `group` with one canvas call; does nothing if it is unchanged."""
+        if self.group_colors.get(group) != color:
+            self.group_colors[group] = color
+            self.canvas.itemconfigure(group, fill=color, outline=color)
+
+    # === Text and Lines ===
+    def write(self, layer, position, text, color, font, align="center"):
+        """Writes `text` on `layer`, with its baseline centred (or aligned) on `position`."""
+        x, y = position
+        anchor = ANCHORS[align]
+        self.canvas.create_text(
+            x * self.xscale - 1, -y * self.yscale, text=text, anchor=anchor, fill=color, font=font, tags=layer
+        )
+
+    def line(self, layer, start, end, color):
+        (x0, y0), (x1, y1) = start, end
+        item = self.canvas.create_line(
+            x0 * self.xscale, -y0 * self.yscale, x1 * self.xscale, -y1 * self.yscale,
+            fill=color, capstyle="round", tags=layer
+        )
+        self.canvas.tag_lower(item, HUD_MARKER)
+
+    def clear(self, layer):
+        """Erases everything written or drawn on `layer`."""
+        self.canvas.delete(layer)
+
+    def text(self, position, color, font, align="center"):
+        """A blank retained text field, its baseline centred (or aligned) on `position`; see set_text()."""
+        x, y = position
+        return self.canvas.create_text(
+            x * self.xscale - 1, -y * self.yscale, text="", anchor=ANCHORS[align], fill=color, font=font
+        )
+
+    def set_text(self, field, text):
+        self.canvas.itemconfigure(field, text=text)
+
+    def set_text_color(self, field, color):
+        self.canvas.itemconfigure(field, fill=color)
+
+    # === Frames ===
+    def background(self, color):
+        self.screen.bgcolor(color)
+
+    def present(self):
+        """Applies the queued sprite moves and lets Tk repaint the regions that changed."""
+        coords = self.canvas.coords
+        xscale, yscale = self.xscale, self.yscale
+        for sprite, (x, y) in self.moves.items():
+            cx, cy = x * xscale, -y * yscale
+            offsets = self.outlines[sprite]
+            coords(sprite, [offset + (cy if i & 1 else cx) for i, offset in enumerate(offsets)])
+        self.moves.clear()
+        self.canvas.update_idletasks()
+
+
+RENDERERS = {
+    "canvas": CanvasRenderer,
+    "turtle": TurtleRenderer
+}
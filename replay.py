@@ -0,0 +1,151 @@
+"""
+replay.py – Records and replays SNAKE.EXE games.
+
+A game is fully determined by its mode, seed, difficulty and the direction
+keys pressed on each tick (see engine.py), so a replay stores only those. Inputs are
+delta-encoded: each one is a single varint holding the number of ticks since
+the previous input and a 2-bit direction code, which usually fits in one byte.
+
+Usage:
+    python replay.py replays/last_game.snkr
+re-simulates a replay headless at full speed and checks its recorded score.
+"""
+
+import json
+import struct
+import sys
+
+from engine import DIFFICULTY_SPEEDS
+from grid import DIRECTIONS, DIRECTION_CODES
+from modes import MODES
+
+# === File Format ===
+MAGIC = b"SNKR"
+VERSION = 2
+HEADER = struct.Struct("<4sBBBIII")  # magic, version, mode, difficulty, seed, score, ticks
+V1_HEADER = struct.Struct("<4sBBIII")  # version 1 had no mode byte: always classic
+DIFFICULTIES = list(DIFFICULTY_SPEEDS)
+MODE_NAMES = list(MODES)
+
+
+# === Replay Class ===
+class Replay:
+    def __init__(self, seed, difficulty, inputs=None, score=0, ticks=0, mode="classic"):
+        """A recorded game: mode, seed, difficulty and a list of (tick, heading) inputs."""
+        self.seed = seed
+        self.difficulty = difficulty
+        self.mode = mode
+        self.inputs = inputs if inputs is not None else []
+        self.score = score
+        self.ticks = ticks
+
+    def record(self, tick, heading):
+        """Record that `heading` was steered towards on engine tick `tick`."""
+        self.inputs.append((tick, heading))
+
+    def finish(self, engine):
+        """Store the final score and length of the recorded game for later verification."""
+        self.score = engine.score
+        self.ticks = engine.tick
+
+    # === Encoding ===
+    def to_bytes(self):
+        """Serialize to the compact binary replay format."""
+        data = bytearray(HEADER.pack(
+            MAGIC, VERSION, MODE_NAMES.index(self.mode), DIFFICULTIES.index(self.difficulty),
+            self.seed, self.score, self.ticks
+        ))
+        previous = 0
+        for tick, heading in self.inputs:
+            value = (tick - previous) << 2 | DIRECTION_CODES[heading]
+            previous = tick
+            while value >= 0x80:
+                data.append(value & 0x7F | 0x80)
+                value >>= 7
+            data.append(value)
+        return bytes(data)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Parse a replay produced by to_bytes()."""
+        magic, version = data[:4], data[4]
+        if magic != MAGIC or version not in (1, VERSION):
+            raise ValueError("Not a SNAKE.EXE replay file")
+        if version == 1:
+            _, _, difficulty, seed, score, ticks = V1_HEADER.unpack_from(data)
+            mode, header_size = 0, V1_HEADER.size
+        else:
+            _, _, mode, difficulty, seed, score, ticks = HEADER.unpack_from(data)
+            header_size = HEADER.size
+        inputs = []
+        tick = 0
+        value = 0
+        shift = 0
+        for byte in data[header_size:]:
+            value |= (byte & 0x7F) << shift
+            shift += 7
+            if byte & 0x80:
+                continue
+            tick += value >> 2
+            inputs.append((tick, DIRECTIONS[value & 3]))
+            value = 0
+            shift = 0
+        return cls(seed, DIFFICULTIES[difficulty], inputs, score, ticks, MODE_NAMES[mode])
+
+    def save(self, path):
+        """Write the replay to a file."""
+        with open(path, "wb") as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        """Read a replay from a file."""
+        with open(path, "rb") as file:
+            return cls.from_bytes(file.read())
+
+
+# === Playback ===
+def play(replay):
+    """
+    Re-simulates a replay headless, one tick at a time. Yields (engine, events)
+    for the starting position and then after every tick; the engine is the
+    same object throughout.
+    """
+    engine = MODES[replay.mode](replay.difficulty, seed=replay.seed)
+    yield engine, []
+    for tick, heading in replay.inputs:
+        while engine.tick < tick and not engine.game_over:
+            yield engine, engine.step()
+        if engine.game_over:
+            return
+        yield engine, engine.step(heading)
+    while not engine.game_over:
+        yield engine, engine.step()
+
+
+def simulate(replay):
+    """
+    Re-simulates a replay headless, as fast as possible.
+    Returns the finished GameEngine.
+    """
+    for engine, _ in play(replay):
+        pass
+    return engine
+
+
+def main(path):
+    replay = Replay.load(path)
+    engine = simulate(replay)
+    print(json.dumps({
+        "mode": replay.mode,
+        "difficulty": replay.difficulty,
+        "seed": replay.seed,
+        "inputs": len(replay.inputs),
+        "score": engine.score,
+        "ticks": engine.tick,
+        "verified": engine.score == replay.score and engine.tick == replay.ticks
+    }))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1])
@@ -1,109 +1,131 @@
 """
 scoreboard.py – Defines the Scoreboard class for SNAKE.EXE.
 
-Handles score tracking, display, special mode status, and game-over UI.
-Persists the high score in a local text file between sessions.
+Handles score display, special mode status, and game-over UI.
+Records finished games in the per-board leaderboards (see highscores.py).
+Everything is drawn through the renderer (see render.py). The score line and
+special mode countdown are retained text fields that are only touched when
+the text they show actually changes. One Scoreboard is kept for the whole
+session and reset() between games, so its fields are reused.
 """
 
-from turtle import Turtle
-import time
-from playsound import playsound
+from audio import play_sound
+from highscores import HighScoreStore
 
 # === Constants ===
 ALIGNMENT = "center"
 FONT = ("Courier", 24, "bold")
+FLASH_COUNT = 6
+FLASH_INTERVAL_MS = 200
+MESSAGE_LAYER = "scoreboard"
+FLASH_LAYER = "high_score_flash"
+
+# === HudText Class ===
+class HudText:
+    def __init__(self, renderer, position, color, font, align="center"):
+        """A retained text field of `renderer` for one HUD field, initially blank."""
+        self.renderer = renderer
+        self.field = renderer.text(position, color, font, align)
+        self.text = ""
+
+    def show(self, text):
+        """Show `text` in the field; does nothing if it is unchanged."""
+        if text != self.text:
+            self.text = text
+            self.renderer.set_text(self.field, text)
+
+    def hide(self):
+        """Blank the field without deleting it."""
+        self.show("")
+
+    def set_color(self, color):
+        """Recolor the field in place."""
+        self.renderer.set_text_color(self.field, color)
 
 # === Scoreboard Class ===
-class Scoreboard(Turtle):
-    def __init__(self, color="deeppink"):
+class Scoreboard:
+    def __init__(self, renderer, color="deeppink", store=None):
         """
         Initializes the scoreboard with starting score, high score, and visual setup.
         """
-        super().__init__()
+        self.renderer = renderer
         self.score = 0
-        self.double_points = False
-        self.color(color)
-        self.penup()
-        self.hideturtle()
-        self.goto(0, 240)
-
-        # Load high score from file or initialize to 0
-        try:
-            with open("high_score.txt") as file:
-                self.high_score = int(file.read())
-        except (FileNotFoundError, ValueError):
-            self.high_score = 0
+        self.score_text = HudText(renderer, (0, 240), color, FONT)
+        self.special_mode_text = HudText(renderer, (0, 210), "gold", ("Courier", 18, "bold"))
+        self.flash_id = 0  # bumped to cancel a running high score animation
+
+        self.store = store if store is not None else HighScoreStore()
+        self.high_score = self.store.best_score()
 
         self.update_score()
 
+    def reset(self, color):
+        """Clears the last game's messages and shows a zero score in `color`, for a new game."""
+        self.hide_all()
+        self.score_text.set_color(color)
+        self.set_score(0)
+
+    def hide_all(self):
+        """Blanks every message, e.g. while the start menu is shown."""
+        self.renderer.clear(MESSAGE_LAYER)
+        self.flash_id += 1  # Stops a running high score animation
+        self.renderer.clear(FLASH_LAYER)
+        self.score_text.hide()
+        self.special_mode_text.hide()
+
     # === Score Display ===
     def update_score(self):
         """Update the scoreboard display with the current score and high score."""
-        self.clear()
-        self.goto(0, 240)
-        self.write(
-            f"SCORE: {self.score}   HIGH SCORE: {self.high_score}",
-            align=ALIGNMENT,
-            font=FONT
-        )
+        self.score_text.show(f"SCORE: {self.score}   HIGH SCORE: {self.high_score}")
 
-    def increase_score(self):
-        """Increases the score by 1 or 2 depending on special mode."""
-        self.score += 2 if self.double_points else 1
+    def set_score(self, score):
+        """Show the score reported by the game engine."""
+        self.score = score
         self.update_score()
 
     # === Special Mode Handling ===
-    def activate_double_points(self):
-        """Enable double points during special mode."""
-        self.double_points = True
-
-    def deactivate_double_points(self):
-        """Disable double points when special mode ends."""
-        self.double_points = False
-
     def show_special_mode(self, seconds_left):
         """Display special mode countdown in gold text."""
-        self.goto(0, 210)
-        self.color("gold")
-        self.write(
-            f"🌟 SPECIAL MODE: {seconds_left}s 🌟",
-            align=ALIGNMENT,
-            font=("Courier", 18, "bold")
-        )
-        self.color("deeppink")
+        self.special_mode_text.show(f"🌟 SPECIAL MODE: {seconds_left}s 🌟")
+
+    def hide_special_mode(self):
+        """Remove the special mode countdown when special mode ends."""
+        self.special_mode_text.hide()
 
     # === Game Over + High Score ===
     def show_new_high_score(self):
-        """Flash a celebratory message when a new high score is achieved."""
-        playsound("sounds/new_high_score.wav", block=False)
-        flash = Turtle()
-        flash.hideturtle()
-        flash.penup()
-        flash.color("gold")
-        flash.goto(0, 40)
-
-        for _ in range(6):
-            flash.write("🌟 NEW HIGH SCORE! 🌟", align=ALIGNMENT, font=("Courier", 22, "bold"))
-            flash.getscreen().update()
-            time.sleep(0.2)
-            flash.clear()
-            flash.getscreen().update()
-            time.sleep(0.2)
-
-        flash.write("🌟 NEW HIGH SCORE! 🌟", align=ALIGNMENT, font=("Courier", 22, "bold"))
-
-    def game_over(self):
+        """Flash a celebratory message when a new high score is achieved, without blocking."""
+        play_sound("new_high_score.wav")
+        self.flash_id += 1
+        self.flash_high_score(self.flash_id, FLASH_COUNT * 2)
+
+    def flash_high_score(self, flash_id, remaining):
+        """One blink of the high score message; reschedules itself with screen.ontimer()."""
+        if flash_id != self.flash_id:
+            return  # A new game (e.g. Replay was chosen) started mid-animation
+        if remaining % 2 == 0:
+            self.renderer.write(
+                FLASH_LAYER, (0, 40), "🌟 NEW HIGH SCORE! 🌟", "gold", ("Courier", 22, "bold"), ALIGNMENT
+            )
+        else:
+            self.renderer.clear(FLASH_LAYER)
+        self.renderer.present()
+        if remaining > 0:
+            self.renderer.screen.ontimer(
+                lambda: self.flash_high_score(flash_id, remaining - 1), FLASH_INTERVAL_MS
+            )
+
+    def game_over(self, difficulty, theme, length=0, replay=None, mode="classic"):
         """
-        Display 'Game Over' and update high score file if necessary.
+        Display 'Game Over' and record the game on its mode/difficulty/theme leaderboard.
         Also triggers new high score animation if applicable.
         """
+        self.store.record(difficulty, theme, self.score, length, replay, mode=mode)
         if self.score > self.high_score:
             self.high_score = self.score
-            with open("high_score.txt", "w") as file:
-                file.write(str(self.high_score))
             self.show_new_high_score()
 
-        playsound("sounds/game_over.wav", block=False)
-        self.goto(0, -20)
-        self.color("purple")
-        self.write("✧ GAME OVER ✧", align=ALIGNMENT, font=("Courier", 28, "bold"))
+        play_sound("game_over.wav")
+        self.renderer.write(
+            MESSAGE_LAYER, (0, -20), "✧ GAME OVER ✧", "purple", ("Courier", 28, "bold"), ALIGNMENT
+        )
@@ -1,87 +1,72 @@
 """
 snake.py – Defines the Snake class for SNAKE.EXE.
 
-Handles the creation, movement, growth, direction control, and visual effects
-for the snake object in the game.
+Draws the snake described by the game engine: one square sprite per body
+segment, plus the gold glow visual effect used during special mode.
+Segments are pooled sprites of the renderer (see render.py) and are kept head
+first in a deque used as a ring buffer, so each tick only the recycled tail
+segment is moved, however long the snake is. All segments share the sprite
+group SNAKE_GROUP, so the glow is one recolor of the group.
 """
 
-from turtle import Turtle
+from collections import deque
 
 # === Constants ===
-STARTING_POSITIONS = [(0, 0), (-20, 0), (-40, 0)]
-MOVE_DISTANCE = 20
-UP = 90
-DOWN = 270
-LEFT = 180
-RIGHT = 0
+SNAKE_GROUP = "snake"
+
 
 # === Snake Class ===
 class Snake:
-    def __init__(self, color="white"):
-        """Initialize the snake with a given color and starting position."""
-        self.segments = []
+    def __init__(self, renderer, color="white", positions=()):
+        """
+        Initialize the snake view with a given color and starting body positions,
+        drawing its segments with `renderer`.
+        """
+        self.renderer = renderer
+        self.segments = deque()
         self.snake_color = color
         self.is_glowing = False
-        self.create_snake()
-        self.head = self.segments[0]
-
-    def create_snake(self):
-        """Creates the initial snake with 3 segments."""
-        for position in STARTING_POSITIONS:
+        self.renderer.recolor(SNAKE_GROUP, color)
+        for position in positions:
             self.add_segment(position)
 
-    def add_segment(self, position):
-        """Adds a new segment at the specified position."""
-        segment = Turtle("square")
-        segment.color(self.snake_color)
-        segment.penup()
-        segment.goto(position)
-        self.segments.append(segment)
+    @property
+    def head(self):
+        return self.segments[0]
 
-    def extend(self):
-        """Extends the snake by one segment at the tail."""
-        self.add_segment(self.segments[-1].position())
-        if self.is_glowing:
-            self.set_glow()  # Ensure new segment glows too
+    @property
+    def color(self):
+        return "gold" if self.is_glowing else self.snake_color
 
-    def move(self):
-        """Moves the snake forward by shifting each segment to the previous one’s position."""
-        for i in range(len(self.segments) - 1, 0, -1):
-            new_x = self.segments[i - 1].xcor()
-            new_y = self.segments[i - 1].ycor()
-            self.segments[i].goto(new_x, new_y)
-        self.head.forward(MOVE_DISTANCE)
+    def new_segment(self, position):
+        return self.renderer.sprite("square", self.color, position, group=SNAKE_GROUP)
 
-    # === Direction Handlers ===
-    def up(self):
-        """Change direction to up (unless currently moving down)."""
-        if self.head.heading() != DOWN:
-            self.head.setheading(UP)
+    def add_segment(self, position):
+        """Adds a new segment at the tail end."""
+        self.segments.append(self.new_segment(position))
 
-    def down(self):
-        """Change direction to down (unless currently moving up)."""
-        if self.head.heading() != UP:
-            self.head.setheading(DOWN)
+    def extend(self, head_position):
+        """Grows the snake by one segment at the new head position."""
+        self.segments.appendleft(self.new_segment(head_position))
 
-    def left(self):
-        """Change direction to left (unless currently moving right)."""
-        if self.head.heading() != RIGHT:
-            self.head.setheading(LEFT)
+    def move(self, head_position):
+        """Moves the snake forward by recycling the tail segment as the new head."""
+        segment = self.segments.pop()
+        self.renderer.move(segment, head_position)
+        self.segments.appendleft(segment)
 
-    def right(self):
-        """Change direction to right (unless currently moving left)."""
-        if self.head.heading() != LEFT:
-            self.head.setheading(RIGHT)
+    def release(self):
+        """Return every segment to the renderer's pool, e.g. before the next game."""
+        while self.segments:
+            self.renderer.release(self.segments.pop())
 
     # === Visual Effects ===
     def set_glow(self):
         """Make the snake glow gold (activated during special mode)."""
         self.is_glowing = True
-        for segment in self.segments:
-            segment.color("gold")
+        self.renderer.recolor(SNAKE_GROUP, self.color)
 
     def reset_color(self):
         """Revert the snake’s color to the original after special mode ends."""
         self.is_glowing = False
-        for segment in self.segments:
-            segment.color(self.snake_color)
+        self.renderer.recolor(SNAKE_GROUP, self.color)
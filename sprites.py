@@ -0,0 +1,136 @@
+"""
+sprites.py – Entity and large-board views for SNAKE.EXE.
+
+Both draw with pooled sprites of the renderer (see render.py), which live as
+long as the screen, so games and replays reuse the same items rather than
+creating new ones.
+EntityLayer draws a FrenzyEngine's entities (see frenzy.py), touching only
+the cells the engine reports as changed each tick.
+WorldView draws a large-board game through a Camera (see world.py): only the
+body cells inside the camera's view have sprites, so off-screen segments cost
+nothing to draw however long the snake gets.
+"""
+
+from frenzy import EMPTY, FOOD, GOLD, SLOW, OBSTACLE
+from snake import SNAKE_GROUP
+
+# === Constants ===
+BORDER_LAYER = "world_border"
+
+
+# === EntityLayer Class ===
+class EntityLayer:
+    def __init__(self, renderer, engine, food_color):
+        """Draws every entity currently on the engine's board."""
+        self.renderer = renderer
+        self.engine = engine
+        self.styles = {
+            FOOD: ("triangle", food_color),
+            GOLD: ("circle", "gold"),
+            SLOW: ("turtle", "mediumseagreen"),
+            OBSTACLE: ("square", "dim gray")
+        }
+        self.sprites = {}  # cell -> sprite
+        self.apply((cell, kind) for cell, kind in enumerate(engine.entities.kinds) if kind != EMPTY)
+
+    def release(self):
+        """Return every sprite to the renderer's pool, e.g. when the game is over."""
+        for sprite in self.sprites.values():
+            self.renderer.release(sprite)
+        self.sprites.clear()
+
+    def apply(self, changes):
+        """Update the sprites of the (cell, kind) pairs that changed."""
+        for cell, kind in changes:
+            sprite = self.sprites.pop(cell, None)
+            if sprite is not None:
+                self.renderer.release(sprite)
+            if kind != EMPTY:
+                shape, color = self.styles[kind]
+                self.sprites[cell] = self.renderer.sprite(shape, color, self.engine.position(cell))
+
+
+# === WorldView Class ===
+class WorldView:
+    def __init__(self, renderer, engine, camera, snake_color, food_color):
+        """Draws the snake, food and board edges of `engine` as seen through `camera`."""
+        self.renderer = renderer
+        self.engine = engine
+        self.camera = camera
+        self.snake_color = snake_color
+        self.items = {}  # visible body cell -> segment sprite
+        self.food = renderer.sprite("triangle", food_color, (0, 0))
+        self.special_food = renderer.sprite("circle", "gold", (0, 0))
+        renderer.hide(self.special_food)
+        renderer.recolor(SNAKE_GROUP, snake_color)
+        camera.follow(engine.head)
+        self.redraw()
+
+    @property
+    def color(self):
+        return "gold" if self.engine.special_mode else self.snake_color
+
+    def redraw(self):
+        """Redraws the whole view, after the camera has moved."""
+        for item in self.items.values():
+            self.renderer.release(item)
+        self.items.clear()
+        occupied = self.engine.occupied
+        for cell in self.camera.cells():
+            if occupied[cell]:
+                self.add_segment(cell)
+        self.renderer.clear(BORDER_LAYER)
+        for start, end in self.camera.edges():
+            self.renderer.line(BORDER_LAYER, start, end, self.snake_color)
+        self.place_items()
+
+    def add_segment(self, cell):
+        self.items[cell] = self.renderer.sprite(
+            "square", self.color, self.camera.screen_position(cell), group=SNAKE_GROUP
+        )
+
+    def update(self):
+        """Follows the engine's latest tick: redraws on a camera move, else only the cells that changed."""
+        engine = self.engine
+        self.renderer.recolor(SNAKE_GROUP, self.color)
+        if self.camera.follow(engine.head):
+            self.redraw()
+            return
+        item = self.items.pop(engine.freed_cell, None)
+        if item is not None:
+            self.renderer.release(item)
+        if engine.head not in self.items and self.camera.visible(engine.head):
+            self.add_segment(engine.head)
+        self.place_items()
+
+    def place_items(self):
+        """
+        Shows the food, pinned to the nearest edge of the view while it is off screen
+        so it doubles as a compass, and the special food while it is in view.
+        """
+        engine = self.engine
+        if engine.food is None:
+            self.renderer.hide(self.food)
+        else:
+            self.renderer.move(self.food, self.camera.clamped_position(engine.food))
+        if engine.special_food is None or not self.camera.visible(engine.special_food):
+            self.renderer.hide(self.special_food)
+        else:
+            self.renderer.move(self.special_food, self.camera.screen_position(engine.special_food))
+
+    def show_special_food(self, shown):
+        """Flashes the special food on or off, if it is in view."""
+        cell = self.engine.special_food
+        if shown and cell is not None and self.camera.visible(cell):
+            self.renderer.show(self.special_food)
+        else:
+            self.renderer.hide(self.special_food)
+
+    def release(self):
+        """Return every sprite to the renderer's pool and erase the border, e.g. when the game is over."""
+        for item in self.items.values():
+            self.renderer.release(item)
+        self.items.clear()
+        for sprite in (self.food, self.special_food):
+            self.renderer.release(sprite)
+        self.renderer.clear(BORDER_LAYER)
@@ -0,0 +1,266 @@
+"""
+telemetry.py – Gameplay telemetry for SNAKE.EXE.
+
+An EventBus records typed gameplay events (games started and over with their
+death cause, food eaten, special food spawned / expired / eaten, special mode
+start and end, speed changes, menu selections) so we can see how games
+actually go. Emitting an event only stores a handful of integers into
+preallocated ring buffer arrays; no object is created and nothing is written
+to disk on the game loop. A background thread drains the ring buffer in
+batches every FLUSH_INTERVAL seconds into gzip-compressed JSONL files under
+telemetry/, starting a new file once the current one reaches MAX_FILE_BYTES
+and keeping only the newest MAX_FILES. If the game ever outruns the flusher
+by a whole buffer, the oldest events are overwritten and an events_dropped
+line records how many were lost.
+
+On by default; disable with `python main.py --no-telemetry` or
+SNAKE_TELEMETRY=0. See telemetry_report.py to aggregate the logs.
+"""
+
+import atexit
+import gzip
+import json
+import os
+import sys
+import threading
+import time
+import traceback
+from array import array
+
+from engine import (
+    FOOD_EATEN as ENGINE_FOOD_EATEN, SPECIAL_FOOD_SPAWNED as ENGINE_SPECIAL_FOOD_SPAWNED,
+    SPECIAL_FOOD_EATEN as ENGINE_SPECIAL_FOOD_EATEN, SPECIAL_FOOD_EXPIRED as ENGINE_SPECIAL_FOOD_EXPIRED,
+    SPECIAL_MODE_ENDED as ENGINE_SPECIAL_MODE_ENDED, HIT_WALL, HIT_SELF
+)
+from frenzy import POWER_UP_EATEN as ENGINE_POWER_UP_EATEN, HIT_OBSTACLE
+from replay import MODE_NAMES, DIFFICULTIES
+from themes import THEMES
+
+# === Constants ===
+TELEMETRY_ENV = "SNAKE_TELEMETRY"
+TELEMETRY_OFF_FLAG = "--no-telemetry"
+TELEMETRY_DIR = "telemetry"
+FILE_PREFIX = "events-"
+FILE_SUFFIX = ".jsonl.gz"
+CAPACITY = 1 << 16  # events held between flushes; a power of two
+FLUSH_INTERVAL = 1.0  # seconds
+MAX_FILE_BYTES = 1 << 20  # compressed size at which a new file is started
+MAX_FILES = 50
+
+# === Event Kinds ===
+GAME_STARTED = 1
+FOOD_EATEN = 2
+SPECIAL_FOOD_SPAWNED = 3
+SPECIAL_FOOD_EXPIRED = 4
+SPECIAL_MODE_STARTED = 5  # the special food was eaten
+SPECIAL_MODE_ENDED = 6
+POWER_UP_EATEN = 7
+SPEED_CHANGED = 8
+GAME_OVER = 9
+MENU_SELECTED = 10
+EVENTS_DROPPED = 11
+
+# === Field Values ===
+CAUSES = [HIT_WALL, HIT_SELF, HIT_OBSTACLE]
+THEME_NAMES = list(THEMES)
+MENU_FIELDS = {"difficulty": DIFFICULTIES, "theme": THEME_NAMES, "mode": MODE_NAMES}
+MENU_FIELD_NAMES = list(MENU_FIELDS)
+
+# Each kind's name and up to three integer fields: (field name, names the value indexes, or None)
+EVENTS = {
+    GAME_STARTED: ("game_started", (("mode", MODE_NAMES), ("difficulty", DIFFICULTIES), ("theme", THEME_NAMES))),
+    FOOD_EATEN: ("food_eaten", (("score", None), ("length", None))),
+    SPECIAL_FOOD_SPAWNED: ("special_food_spawned", ()),
+    SPECIAL_FOOD_EXPIRED: ("special_food_expired", ()),
+    SPECIAL_MODE_STARTED: ("special_mode_started", ()),
+    SPECIAL_MODE_ENDED: ("special_mode_ended", ()),
+    POWER_UP_EATEN: ("power_up_eaten", ()),
+    SPEED_CHANGED: ("speed_changed", (("tick_us", None),)),
+    GAME_OVER: ("game_over", (("cause", CAUSES), ("score", None), ("length", None))),
+    MENU_SELECTED: ("menu_selected", (("field", MENU_FIELD_NAMES), ("option", None))),
+    EVENTS_DROPPED: ("events_dropped", (("count", None),))
+}
+
+# Engine events (see engine.py and frenzy.py) and the kinds they are recorded as
+ENGINE_EVENTS = {
+    ENGINE_FOOD_EATEN: FOOD_EATEN,
+    ENGINE_SPECIAL_FOOD_SPAWNED: SPECIAL_FOOD_SPAWNED,
+    ENGINE_SPECIAL_FOOD_EXPIRED: SPECIAL_FOOD_EXPIRED,
+    ENGINE_SPECIAL_FOOD_EATEN: SPECIAL_MODE_STARTED,
+    ENGINE_SPECIAL_MODE_ENDED: SPECIAL_MODE_ENDED,
+    ENGINE_POWER_UP_EATEN: POWER_UP_EATEN,
+    HIT_WALL: GAME_OVER,
+    HIT_SELF: GAME_OVER,
+    HIT_OBSTACLE: GAME_OVER
+}
+
+
+def is_enabled():
+    """Whether telemetry is on: it is unless turned off on the command line or in the environment."""
+    return TELEMETRY_OFF_FLAG not in sys.argv[1:] and os.environ.get(TELEMETRY_ENV, "1") != "0"
+
+
+def to_json(record, session):
+    """The JSONL object of one drained (time, kind, game, tick, a, b, c) record."""
+    timestamp, kind, game, tick, *values = record
+    name, fields = EVENTS[kind]
+    line = {"t": round(timestamp, 3), "session": session, "game": game, "tick": tick, "event": name}
+    for (field, names), value in zip(fields, values):
+        line[field] = names[value] if names is not None else value
+    if kind == MENU_SELECTED:
+        line["option"] = MENU_FIELDS[line["field"]][line["option"]]  # Its names depend on the field
+    return line
+
+
+# === EventBus Class ===
+class EventBus:
+    def __init__(
+        self, directory=TELEMETRY_DIR, capacity=CAPACITY, flush_interval=FLUSH_INTERVAL,
+        max_file_bytes=MAX_FILE_BYTES, max_files=MAX_FILES
+    ):
+        """Preallocates the ring buffer and starts the flusher thread; pending events are flushed at exit."""
+        if capacity & (capacity - 1):
+            raise ValueError("capacity must be a power of two")
+        self.capacity = capacity
+        self.mask = capacity - 1
+        self.times = array("d", bytes(8 * capacity))
+        self.kinds = array("B", bytes(capacity))
+        self.games = array("q", bytes(8 * capacity))
+        self.ticks = array("q", bytes(8 * capacity))
+        self.a = array("q", bytes(8 * capacity))
+        self.b = array("q", bytes(8 * capacity))
+        self.c = array("q", bytes(8 * capacity))
+        self.head = 0  # events emitted; only the game thread writes it
+        self.tail = 0  # events drained; only the flusher writes it
+        self.clock = time.time
+        self.session = f"{int(time.time())}-{os.getpid()}"
+        self.game = 0
+        self.speed = None
+
+        self.directory = directory
+        self.max_file_bytes = max_file_bytes
+        self.max_files = max_files
+        self.file = None
+        self.raw = None
+        self.lock = threading.Lock()  # one drain at a time: the thread's, or flush()'s
+        self.stopping = threading.Event()
+        self.flush_interval = flush_interval
+        self.thread = threading.Thread(target=self.run, name="snake-telemetry", daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+
+    # === Emitting (game thread) ===
+    def emit(self, kind, tick=0, a=0, b=0, c=0):
+        """Records one event in the ring buffer."""
+        i = self.head & self.mask
+        self.times[i] = self.clock()
+        self.kinds[i] = kind
+        self.games[i] = self.game
+        self.ticks[i] = tick
+        self.a[i] = a
+        self.b[i] = b
+        self.c[i] = c
+        self.head += 1  # Publishes the slot, after it has been filled
+
+    def game_started(self, mode, difficulty, theme):
+        """Starts numbering the events of a new game."""
+        self.game += 1
+        self.speed = None
+        self.emit(
+            GAME_STARTED, 0, MODE_NAMES.index(mode), DIFFICULTIES.index(difficulty), THEME_NAMES.index(theme)
+        )
+
+    def menu_selected(self, field, option):
+        self.emit(MENU_SELECTED, 0, MENU_FIELD_NAMES.index(field), MENU_FIELDS[field].index(option))
+
+    def record_tick(self, engine, events):
+        """Records the engine events of one tick, and the tick length whenever it changes."""
+        if engine.speed != self.speed:
+            self.speed = engine.speed
+            self.emit(SPEED_CHANGED, engine.tick, round(engine.speed * 1_000_000))
+        for event in events:
+            kind = ENGINE_EVENTS.get(event)
+            if kind == GAME_OVER:
+                self.emit(GAME_OVER, engine.tick, CAUSES.index(event), engine.score, len(engine.body))
+            elif kind == FOOD_EATEN:
+                self.emit(FOOD_EATEN, engine.tick, engine.score, len(engine.body))
+            elif kind is not None:
+                self.emit(kind, engine.tick)
+
+    # === Draining (flusher thread) ===
+    def drain(self):
+        """
+        Takes every event emitted since the last drain, as (time, kind, game, tick, a, b, c)
+        tuples, plus the number lost because the buffer wrapped around before they were read.
+        """
+        head = self.head
+        start = max(self.tail, head - self.capacity)
+        dropped = start - self.tail
+        mask = self.mask
+        records = []
+        for sequence in range(start, head):
+            i = sequence & mask
+            records.append((
+                self.times[i], self.kinds[i], self.games[i], self.ticks[i], self.a[i], self.b[i], self.c[i]
+            ))
+        overwritten = self.head - self.capacity - start  # slots reused while they were being read
+        if overwritten > 0:
+            del records[:overwritten]
+            dropped += overwritten
+        self.tail = head
+        return records, dropped
+
+    def flush(self):
+        """Writes out every event emitted so far."""
+        with self.lock:
+            records, dropped = self.drain()
+            if not records and not dropped:
+                return
+            if dropped:
+                records.append((self.clock(), EVENTS_DROPPED, 0, 0, dropped, 0, 0))
+            data = "".join(json.dumps(to_json(record, self.session)) + "\n" for record in records)
+            self.write(data.encode())
+
+    def write(self, data):
+        """Appends to the current log file, starting a new one once it is big enough."""
+        if self.file is None:
+            os.makedirs(self.directory, exist_ok=True)
+            name = f"{FILE_PREFIX}{int(time.time() * 1000)}-{os.getpid()}{FILE_SUFFIX}"
+            self.raw = open(os.path.join(self.directory, name), "wb")
+            self.file = gzip.GzipFile(fileobj=self.raw, mode="wb")
+            self.prune()
+        self.file.write(data)
+        self.file.flush()  # A sync flush: everything so far can be decompressed even after a crash
+        if self.raw.tell() >= self.max_file_bytes:
+            self.close_file()
+
+    def close_file(self):
+        if self.file is not None:
+            self.file.close()
+            self.raw.close()
+            self.file = self.raw = None
+
+    def prune(self):
+        """Deletes the oldest log files beyond max_files."""
+        names = sorted(
+            name for name in os.listdir(self.directory)
+            if name.startswith(FILE_PREFIX) and name.endswith(FILE_SUFFIX)
+        )
+        for name in names[:-self.max_files]:
+            os.remove(os.path.join(self.directory, name))
+
+    def run(self):
+        while not self.stopping.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception:
+                traceback.print_exc(file=sys.stderr)
+
+    def close(self):
+        """Stops the flusher thread and writes out the remaining events."""
+        if self.stopping.is_set():
+            return
+        self.stopping.set()
+        self.thread.join()
+        self.flush()
+        self.close_file()
@@ -0,0 +1,157 @@
+"""
+telemetry_report.py – Aggregates SNAKE.EXE telemetry logs.
+
+Streams over the gzip-compressed JSONL files that telemetry.py writes, oldest
+first and one line at a time, so memory stays bounded however many logs there
+are: only the games still in progress are held, at most MAX_OPEN_GAMES of them
+(the oldest is counted as unfinished when another one starts). A file cut
+short by a crash is read up to where it stops.
+
+The report (JSON on stdout) has the number of events of each type and of
+dropped events, games by mode and difficulty, death causes, the score
+distribution, game lengths in ticks and seconds, how often special food gets
+eaten before it expires, and the menu options picked.
+
+Usage:
+    python telemetry_report.py
+    python telemetry_report.py telemetry/ --output report.json
+"""
+
+import argparse
+import gzip
+import json
+import math
+import os
+import zlib
+from collections import Counter, OrderedDict
+
+from telemetry import TELEMETRY_DIR, FILE_PREFIX, FILE_SUFFIX
+
+# === Constants ===
+MAX_OPEN_GAMES = 10_000
+
+
+# === Reading ===
+def log_files(directory):
+    """The telemetry log files in `directory`, oldest first."""
+    names = sorted(
+        name for name in os.listdir(directory)
+        if name.startswith(FILE_PREFIX) and name.endswith(FILE_SUFFIX)
+    )
+    return [os.path.join(directory, name) for name in names]
+
+
+def read_events(paths, report):
+    """Yields every event in `paths`, noting unreadable lines and truncated files in `report`."""
+    for path in paths:
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as file:
+                for line in file:
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        report.bad_lines += 1
+        except (EOFError, gzip.BadGzipFile, zlib.error):
+            report.truncated_files += 1
+
+
+# === Report Class ===
+class Report:
+    def __init__(self, max_open_games=MAX_OPEN_GAMES):
+        self.max_open_games = max_open_games
+        self.open_games = OrderedDict()  # (session, game) -> the game_started event
+        self.events = Counter()
+        self.dropped = 0
+        self.bad_lines = 0
+        self.truncated_files = 0
+        self.games = Counter()  # "mode/difficulty" -> games over
+        self.unfinished = 0
+        self.causes = Counter()
+        self.scores = Counter()  # log2 bucket -> games
+        self.score_total = 0
+        self.score_max = 0
+        self.ticks_total = 0
+        self.seconds_total = 0.0
+        self.menu = Counter()  # "field/option" -> selections
+
+    def add(self, event):
+        name = event.get("event")
+        self.events[name] += 1
+        key = (event.get("session"), event.get("game"))
+        if name == "game_started":
+            self.open_games[key] = event
+            if len(self.open_games) > self.max_open_games:
+                self.open_games.popitem(last=False)
+                self.unfinished += 1
+        elif name == "game_over":
+            started = self.open_games.pop(key, None)
+            self.add_game(started, event)
+        elif name == "events_dropped":
+            self.dropped += event["count"]
+        elif name == "menu_selected":
+            self.menu[f"{event['field']}/{event['option']}"] += 1
+
+    def add_game(self, started, over):
+        score = over["score"]
+        self.causes[over["cause"]] += 1
+        self.scores[0 if score == 0 else 1 << int(math.log2(score))] += 1
+        self.score_total += score
+        self.score_max = max(self.score_max, score)
+        self.ticks_total += over["tick"]
+        if started is None:  # Its start was in a log file that has been pruned
+            self.games["unknown"] += 1
+        else:
+            self.games[f"{started['mode']}/{started['difficulty']}"] += 1
+            self.seconds_total += over["t"] - started["t"]
+
+    def summary(self):
+        games = sum(self.games.values())
+        timed = games - self.games["unknown"]
+        spawned = self.events["special_food_spawned"]
+        return {
+            "events": dict(self.events.most_common()),
+            "events_dropped": self.dropped,
+            "bad_lines": self.bad_lines,
+            "truncated_files": self.truncated_files,
+            "games": games,
+            "unfinished_games": self.unfinished + len(self.open_games),
+            "games_by_mode": dict(self.games.most_common()),
+            "death_causes": dict(self.causes.most_common()),
+            "score_mean": round(self.score_total / games, 2) if games else None,
+            "score_max": self.score_max,
+            "score_histogram": {f"{bucket}+": self.scores[bucket] for bucket in sorted(self.scores)},
+            "ticks_mean": round(self.ticks_total / games, 1) if games else None,
+            "seconds_mean": round(self.seconds_total / timed, 2) if timed else None,
+            "special_food": {
+                "spawned": spawned,
+                "eaten": self.events["special_mode_started"],
+                "expired": self.events["special_food_expired"],
+                "eaten_rate": round(self.events["special_mode_started"] / spawned, 3) if spawned else None
+            },
+            "menu_selections": dict(self.menu.most_common())
+        }
+
+
+def aggregate(directory, max_open_games=MAX_OPEN_GAMES):
+    report = Report(max_open_games)
+    for event in read_events(log_files(directory), report):
+        report.add(event)
+    return report.summary()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Aggregate SNAKE.EXE telemetry logs.")
+    parser.add_argument("directory", nargs="?", default=TELEMETRY_DIR)
+    parser.add_argument("--max-open-games", type=int, default=MAX_OPEN_GAMES)
+    parser.add_argument("--output", help="also write the report to this file")
+    args = parser.parse_args()
+
+    text = json.dumps(aggregate(args.directory, args.max_open_games), indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import asyncio
+import struct
+
+import pytest
+
+from arena import ArenaEngine, player_color
+from arena_server import ArenaServer
+from grid import DIRECTIONS
+from protocol import (
+    LENGTH, STEER, STEER_FORMAT, WELCOME, decode, encode_tick, encode_welcome, frame, read_message
+)
+
+
+@pytest.mark.parametrize("payload", [STEER_FORMAT.pack(STEER, 4), b"", b"\x03", b"\x02\x00", b"\x01", b"\x09"])
+def test_decode_rejects_malformed_payloads(payload):
+    with pytest.raises(ValueError):
+        decode(payload)
+
+
+def serve_one_client(sent, server=None):
+    """Connects one client that sends `sent` (raw bytes) to a server; returns the server and loop errors."""
+    server = server or ArenaServer(board_size=11, seed=1)
+    errors = []
+
+    async def run():
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: errors.append(context))
+        listener = await asyncio.start_server(server.handle_client, "127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        assert (await read_message(reader))[0] == WELCOME
+        writer.write(sent)
+        await writer.drain()
+        while await asyncio.wait_for(reader.read(1024), 5):  # Until the server hangs up
+            pass
+        writer.close()
+        listener.close()
+        await listener.wait_closed()
+        return server
+
+    return asyncio.run(run()), errors
+
+
+@pytest.mark.parametrize("sent", [
+    frame(struct.pack("!BB", STEER, 200)),  # unknown direction code
+    frame(b"\x03"),  # truncated STEER
+    frame(b""),  # empty
+    frame(b"\x02\x00"),  # truncated TICK
+    frame(b"\x01"),  # truncated WELCOME
+    encode_tick(5, []),  # a well-formed message clients may not send
+    encode_welcome(1, 11, 0.1),
+    frame(STEER_FORMAT.pack(STEER, 0) + b"\x00"),  # STEER with trailing bytes
+    LENGTH.pack(1 << 31),  # oversized length prefix, never followed by a body
+])
+def test_server_drops_client_sending_malformed_frames(sent):
+    server, errors = serve_one_client(sent)
+    assert errors == []
+    assert server.clients == {}
+    assert server.engine.players == {}
+
+
+def test_server_applies_well_formed_steering_until_a_malformed_frame():
+    server = ArenaServer(board_size=11, seed=1)
+    steered = []
+    server.engine.steer = lambda player_id, heading: steered.append(heading)
+    sent = frame(STEER_FORMAT.pack(STEER, 1)) + frame(b"\x03") + frame(STEER_FORMAT.pack(STEER, 2))
+    _, errors = serve_one_client(sent, server)
+    assert errors == []
+    assert steered == [DIRECTIONS[1]]
+
+
+def test_every_player_gets_a_colour_of_their_own():
+    engine = ArenaEngine(21, seed=1)
+    for player_id in range(1, 61):
+        engine.join(player_id)
+    engine.leave(7)
+    engine.join(61)
+    colors = [player_color(player.color) for player in engine.players.values()]
+    assert len(set(colors)) == len(colors) == 60
@@ -0,0 +1,42 @@
+from autopilot import Autopilot, STALL_BOARDS
+from engine import GameEngine
+
+
+def play(engine, autopilot, max_ticks):
+    """Plays until the game ends or max_ticks; returns the longest run of ticks without eating."""
+    longest_fast = 0
+    last_meal = 0
+    score = engine.score
+    while not engine.game_over and engine.tick < max_ticks:
+        engine.step(autopilot(engine))
+        if engine.score != score:
+            score = engine.score
+            longest_fast = max(longest_fast, engine.tick - last_meal)
+            last_meal = engine.tick
+    return max(longest_fast, engine.tick - last_meal)
+
+
+def test_small_board_games_finish():
+    for seed in range(8):
+        engine = GameEngine("hard", seed=seed, board_size=13)
+        play(engine, Autopilot(), 100_000)
+        assert engine.game_over, f"seed {seed} never ended"
+        assert len(engine.body) > engine.grid.size // 2
+
+
+def test_standard_board_keeps_eating():
+    for seed in (0, 6, 11):
+        engine = GameEngine("hard", seed=seed)
+        autopilot = Autopilot()
+        longest_fast = play(engine, autopilot, 20_000)
+        assert longest_fast <= STALL_BOARDS * engine.grid.size, f"seed {seed} stopped eating"
+        assert engine.game_over or len(engine.body) > 300
+
+
+def test_stalled_after_going_without_food():
+    engine = GameEngine("hard", seed=0, board_size=9)
+    autopilot = Autopilot()
+    autopilot(engine)
+    assert not autopilot.stalled
+    autopilot.last_meal = -STALL_BOARDS * engine.grid.size - 1
+    assert autopilot.stalled
@@ -0,0 +1,23 @@
+from frenzy import FrenzyEngine, SLOW, SLOW_DOWN, POWER_UP_EATEN
+
+
+def eat_slow(engine):
+    head = engine.body[0]
+    engine.entities.place(head, SLOW)
+    events = []
+    engine.handle_pickups(events)
+    return events
+
+
+def test_slow_never_drops_below_the_overridden_start_speed():
+    engine = FrenzyEngine("hard", seed=3, speed=0.03)
+    engine.speed = 0.02
+    assert eat_slow(engine) == [POWER_UP_EATEN]
+    assert engine.speed == 0.03
+
+
+def test_slow_adds_its_slow_down():
+    engine = FrenzyEngine("easy", seed=3)
+    engine.speed = 0.05
+    eat_slow(engine)
+    assert engine.speed == 0.05 + SLOW_DOWN
@@ -0,0 +1,24 @@
+import json
+
+import pytest
+
+from highscores import HighScoreStore
+
+
+@pytest.mark.parametrize("content", ["[]", "null", "42", '"scores"', '{"boards": {"easy/arcade": 5}}'])
+def test_wrong_shape_store_is_set_aside(tmp_path, content):
+    path = tmp_path / "high_scores.json"
+    path.write_text(content)
+    store = HighScoreStore(str(path), legacy_path=str(tmp_path / "high_score.txt"))
+    assert store.boards == {}
+    assert (tmp_path / "high_scores.json.corrupt").read_text() == content
+    assert not path.exists()
+
+
+def test_saved_scores_load_back(tmp_path):
+    path = tmp_path / "high_scores.json"
+    legacy_path = str(tmp_path / "high_score.txt")
+    store = HighScoreStore(str(path), legacy_path=legacy_path)
+    assert store.record("easy", "arcade", 12, 15, timestamp=1.0) == 1
+    assert json.loads(path.read_text())["boards"]["easy/arcade"][0]["score"] == 12
+    assert HighScoreStore(str(path), legacy_path=legacy_path).top("easy", "arcade") == store.top("easy", "arcade")
@@ -0,0 +1,36 @@
+from engine import GameEngine
+from grid import UP, DOWN, LEFT, RIGHT
+from policies import RandomPolicy, safe_headings
+
+
+def test_tail_is_not_safe_while_growing():
+    engine = GameEngine("easy", seed=1, board_size=9)
+    grid = engine.grid
+    # A square loop: the head at (0, 0) heading up, the tail at (1, 0) just right of it
+    head = grid.cell((0, 0))
+    cells = [head, grid.neighbors[DOWN][head], grid.neighbors[RIGHT][grid.neighbors[DOWN][head]]]
+    cells.append(grid.neighbors[UP][cells[-1]])
+    engine.place_snake(cells, UP)
+    assert RIGHT in safe_headings(engine)
+    engine.grow_pending = 1
+    assert RIGHT not in safe_headings(engine)
+
+
+def test_random_policy_leaves_the_game_rng_alone():
+    engine = GameEngine("easy", seed=5, board_size=15)
+    policy = RandomPolicy()
+    state = engine.rng.getstate()
+    for _ in range(20):
+        policy(engine)
+    assert engine.rng.getstate() == state
+
+
+def test_random_policy_is_reproducible_per_seed():
+    games = []
+    for _ in range(2):
+        engine = GameEngine("easy", seed=7, board_size=15)
+        policy = RandomPolicy()
+        while not engine.game_over and engine.tick < 500:
+            engine.step(policy(engine))
+        games.append((engine.tick, list(engine.body)))
+    assert games[0] == games[1]
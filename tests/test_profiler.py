@@ -0,0 +1,14 @@
+from engine import STAGES
+from profiler import FrameProfiler
+
+NAMES = STAGES + ("tick", "render")
+
+
+def test_begin_end_records_one_sample_per_stage():
+    profiler = FrameProfiler(NAMES)
+    for _ in range(5):
+        profiler.begin("render")
+        profiler.end("render")
+    assert profiler.summary()["render"]["samples"] == 5
+    assert profiler.profile is None  # cProfile only runs when asked for
+
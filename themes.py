@@ -0,0 +1,46 @@
+"""
+themes.py – Colour themes for SNAKE.EXE.
+
+Each theme names the Tk colours of the background, snake, food and text.
+RGB holds the values of every colour name the game draws with, for renderers
+that don't go through Tk (see export.py).
+"""
+
+# === Theme Settings ===
+THEMES = {
+    "arcade": {
+        "bg": "light cyan",
+        "snake_color": "#FF69B4",
+        "food_color": "deepskyblue",
+        "text_color": "deeppink"
+    },
+    "kawaii": {
+        "bg": "mintcream",
+        "snake_color": "light pink",
+        "food_color": "violet",
+        "text_color": "plum"
+    }
+}
+
+# === Colour Values ===
+RGB = {
+    "black": (0, 0, 0),
+    "white": (255, 255, 255),
+    "light cyan": (224, 255, 255),
+    "mintcream": (245, 255, 250),
+    "deepskyblue": (0, 191, 255),
+    "deeppink": (255, 20, 147),
+    "light pink": (255, 182, 193),
+    "violet": (238, 130, 238),
+    "plum": (221, 160, 221),
+    "gold": (255, 215, 0),
+    "dim gray": (105, 105, 105),
+    "mediumseagreen": (60, 179, 113)
+}
+
+
+def rgb(color):
+    """The (r, g, b) value of a colour name from RGB or a "#rrggbb" string."""
+    if color.startswith("#"):
+        return tuple(int(color[i:i + 2], 16) for i in (1, 3, 5))
+    return RGB[color]
@@ -0,0 +1,190 @@
+"""
+vector_engine.py – Defines the VectorEngine class for SNAKE.EXE.
+
+Runs N independent boards in lockstep, with the whole state held in NumPy
+arrays: an occupancy grid and a ring buffer of body cells per board, plus
+heads, directions, food cells, timers and scores. One step(actions) call
+advances every board with array operations only, mirroring the rules of
+GameEngine (engine.py): movement and collisions, regular food, special food
+and special mode. Boards use NumPy's RNG, so they follow the same rules as a
+GameEngine with the same seed but not the same food positions.
+
+Requires NumPy (pip install numpy); the rest of the game does not.
+"""
+
+import numpy as np
+
+from engine import (
+    STARTING_POSITIONS, MOVE_DISTANCE, GRID_CELLS, DIFFICULTY_SPEEDS, MIN_SNAKE_SPEED,
+    SNAKE_SPEED_STEP, SPECIAL_FOOD_APPEARS_EVERY, SPECIAL_FOOD_LIFETIME, SPECIAL_MODE_DURATION,
+    FOOD_EATEN, SPECIAL_FOOD_EATEN, HIT_WALL, HIT_SELF
+)
+from grid import Grid, DIRECTIONS, DIRECTION_CODES, RIGHT
+
+# === Constants ===
+KEEP = -1  # action code that keeps the current heading; 0-3 index grid.DIRECTIONS
+SAMPLE_ROUNDS = 4  # rejection-sampling rounds before falling back to a full free-cell scan
+
+
+# === VectorEngine Class ===
+class VectorEngine:
+    def __init__(self, num_boards, difficulty="medium", seed=None, board_size=GRID_CELLS):
+        """Creates `num_boards` fresh games on board_size x board_size grids."""
+        self.n = num_boards
+        self.grid = Grid(board_size, board_size, MOVE_DISTANCE)
+        self.cells = self.grid.size
+        self.start_speed = DIFFICULTY_SPEEDS[difficulty]
+        self.rng = np.random.default_rng(seed)
+        self.neighbors = np.array(
+            [self.grid.neighbors[heading] for heading in DIRECTIONS], dtype=np.int32
+        )
+        self.start_body = np.array(
+            [self.grid.cell(position) for position in reversed(STARTING_POSITIONS)], dtype=np.int32
+        )  # tail first, as laid out in the ring buffer
+        self.boards = np.arange(num_boards)
+
+        n, cells = num_boards, self.cells
+        self.occupied = np.zeros((n, cells), dtype=bool)
+        self.body = np.zeros((n, cells), dtype=np.int32)  # ring buffer of body cells
+        self.head_index = np.zeros(n, dtype=np.int64)
+        self.length = np.zeros(n, dtype=np.int64)
+        self.heading = np.zeros(n, dtype=np.int8)
+        self.grow_pending = np.zeros(n, dtype=np.int64)
+        self.score = np.zeros(n, dtype=np.int64)
+        self.speed = np.zeros(n)
+        self.now = np.zeros(n)
+        self.tick = np.zeros(n, dtype=np.int64)
+        self.food = np.zeros(n, dtype=np.int64)
+        self.special_food = np.zeros(n, dtype=np.int64)
+        self.special_food_timer = np.zeros(n)
+        self.last_special_food_score = np.zeros(n, dtype=np.int64)
+        self.special_mode = np.zeros(n, dtype=bool)
+        self.special_mode_timer = np.zeros(n)
+        self.game_over = np.zeros(n, dtype=bool)
+        self.reset()
+
+    # === Setup ===
+    def reset(self, mask=None):
+        """Starts new games on the boards selected by the boolean `mask` (all boards if None)."""
+        boards = self.boards if mask is None else np.flatnonzero(mask)
+        if len(boards) == 0:
+            return
+        start = len(self.start_body)
+        self.occupied[boards] = False
+        self.occupied[boards[:, None], self.start_body] = True
+        self.body[boards, :start] = self.start_body
+        self.head_index[boards] = start - 1
+        self.length[boards] = start
+        self.heading[boards] = DIRECTION_CODES[RIGHT]
+        self.grow_pending[boards] = 0
+        self.score[boards] = 0
+        self.speed[boards] = self.start_speed
+        self.now[boards] = 0
+        self.tick[boards] = 0
+        self.special_food[boards] = -1
+        self.last_special_food_score[boards] = 0
+        self.special_mode[boards] = False
+        self.game_over[boards] = False
+        self.food[boards] = -1
+        self.food[boards] = self.sample_free_cells(boards)
+
+    def sample_free_cells(self, boards):
+        """One uniformly random empty cell (no body, no food) per board, or -1 if it is full."""
+        result = np.full(len(boards), -1, dtype=np.int64)
+        pending = np.arange(len(boards))
+        for _ in range(SAMPLE_ROUNDS):
+            if len(pending) == 0:
+                return result
+            candidates = self.rng.integers(0, self.cells, len(pending))
+            ok = self.is_free(boards[pending], candidates)
+            result[pending[ok]] = candidates[ok]
+            pending = pending[~ok]
+        if len(pending):
+            chosen = boards[pending]
+            free = ~self.occupied[chosen]
+            for items in (self.food, self.special_food):
+                has_item = items[chosen] >= 0
+                free[np.flatnonzero(has_item), items[chosen][has_item]] = False
+            # argmax of uniform noise over the free cells picks one of them uniformly
+            noise = np.where(free, self.rng.random(free.shape), -1.0)
+            picks = noise.argmax(axis=1)
+            result[pending] = np.where(free.any(axis=1), picks, -1)
+        return result
+
+    def is_free(self, boards, cells):
+        return (
+            ~self.occupied[boards, cells]
+            & (self.food[boards] != cells)
+            & (self.special_food[boards] != cells)
+        )
+
+    # === Tick ===
+    def step(self, actions, auto_reset=False):
+        """
+        Advances every live board by one tick. `actions` holds one direction code
+        (index into DIRECTIONS, or KEEP) per board. Returns a dict mapping event
+        names to boolean arrays of the boards where that event happened.
+        With auto_reset, boards that died are restarted after reporting.
+        """
+        alive = ~self.game_over
+        actions = np.asarray(actions)
+        turn = alive & (actions >= 0) & (actions != (self.heading + 2) % 4)
+        self.heading = np.where(turn, actions, self.heading).astype(np.int8)
+        self.tick += alive
+        self.now += np.where(alive, self.speed, 0.0)
+
+        # Movement and collisions
+        head = self.body[self.boards, self.head_index]
+        new_head = self.neighbors[self.heading, head]
+        hit_wall = alive & (new_head < 0)
+        target = np.where(hit_wall, 0, new_head)
+        tail = self.body[self.boards, (self.head_index - self.length + 1) % self.cells]
+        growing = self.grow_pending > 0
+        hit_self = alive & ~hit_wall & self.occupied[self.boards, target] & (growing | (target != tail))
+        self.game_over |= hit_wall | hit_self
+        moving = alive & ~self.game_over
+
+        shrink = np.flatnonzero(moving & ~growing)
+        self.occupied[shrink, tail[shrink]] = False
+        grew = moving & growing
+        self.grow_pending -= grew
+        self.length += grew
+        moved = np.flatnonzero(moving)
+        self.occupied[moved, target[moved]] = True
+        self.head_index[moved] = (self.head_index[moved] + 1) % self.cells
+        self.body[moved, self.head_index[moved]] = target[moved]
+
+        # Special food and special mode
+        ate_special = moving & (self.special_food == target)
+        self.special_mode |= ate_special
+        self.special_mode_timer = np.where(ate_special, self.now, self.special_mode_timer)
+        expired = moving & (self.special_food >= 0) & (self.now - self.special_food_timer > SPECIAL_FOOD_LIFETIME)
+        self.special_food[ate_special | expired] = -1
+        seconds_left = SPECIAL_MODE_DURATION - np.floor(self.now - self.special_mode_timer)
+        self.special_mode &= ~(moving & (seconds_left <= 0))
+
+        # Regular food
+        ate = moving & (self.food == target)
+        eaten = np.flatnonzero(ate)
+        self.score += np.where(ate, np.where(self.special_mode, 2, 1), 0)
+        self.grow_pending += ate
+        self.food[eaten] = -1
+        self.food[eaten] = self.sample_free_cells(eaten)
+        spawn = ate & (self.score % SPECIAL_FOOD_APPEARS_EVERY == 0) & (self.score != self.last_special_food_score)
+        spawned = np.flatnonzero(spawn)
+        self.special_food[spawned] = -1
+        self.special_food[spawned] = self.sample_free_cells(spawned)
+        self.special_food_timer[spawned] = self.now[spawned]
+        self.last_special_food_score[spawned] = self.score[spawned]
+        self.special_food[ate & (self.special_food >= 0) & (self.score % SPECIAL_FOOD_APPEARS_EVERY != 0)] = -1
+        self.speed = np.where(ate & (self.speed > MIN_SNAKE_SPEED), self.speed - SNAKE_SPEED_STEP, self.speed)
+
+        events = {
+            FOOD_EATEN: ate,
+            SPECIAL_FOOD_EATEN: ate_special,
+            HIT_WALL: hit_wall,
+            HIT_SELF: hit_self
+        }
+        if auto_reset:
+            self.reset(self.game_over)
+        return events
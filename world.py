@@ -0,0 +1,118 @@
+"""
+world.py – Defines the WorldEngine and Camera classes for SNAKE.EXE.
+
+"World" mode plays the classic rules on a board far bigger than the screen
+(WORLD_CELLS x WORLD_CELLS). The engine needs no changes for that: its
+occupancy grid and free-cell index are already O(1) per tick at any size.
+Drawing is the problem, so a Camera shows a screen-sized window of the board
+that follows the head in whole chunks. The view only redraws everything when
+the camera jumps to a new chunk, and then only the cells inside the window,
+so render cost is bounded by the viewport, not by the length of the snake.
+"""
+
+from engine import GameEngine, MOVE_DISTANCE
+
+# === Constants ===
+WORLD_CELLS = 501  # odd, so the board is centred on (0, 0) like the classic one
+CHUNK_CELLS = 8  # the camera moves in steps of this many cells
+CAMERA_MARGIN = 4  # cells from the edge of the view at which the camera moves on
+
+
+def view_cells(pixels, cell_size=MOVE_DISTANCE):
+    """The largest odd number of cells that fits on a screen `pixels` wide, with a small border."""
+    cells = (pixels - cell_size) // cell_size
+    return cells if cells % 2 else cells - 1
+
+
+# === WorldEngine Class ===
+class WorldEngine(GameEngine):
+    def __init__(self, difficulty="medium", seed=None, board_size=WORLD_CELLS, **rules):
+        """A classic game on a WORLD_CELLS x WORLD_CELLS board."""
+        super().__init__(difficulty, seed=seed, board_size=board_size, **rules)
+
+
+# === Camera Class ===
+class Camera:
+    def __init__(self, grid, view_cols, view_rows, chunk=CHUNK_CELLS, margin=CAMERA_MARGIN):
+        """
+        A view_cols x view_rows window onto `grid`, drawn centred on the screen.
+        col and row are the board coordinates of its bottom-left cell.
+        """
+        self.grid = grid
+        self.view_cols = min(view_cols, grid.cols)
+        self.view_rows = min(view_rows, grid.rows)
+        self.chunk = chunk
+        self.margin = margin
+        self.col = None
+        self.row = None
+
+    def follow(self, cell):
+        """
+        Keeps `cell` (the head) in view, jumping a whole chunk at a time once it
+        gets within `margin` cells of an edge. Returns True if the camera moved.
+        """
+        col, row = cell % self.grid.cols, cell // self.grid.cols
+        new_col = self.track(self.col, col, self.view_cols, self.grid.cols)
+        new_row = self.track(self.row, row, self.view_rows, self.grid.rows)
+        if (new_col, new_row) == (self.col, self.row):
+            return False
+        self.col, self.row = new_col, new_row
+        return True
+
+    def track(self, origin, coord, view, limit):
+        """The camera origin along one axis that keeps `coord` in view."""
+        if origin is not None and origin + self.margin <= coord < origin + view - self.margin:
+            return origin
+        target = round((coord - view // 2) / self.chunk) * self.chunk
+        return max(0, min(target, limit - view))
+
+    def visible(self, cell):
+        col, row = cell % self.grid.cols, cell // self.grid.cols
+        return (
+            self.col <= col < self.col + self.view_cols
+            and self.row <= row < self.row + self.view_rows
+        )
+
+    def cells(self):
+        """Every cell inside the view, row by row."""
+        cols = self.grid.cols
+        for row in range(self.row, self.row + self.view_rows):
+            start = row * cols + self.col
+            yield from range(start, start + self.view_cols)
+
+    def screen_position(self, cell):
+        """The pixel position on screen of a cell's centre."""
+        return self.to_screen(cell % self.grid.cols, cell // self.grid.cols)
+
+    def clamped_position(self, cell):
+        """The screen position of the visible cell nearest to `cell`, e.g. to point at off-screen food."""
+        col = max(self.col, min(cell % self.grid.cols, self.col + self.view_cols - 1))
+        row = max(self.row, min(cell // self.grid.cols, self.row + self.view_rows - 1))
+        return self.to_screen(col, row)
+
+    def to_screen(self, col, row):
+        size = self.grid.cell_size
+        return (
+            (col - self.col - self.view_cols // 2) * size,
+            (row - self.row - self.view_rows // 2) * size
+        )
+
+    def edges(self):
+        """
+        The board edges that fall inside the view, as (start, end) screen position pairs
+        half a cell outside the outermost cells.
+        """
+        half = self.grid.cell_size / 2
+        left, bottom = self.to_screen(self.col, self.row)
+        right, top = self.to_screen(self.col + self.view_cols - 1, self.row + self.view_rows - 1)
+        left, bottom, right, top = left - half, bottom - half, right + half, top + half
+        edges = []
+        if self.col == 0:
+            edges.append(((left, bottom), (left, top)))
+        if self.col + self.view_cols == self.grid.cols:
+            edges.append(((right, bottom), (right, top)))
+        if self.row == 0:
+            edges.append(((left, bottom), (right, bottom)))
+        if self.row + self.view_rows == self.grid.rows:
+            edges.append(((left, top), (right, top)))
+        return edges